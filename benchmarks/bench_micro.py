@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# bench_micro.py
+#
+# Compares the RAM footprint and per-call speed of qwiic_serlcd and the compact
+# qwiic_serlcd_micro build. Runs on MicroPython (copy both modules and this file
+# to the board) and on CPython. No display is needed - writes go to a driver
+# that discards them, and the settle delays are skipped, so only the time
+# spent in the library is measured.
+#
+# Usage: python benchmarks/bench_micro.py
+#
+#------------------------------------------------------------------------
+#
+# Written by SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+import gc
+import sys
+import time
+
+try:
+    _ticks = time.ticks_us
+    _diff = time.ticks_diff
+except AttributeError:
+    def _ticks():
+        return int(time.perf_counter() * 1000000)
+    def _diff(end, start):
+        return end - start
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+def _memUsed():
+    """!
+    @return **int** Bytes of memory in use by Python objects
+    """
+    gc.collect()
+    if hasattr(gc, "mem_alloc"): # MicroPython
+        return gc.mem_alloc()
+    return tracemalloc.get_traced_memory()[0]
+
+class NullDriver(object):
+    """!
+    qwiic_i2c style driver that discards every write.
+    """
+    def writeCommand(self, address, commandCode):
+        pass
+
+    def writeByte(self, address, commandCode, value):
+        pass
+
+    def writeBlock(self, address, commandCode, value):
+        pass
+
+class NullBus(object):
+    """!
+    machine.I2C style bus that discards every write.
+    """
+    def writeto(self, address, buf):
+        pass
+
+class _NoSleep(object):
+    @staticmethod
+    def sleep(seconds):
+        pass
+
+_RUNS = 200
+
+def _measure(function, args):
+    """!
+    @return **tuple** Time in microseconds and bytes allocated by _RUNS calls
+    """
+    function(*args)
+    before = _memUsed()
+    gc.disable()
+    start = _ticks()
+    for i in range(_RUNS):
+        function(*args)
+    elapsed = _diff(_ticks(), start)
+    gc.enable()
+    return elapsed, _memUsed() - before
+
+def _nothing(*args):
+    pass
+
+def timeCall(name, function, *args):
+    """!
+    Print the average time and memory allocated by one call, less the
+    overhead of the measurement loop. Allocations are only counted on
+    MicroPython, where they lead to garbage collection pauses - CPython
+    frees most objects straight away.
+    """
+    base_time, base_allocated = _measure(_nothing, args)
+    elapsed, allocated = _measure(function, args)
+    if hasattr(gc, "mem_alloc"):
+        allocated = "%6d bytes allocated/call" % (max(0, allocated - base_allocated) // _RUNS)
+    else:
+        allocated = ""
+    print(("    %-22s %8.1f us/call %s" % (name, (elapsed - base_time) / _RUNS, allocated)).rstrip())
+
+def benchModule(name, driver):
+    """!
+    Import a module, create a display object and time its common calls.
+    """
+    if name in sys.modules:
+        del sys.modules[name]
+    before = _memUsed()
+    module = __import__(name)
+    imported = _memUsed()
+    lcd = module.QwiicSerlcd(i2c_driver=driver)
+    created = _memUsed()
+
+    # skip the settle delays, only the library time is of interest here
+    if hasattr(module, "_sleep_ms"):
+        module._sleep_ms = lambda ms: None
+    else:
+        module.time = _NoSleep
+
+    print("%s with %s" % (name, type(driver).__name__))
+    print("    import:  %d bytes" % (imported - before))
+    print("    object:  %d bytes" % (created - imported))
+    timeCall("setCursor(5, 1)", lcd.setCursor, 5, 1)
+    timeCall("print('Hello World!')", lcd.print, "Hello World!")
+    timeCall("setFastBacklight()", lcd.setFastBacklight, 255, 128, 0)
+    timeCall("setBacklight()", lcd.setBacklight, 255, 128, 0)
+    timeCall("cursor()", lcd.cursor)
+
+if __name__ == '__main__':
+    if tracemalloc is not None:
+        tracemalloc.start()
+    benchModule("qwiic_serlcd", NullDriver())
+    benchModule("qwiic_serlcd_micro", NullDriver())
+    benchModule("qwiic_serlcd_micro", NullBus())
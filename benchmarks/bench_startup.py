@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# bench_startup.py
+#
+# Measures how long it takes a new Python process to import qwiic_serlcd and
+# create a QwiicSerlcd object, and how long the deferred I2C driver discovery
+# takes when the display is first used.
+#
+# Usage: python benchmarks/bench_startup.py [runs]
+#
+#------------------------------------------------------------------------
+#
+# Written by SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+
+import os
+import subprocess
+import sys
+
+# Run in a fresh interpreter each time, so nothing is already imported
+_PROBE = """
+import time
+t0 = time.perf_counter()
+import qwiic_serlcd
+t1 = time.perf_counter()
+lcd = qwiic_serlcd.QwiicSerlcd()
+t2 = time.perf_counter()
+try:
+    import qwiic_i2c
+    lcd._driver()
+    t3 = time.perf_counter()
+except ImportError:
+    t3 = None
+print(t1 - t0, t2 - t1, -1 if t3 is None else t3 - t2)
+"""
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+def runBenchmark(runs):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = root + os.pathsep + env.get("PYTHONPATH", "")
+
+    imports = []
+    constructs = []
+    discovers = []
+    for i in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", _PROBE], env=env)
+        t_import, t_construct, t_discover = [float(value) for value in output.split()]
+        imports.append(t_import)
+        constructs.append(t_construct)
+        if t_discover >= 0:
+            discovers.append(t_discover)
+
+    print("runs:                  %d" % runs)
+    print("import qwiic_serlcd:   %8.3f ms (median)" % (median(imports) * 1000))
+    print("QwiicSerlcd():         %8.3f ms (median)" % (median(constructs) * 1000))
+    if discovers:
+        print("first use (driver):    %8.3f ms (median)" % (median(discovers) * 1000))
+    else:
+        print("first use (driver):    qwiic_i2c not installed, not measured")
+
+if __name__ == '__main__':
+    runBenchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# ex18_qwiic_serlcd_resilient_mode.py
+#
+# This example shows how to use resilient mode. Failed writes are retried,
+# and if the display resets (for example after a brown-out) the text, custom
+# characters, mode flags and backlight are restored automatically.
+#
+#------------------------------------------------------------------------
+#
+# Written by SparkFun Electronics, August 2020
+#
+# Ported from Arduino Library code with many contributions from
+# Gaston Williams - August 29, 2018
+# 
+# This python library supports the SparkFun Electroncis qwiic 
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers. 
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2020 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy 
+# of this software and associated documentation files (the "Software"), to deal 
+# in the Software without restriction, including without limitation the rights 
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell 
+# copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all 
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+# SOFTWARE.
+#==================================================================================
+# Example 18
+#
+
+import qwiic_serlcd
+import time
+import sys
+
+def runExample():
+
+	print("\nSparkFun Qwiic SerLCD   Example 18\n")
+	print("\nType CTRL+C to end.\n")
+	myLCD = qwiic_serlcd.QwiicSerlcd()
+
+	if myLCD.connected == False:
+		print("The Qwiic SerLCD device isn't connected to the system. Please check your connection", \
+			file=sys.stderr)
+		return
+
+	# retry failed writes up to 5 times, waiting 10ms, 20ms, 40ms... (at most 0.5s) in between
+	myLCD.enableResilientMode(retries=5, retry_delay=0.01, max_retry_delay=0.5)
+
+	myLCD.setFastBacklight(255, 255, 255) # bright white
+	myLCD.setContrast(5) # set contrast. Lower to 0 for higher contrast.
+	myLCD.begin() # call this for default settings (no
+	time.sleep(1) # give a sec for system messages to complete
+
+	myLCD.print("Unplug me and")
+	myLCD.setCursor(0,1)
+	myLCD.print("plug me back in!")
+
+	counter = 0
+	while True:
+		myLCD.setCursor(17,1)
+		if myLCD.print("%03d" % (counter % 1000)) == False:
+			print("Display not responding...")
+		counter = counter + 1
+		time.sleep(1)
+
+if __name__ == '__main__':
+	try:
+		runExample()
+	except (KeyboardInterrupt, SystemExit) as exErr:
+		print("\nEnding Example 18")
+		sys.exit(0)
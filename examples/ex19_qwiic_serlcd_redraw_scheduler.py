@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# ex19_qwiic_serlcd_redraw_scheduler.py
+#
+# This example shows how to use the redraw scheduler. A fast changing readout
+# and slow status text share the display, and the readout always gets the bus
+# time it needs.
+#
+#------------------------------------------------------------------------
+#
+# Written by SparkFun Electronics, August 2020
+#
+# Ported from Arduino Library code with many contributions from
+# Gaston Williams - August 29, 2018
+# 
+# This python library supports the SparkFun Electroncis qwiic 
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers. 
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2020 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy 
+# of this software and associated documentation files (the "Software"), to deal 
+# in the Software without restriction, including without limitation the rights 
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell 
+# copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all 
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+# SOFTWARE.
+#==================================================================================
+# Example 19
+#
+
+import qwiic_serlcd
+import qwiic_serlcd_scheduler
+import random
+import time
+import sys
+
+def runExample():
+
+	print("\nSparkFun Qwiic SerLCD   Example 19\n")
+	print("\nType CTRL+C to end.\n")
+	myLCD = qwiic_serlcd.QwiicSerlcd()
+
+	if myLCD.connected == False:
+		print("The Qwiic SerLCD device isn't connected to the system. Please check your connection", \
+			file=sys.stderr)
+		return
+
+	myLCD.setBacklight(255, 255, 255) # bright white
+	myLCD.setContrast(5) # set contrast. Lower to 0 for higher contrast.
+	myLCD.begin() # call this for default settings (no
+	time.sleep(1) # give a sec for system messages to complete
+
+	# 50ms of bus time for each redraw cycle
+	scheduler = qwiic_serlcd_scheduler.RedrawScheduler(myLCD, cycle_time=0.05)
+
+	# the readout has the highest priority, the status is redrawn at most once a second
+	readout = scheduler.addRegion(0, 0, 16, priority=10)
+	status = scheduler.addRegion(0, 1, 16, priority=1, max_rate=1)
+
+	counter = 0
+	while True:
+		readout.update("Value: %7.2f" % (random.random() * 1000))
+		status.update("Uptime: %ds" % (counter // 10))
+		scheduler.service()
+		counter = counter + 1
+		time.sleep(0.1)
+
+if __name__ == '__main__':
+	try:
+		runExample()
+	except (KeyboardInterrupt, SystemExit) as exErr:
+		print("\nEnding Example 19")
+		sys.exit(0)
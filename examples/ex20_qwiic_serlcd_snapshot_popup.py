@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# ex20_qwiic_serlcd_snapshot_popup.py
+#
+# This example shows how to show a pop-up message over the current screen
+# and bring the screen back afterwards with snapshot() and restoreSnapshot().
+# Only the characters covered by the pop-up are sent again.
+#
+#------------------------------------------------------------------------
+#
+# Written by SparkFun Electronics, August 2020
+#
+# Ported from Arduino Library code with many contributions from
+# Gaston Williams - August 29, 2018
+# 
+# This python library supports the SparkFun Electroncis qwiic 
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers. 
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2020 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy 
+# of this software and associated documentation files (the "Software"), to deal 
+# in the Software without restriction, including without limitation the rights 
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell 
+# copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all 
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+# SOFTWARE.
+#==================================================================================
+# Example 20
+#
+
+import qwiic_serlcd
+import time
+import sys
+
+def runExample():
+
+	print("\nSparkFun Qwiic SerLCD   Example 20\n")
+	print("\nType CTRL+C to end.\n")
+	myLCD = qwiic_serlcd.QwiicSerlcd()
+
+	if myLCD.connected == False:
+		print("The Qwiic SerLCD device isn't connected to the system. Please check your connection", \
+			file=sys.stderr)
+		return
+
+	myLCD.setFastBacklight(255, 255, 255) # bright white
+	myLCD.setContrast(5) # set contrast. Lower to 0 for higher contrast.
+	myLCD.begin() # call this for default settings (no
+	time.sleep(1) # give a sec for system messages to complete
+
+	myLCD.print("Temp:    21.5C")
+	myLCD.setCursor(0,1)
+	myLCD.print("Humidity: 40%")
+
+	while True:
+		time.sleep(3)
+
+		# remember the screen, then show the pop-up over part of it
+		screen = myLCD.snapshot()
+		myLCD.setFastBacklight(255, 0, 0) # red
+		myLCD.setCursor(3,1)
+		myLCD.print("! ALERT !")
+		time.sleep(2)
+
+		# only the 9 covered characters and the backlight are sent again
+		myLCD.restoreSnapshot(screen)
+
+if __name__ == '__main__':
+	try:
+		runExample()
+	except (KeyboardInterrupt, SystemExit) as exErr:
+		print("\nEnding Example 20")
+		sys.exit(0)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# ex21_qwiic_serlcd_pages.py
+#
+# This example shows how to rotate through several pages of information.
+# Each page is kept off-screen, and showing a page only sends the characters
+# that differ from the screen.
+#
+#------------------------------------------------------------------------
+#
+# Written by SparkFun Electronics, August 2020
+#
+# Ported from Arduino Library code with many contributions from
+# Gaston Williams - August 29, 2018
+# 
+# This python library supports the SparkFun Electroncis qwiic 
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers. 
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2020 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy 
+# of this software and associated documentation files (the "Software"), to deal 
+# in the Software without restriction, including without limitation the rights 
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell 
+# copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all 
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+# SOFTWARE.
+#==================================================================================
+# Example 21
+#
+
+import qwiic_serlcd
+import qwiic_serlcd_pages
+import random
+import time
+import sys
+
+def runExample():
+
+	print("\nSparkFun Qwiic SerLCD   Example 21\n")
+	print("\nType CTRL+C to end.\n")
+	myLCD = qwiic_serlcd.QwiicSerlcd()
+
+	if myLCD.connected == False:
+		print("The Qwiic SerLCD device isn't connected to the system. Please check your connection", \
+			file=sys.stderr)
+		return
+
+	myLCD.setFastBacklight(255, 255, 255) # bright white
+	myLCD.setContrast(5) # set contrast. Lower to 0 for higher contrast.
+	myLCD.begin() # call this for default settings (no
+	time.sleep(1) # give a sec for system messages to complete
+
+	pages = qwiic_serlcd_pages.PageManager(myLCD)
+
+	weather = pages.addPage()
+	weather.print("Temp:")
+	weather.setCursor(0,1)
+	weather.print("Humidity:")
+
+	power = pages.addPage()
+	power.createChar(0, [0x02, 0x04, 0x08, 0x1F, 0x02, 0x04, 0x08, 0x00]) # lightning bolt
+	power.writeChar(0)
+	power.print(" Volts:")
+	power.setCursor(0,1)
+	power.print("  Amps:")
+
+	while True:
+		# pages can be updated at any time, shown or not
+		weather.setCursor(10,0)
+		weather.print("%5.1f°C" % (random.random() * 30))
+		weather.setCursor(10,1)
+		weather.print("%3d%%" % random.randint(20, 90))
+		power.setCursor(8,0)
+		power.print("%5.2f" % (11.5 + random.random()))
+		power.setCursor(8,1)
+		power.print("%5.2f" % random.random())
+
+		pages.next()
+		time.sleep(2)
+
+if __name__ == '__main__':
+	try:
+		runExample()
+	except (KeyboardInterrupt, SystemExit) as exErr:
+		print("\nEnding Example 21")
+		sys.exit(0)
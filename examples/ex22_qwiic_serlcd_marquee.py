@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# ex22_qwiic_serlcd_marquee.py
+#
+# This example shows how to scroll text that is longer than the display.
+# Text that fits in the display memory is loaded once and scrolled by the display.
+#
+#------------------------------------------------------------------------
+#
+# Written by SparkFun Electronics, August 2020
+#
+# Ported from Arduino Library code with many contributions from
+# Gaston Williams - August 29, 2018
+# 
+# This python library supports the SparkFun Electroncis qwiic 
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers. 
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2020 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy 
+# of this software and associated documentation files (the "Software"), to deal 
+# in the Software without restriction, including without limitation the rights 
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell 
+# copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all 
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+# SOFTWARE.
+#==================================================================================
+# Example 22
+#
+
+import qwiic_serlcd
+import qwiic_serlcd_marquee
+import time
+import sys
+
+def runExample():
+
+	print("\nSparkFun Qwiic SerLCD   Example 22\n")
+	print("\nType CTRL+C to end.\n")
+	myLCD = qwiic_serlcd.QwiicSerlcd()
+
+	if myLCD.connected == False:
+		print("The Qwiic SerLCD device isn't connected to the system. Please check your connection", \
+			file=sys.stderr)
+		return
+
+	myLCD.setFastBacklight(255, 255, 255) # bright white
+	myLCD.setContrast(5) # set contrast. Lower to 0 for higher contrast.
+	myLCD.begin() # call this for default settings (no
+	time.sleep(1) # give a sec for system messages to complete
+
+	# 30 characters fit in the display memory, so the display scrolls it by itself
+	marquee = qwiic_serlcd_marquee.Marquee(myLCD, "SparkFun Qwiic SerLCD marquee!", row=0, rate=4)
+
+	start = time.time()
+	while time.time() - start < 20:
+		marquee.service()
+		time.sleep(0.02)
+
+	# longer text is scrolled by rewriting only the marquee row
+	myLCD.clearScreen()
+	myLCD.setCursor(0,0)
+	myLCD.print("Headlines:")
+	marquee = qwiic_serlcd_marquee.Marquee(myLCD, \
+		"Text longer than the forty characters of display memory is scrolled in software", row=1, rate=4)
+
+	while True:
+		marquee.service()
+		time.sleep(0.02)
+
+if __name__ == '__main__':
+	try:
+		runExample()
+	except (KeyboardInterrupt, SystemExit) as exErr:
+		print("\nEnding Example 22")
+		sys.exit(0)
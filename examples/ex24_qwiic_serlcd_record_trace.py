@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# ex24_qwiic_serlcd_record_trace.py
+#
+# This example shows how to record everything sent to the display to a trace file.
+# Replay the trace to see where the time went:
+#     python qwiic_serlcd_trace.py serlcd.trace
+#
+#------------------------------------------------------------------------
+#
+# Written by SparkFun Electronics, August 2020
+#
+# Ported from Arduino Library code with many contributions from
+# Gaston Williams - August 29, 2018
+# 
+# This python library supports the SparkFun Electroncis qwiic 
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers. 
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2020 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy 
+# of this software and associated documentation files (the "Software"), to deal 
+# in the Software without restriction, including without limitation the rights 
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell 
+# copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all 
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+# SOFTWARE.
+#==================================================================================
+# Example 24
+#
+
+import qwiic_i2c
+import qwiic_serlcd
+import qwiic_serlcd_trace
+import time
+import sys
+
+def runExample():
+
+	print("\nSparkFun Qwiic SerLCD   Example 24\n")
+	print("\nType CTRL+C to end.\n")
+
+	# record the I2C writes of the display to serlcd.trace
+	recorder = qwiic_serlcd_trace.RecordingDriver(qwiic_i2c.getI2CDriver(), "serlcd.trace")
+	myLCD = qwiic_serlcd.QwiicSerlcd(i2c_driver=recorder)
+
+	if myLCD.connected == False:
+		print("The Qwiic SerLCD device isn't connected to the system. Please check your connection", \
+			file=sys.stderr)
+		return
+
+	myLCD.setFastBacklight(255, 255, 255) # bright white
+	myLCD.setContrast(5) # set contrast. Lower to 0 for higher contrast.
+	myLCD.clearScreen()
+	myLCD.print("Recording...")
+
+	try:
+		for counter in range(50):
+			myLCD.setCursor(0,1)
+			myLCD.print(str(counter))
+			time.sleep(0.1)
+	finally:
+		recorder.close()
+
+	print("Trace saved. Replay it with: python qwiic_serlcd_trace.py serlcd.trace")
+
+if __name__ == '__main__':
+	try:
+		runExample()
+	except (KeyboardInterrupt, SystemExit) as exErr:
+		print("\nEnding Example 24")
+		sys.exit(0)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+#-----------------------------------------------------------------------------
+# ex26_qwiic_serlcd_daemon_client.py
+#
+# This example shows how to write to a display shared with other programs.
+# Start the display daemon first, it owns the display:
+#     python qwiic_serlcd_daemon.py
+# then run this example, as many copies as you like, each with its own row:
+#     python ex26_qwiic_serlcd_daemon_client.py 1
+#
+#------------------------------------------------------------------------
+#
+# Written by SparkFun Electronics, August 2020
+#
+# Ported from Arduino Library code with many contributions from
+# Gaston Williams - August 29, 2018
+# 
+# This python library supports the SparkFun Electroncis qwiic 
+# qwiic sensor/board ecosystem on a Raspberry Pi (and compatable) single
+# board computers. 
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#
+#==================================================================================
+# Copyright (c) 2020 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy 
+# of this software and associated documentation files (the "Software"), to deal 
+# in the Software without restriction, including without limitation the rights 
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell 
+# copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all 
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE 
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER 
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE 
+# SOFTWARE.
+#==================================================================================
+# Example 26
+#
+
+import qwiic_serlcd_daemon
+import os
+import time
+import sys
+
+def runExample():
+
+	print("\nSparkFun Qwiic SerLCD   Example 26\n")
+	print("\nType CTRL+C to end.\n")
+
+	row = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+
+	# updates are sent to the daemon, which merges them with those of other programs
+	client = qwiic_serlcd_daemon.DisplayClient()
+
+	counter = 0
+	while True:
+		if not client.region(0, row, "pid %d: %d" % (os.getpid(), counter)):
+			print("The display daemon isn't running", file=sys.stderr)
+			return
+		counter = counter + 1
+		time.sleep(0.1)
+
+if __name__ == '__main__':
+	try:
+		runExample()
+	except (KeyboardInterrupt, SystemExit) as exErr:
+		print("\nEnding Example 26")
+		sys.exit(0)
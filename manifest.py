@@ -0,0 +1,10 @@
+# MicroPython manifest for freezing the compact qwiic_serlcd_micro build into
+# firmware, so its bytecode runs from flash instead of taking RAM. Include it
+# from a board manifest:
+#
+#   include("path/to/qwiic_serlcd_py/manifest.py")
+#
+# qwiic_serlcd_micro also works with a machine.I2C object, so qwiic_i2c only
+# needs to be frozen (or installed) when it is used as the I2C driver.
+
+module("qwiic_serlcd_micro.py", opt=3)
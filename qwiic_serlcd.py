@@ -68,10 +68,20 @@ New to qwiic? Take a look at the entire [SparkFun qwiic ecosystem](https://www.s
 
 """
 #-----------------------------------------------------------------------------
-import struct
 import time
 
-import qwiic_i2c
+# Only modules needed by every program are imported here. qwiic_i2c is imported
+# when the display is first used, and threading when thread-safe mode is enabled
+# (not every MicroPython or CircuitPython port has it), so importing this module
+# and creating a QwiicSerlcd object is fast and doesn't touch the I2C bus.
+try:
+    import _thread
+except ImportError:
+    _thread = None
+try:
+    from weakref import WeakKeyDictionary as _WeakKeyDictionary
+except ImportError: # MicroPython has no weak references
+    _WeakKeyDictionary = dict
 
 # Define the device name and I2C addresses. These are set in the class defintion
 # as class variables, making them avilable without having to create a class instance.
@@ -134,6 +144,180 @@ LCD_CURSORMOVE = 0x00
 LCD_MOVERIGHT = 0x04
 LCD_MOVELEFT = 0x00
 
+# OpenLCD setting command offsets for custom characters (location 0-7 is added)
+CREATE_CHAR_COMMAND = 27 # 27-34, command to create custom character 0-7
+WRITE_CHAR_COMMAND = 35  # 35-42, command to write custom character 0-7
+
+# DDRAM address of the first column of each row
+_ROW_OFFSETS = [0x00, 0x40, 0x14, 0x54]
+
+# The largest number of bytes sent in a single I2C write (SMBus block limit)
+_MAX_BLOCK_SIZE = 32
+
+# Lock file of the cross-process bus lock - see QwiicSerlcd.enableBusLock()
+_BUS_LOCK_FILE = "/tmp/qwiic_i2c.lock"
+
+# Verification mode - see QwiicSerlcd.enableVerification(). After this many
+# good checks in a row the pacing is made faster again, and a display that
+# doesn't respond is checked this many more times before giving up.
+_VERIFY_RELAX_AFTER = 16
+_VERIFY_RETRIES = 5
+
+# Timing profile file, written by qwiic_serlcd_calibrate - see QwiicSerlcd.loadTimingProfile().
+# The environment variable overrides the file in the home directory.
+_TIMING_PROFILE_FILE = ".qwiic_serlcd_timing.json"
+_TIMING_PROFILE_VARIABLE = "QWIIC_SERLCD_TIMING"
+
+# Settings cache file - see QwiicSerlcd.enableSettingsCache(). The environment
+# variable overrides the file in the home directory. EEPROM writes are spaced
+# by at least the interval, in seconds.
+_SETTINGS_FILE = ".qwiic_serlcd_settings.json"
+_SETTINGS_VARIABLE = "QWIIC_SERLCD_SETTINGS"
+_EEPROM_INTERVAL = 0.5
+
+# Checkpoint file - see QwiicSerlcd.saveCheckpoint(). The environment variable
+# overrides the file in the home directory.
+_CHECKPOINT_FILE = ".qwiic_serlcd_checkpoint.json"
+_CHECKPOINT_VARIABLE = "QWIIC_SERLCD_CHECKPOINT"
+
+# Characters in the HD44780 character ROM (the common A00 version) that are not
+# at their ASCII position. The ROM has a yen sign and arrows where ASCII has the
+# backslash and tilde.
+_ROM_CHARACTERS = {
+    "\u00a5": 0x5C, # yen sign
+    "\u2192": 0x7E, # right arrow
+    "\u2190": 0x7F, # left arrow
+    "\u3002": 0xA1, # ideographic full stop
+    "\u300c": 0xA2, # left corner bracket
+    "\u300d": 0xA3, # right corner bracket
+    "\u3001": 0xA4, # ideographic comma
+    "\u00b7": 0xA5, # middle dot
+    "\u30fb": 0xA5, # katakana middle dot
+    "\u00b0": 0xDF, # degree sign
+    "\u03b1": 0xE0, # alpha
+    "\u00e4": 0xE1, # a umlaut
+    "\u03b2": 0xE2, # beta
+    "\u03b5": 0xE3, # epsilon
+    "\u00b5": 0xE4, # micro sign
+    "\u03bc": 0xE4, # mu
+    "\u03c3": 0xE5, # sigma
+    "\u03c1": 0xE6, # rho
+    "\u221a": 0xE8, # square root
+    "\u00a2": 0xEC, # cent sign
+    "\u00f1": 0xEE, # n tilde
+    "\u00f6": 0xEF, # o umlaut
+    "\u03b8": 0xF2, # theta
+    "\u221e": 0xF3, # infinity
+    "\u03a9": 0xF4, # omega
+    "\u2126": 0xF4, # ohm sign
+    "\u00fc": 0xF5, # u umlaut
+    "\u03a3": 0xF6, # capital sigma
+    "\u03c0": 0xF7, # pi
+    "\u00f7": 0xFD, # division sign
+    "\u2588": 0xFF, # full block
+}
+
+# 5x8 custom character bitmaps for common characters missing from the ROM. These
+# are loaded into a free custom character location the first time they are printed.
+_GLYPH_FONT = {
+    "\\": [0x00, 0x10, 0x08, 0x04, 0x02, 0x01, 0x00, 0x00],
+    "|": [0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x00],
+    "~": [0x00, 0x00, 0x08, 0x15, 0x02, 0x00, 0x00, 0x00],
+    "\u00e0": [0x08, 0x04, 0x0E, 0x01, 0x0F, 0x11, 0x0F, 0x00], # a grave
+    "\u00e2": [0x04, 0x0A, 0x0E, 0x01, 0x0F, 0x11, 0x0F, 0x00], # a circumflex
+    "\u00e7": [0x00, 0x0E, 0x10, 0x10, 0x11, 0x0E, 0x04, 0x08], # c cedilla
+    "\u00e8": [0x08, 0x04, 0x0E, 0x11, 0x1F, 0x10, 0x0E, 0x00], # e grave
+    "\u00e9": [0x02, 0x04, 0x0E, 0x11, 0x1F, 0x10, 0x0E, 0x00], # e acute
+    "\u00ea": [0x04, 0x0A, 0x0E, 0x11, 0x1F, 0x10, 0x0E, 0x00], # e circumflex
+    "\u00ee": [0x04, 0x0A, 0x00, 0x0C, 0x04, 0x04, 0x0E, 0x00], # i circumflex
+    "\u00f4": [0x04, 0x0A, 0x00, 0x0E, 0x11, 0x11, 0x0E, 0x00], # o circumflex
+    "\u00f9": [0x08, 0x04, 0x11, 0x11, 0x11, 0x13, 0x0D, 0x00], # u grave
+    "\u00fb": [0x04, 0x0A, 0x00, 0x11, 0x11, 0x13, 0x0D, 0x00], # u circumflex
+    "\u00c4": [0x0A, 0x00, 0x0E, 0x11, 0x1F, 0x11, 0x11, 0x00], # A umlaut
+    "\u00d6": [0x0A, 0x00, 0x0E, 0x11, 0x11, 0x11, 0x0E, 0x00], # O umlaut
+    "\u00dc": [0x0A, 0x00, 0x11, 0x11, 0x11, 0x11, 0x0E, 0x00], # U umlaut
+    "\u00df": [0x0C, 0x12, 0x12, 0x16, 0x11, 0x11, 0x16, 0x10], # sharp s
+    "\u00a3": [0x06, 0x09, 0x08, 0x1C, 0x08, 0x09, 0x16, 0x00], # pound sign
+    "\u20ac": [0x06, 0x09, 0x1C, 0x08, 0x1C, 0x09, 0x06, 0x00], # euro sign
+}
+
+# Character code shown for characters that can't be displayed
+_REPLACEMENT_CODE = 0x3F # ?
+
+# Unchanged characters between two changed ones are rewritten, rather than moving
+# the cursor, when the gap is at most this long (a cursor move is two bytes)
+_MAX_DIFF_GAP = 2
+
+def _buildCharmap():
+    """!
+    Build the translation table from Unicode code points to the display
+    character codes in the ROM.
+
+    @return **dict** Maps code points to character codes
+    """
+    table = {}
+    for code in range(0x20): # control characters are sent unchanged, as print() always has
+        table[code] = code
+    for code in range(0x20, 0x7E):
+        table[code] = code
+    del table[0x5C] # yen in the ROM, the backslash comes from _GLYPH_FONT
+    del table[0x7C] # the OpenLCD setting command, can't be printed
+    for char in _ROM_CHARACTERS:
+        table[ord(char)] = _ROM_CHARACTERS[char]
+    for code in range(0xA1, 0xE0): # half-width katakana, in Unicode order in the ROM
+        table[0xFF61 + code - 0xA1] = code
+    return table
+
+_ROM_CHARMAP = _buildCharmap()
+
+# str.translate() isn't available on MicroPython, which encodes one character at a time
+_HAS_TRANSLATE = hasattr("", "translate")
+
+class _Charmap(dict):
+    """!
+    Translation table from Unicode code points to display character codes, for
+    use with str.translate(). Characters missing from the table are looked up
+    by the owner of the table (a display or a page), which may give them a
+    custom character and keep the result in the table. Tables without an owner
+    show them as '?'.
+    """
+    def __init__(self):
+        dict.__init__(self, _ROM_CHARMAP)
+        self.owner = None # the object encoding a string, see _encodeText()
+        self.text = None  # the string being encoded
+
+    def __missing__(self, code):
+        if self.owner is None:
+            self[code] = _REPLACEMENT_CODE
+            return _REPLACEMENT_CODE
+        return self.owner._glyphFor(code, self.text)
+
+def _encodeText(string, charmap, owner = None):
+    """!
+    Translate a string to display character codes, in one str.translate() pass
+    using a cached translation table.
+
+    @param string string: The string to translate
+    @param _Charmap charmap: The translation table
+    @param object owner: The object whose _glyphFor(code, text) method finds
+           characters missing from the table, or None to show them as '?'
+
+    @return **bytes** The display character codes
+    """
+    charmap.owner = owner
+    charmap.text = string
+    try:
+        if _HAS_TRANSLATE:
+            return string.translate(charmap).encode("latin-1")
+        data = bytearray(len(string))
+        for i in range(len(string)):
+            code = ord(string[i])
+            data[i] = charmap[code] if code in charmap else charmap.__missing__(code)
+        return bytes(data)
+    finally:
+        charmap.owner = None
+        charmap.text = None
+
 def map(x, in_min, in_max, out_min, out_max):
     """!
     Map a value from one range to another
@@ -147,6 +331,668 @@ def map(x, in_min, in_max, out_min, out_max):
     """
     return int((x-in_min) * (out_max-out_min) / (in_max-in_min) + out_min)
 
+class _DisplayState(object):
+    """!
+    Everything known about the state of one display: the display control and
+    entry mode flags, custom characters, backlight color, screen contents and
+    cursor. This mirrors what has been sent to the display, so it can be
+    replayed after the display resets. One instance is shared by every
+    QwiicSerlcd object for the same bus and address.
+    """
+    def __init__(self):
+        self.displayControl = LCD_DISPLAYON | LCD_CURSOROFF | LCD_BLINKOFF
+        self.displayMode = LCD_ENTRYLEFT | LCD_ENTRYSHIFTDECREMENT
+        self.backlight = None
+        self.glyphs = [None] * 8
+        self.glyphChars = [None] * 8 # characters automatically loaded into each location
+        self.charmap = None
+        self.font = {}
+        self.shadow = [bytearray(b" " * MAX_COLUMNS) for i in range(MAX_ROWS)]
+        self.col = 0
+        self.row = 0
+        self.shift = 0
+        self.unknown = set() # (row, col) of each cell a failed write may have left wrong
+
+        # Thread-safe mode - see QwiicSerlcd.enableThreadSafeMode()
+        self.lock = None
+        self.busQueue = None
+
+        # Cross-process bus lock - see QwiicSerlcd.enableBusLock()
+        self.busLock = None
+
+        # Resilient mode - see QwiicSerlcd.enableResilientMode()
+        self.needsRestore = False
+        self.restoring = False
+        self.restores = 0 # restore() calls, so a stream can tell it was replayed
+
+        # Batch mode - see QwiicSerlcd.beginBatch()
+        self.batch = None       # [bytes, pause] of each write collected
+        self.batchDepth = 0
+        self.batchStart = None  # the display control and entry mode flags when the batch began
+        self.batchSettings = [] # (key, value) of each setting in the batch, saved once it is sent
+
+        # Settings cache - see QwiicSerlcd.enableSettingsCache()
+        self.settingsPath = None
+        self.eepromInterval = _EEPROM_INTERVAL
+        self.eepromWrite = None # time of the last EEPROM write
+
+        # The last checkpoint saved or attached - see QwiicSerlcd.saveCheckpoint()
+        self.checkpoint = None
+
+# The display states of each bus, by address, shared by all QwiicSerlcd objects.
+# They are kept by I2C driver object, and dropped with it where weak references
+# exist. The default driver (None) and drivers that can't be weakly referenced
+# are kept by id() instead, for the life of the program.
+_display_states = _WeakKeyDictionary()
+_kept_display_states = {}
+
+# The contents of each timing profile file read, so it is read once
+_timing_profiles = {}
+
+def _hostPath(variable, name):
+    """!
+    @param string variable: Environment variable naming the file
+    @param string name: Name of the file in the home directory
+    @return **string** The file named by the environment variable, or the file in the home directory
+    """
+    try:
+        import os
+        path = os.environ.get(variable)
+        if path:
+            return path
+        return os.path.join(os.path.expanduser("~"), name)
+    except (ImportError, AttributeError): # MicroPython - use the current directory
+        return name
+
+def _timingProfilePath():
+    """!
+    @return **string** The timing profile file used when no file is given
+    """
+    return _hostPath(_TIMING_PROFILE_VARIABLE, _TIMING_PROFILE_FILE)
+
+def _readJson(path):
+    """!
+    @param string path: The file
+    @return **dict** The contents of a JSON file, empty if the file doesn't exist or isn't valid
+    """
+    try:
+        with open(path) as f:
+            content = f.read()
+    except OSError:
+        return {}
+    import json
+    try:
+        content = json.loads(content)
+    except ValueError:
+        return {}
+    return content if isinstance(content, dict) else {}
+
+def _writeJson(path, content):
+    """!
+    Write a JSON file. Where the file system allows, the file is replaced in
+    one step, so it is never left half written.
+
+    @param string path: The file
+    @param dict content: The contents
+    @return **bool** True if the file was written
+    """
+    import json
+    import os
+    temp = path + ".tmp"
+    try:
+        with open(temp, "w") as f:
+            f.write(json.dumps(content))
+        os.rename(temp, path)
+    except OSError:
+        return False
+    return True
+
+def _readTimingProfile(path):
+    """!
+    Read a timing profile file, once.
+
+    @param string path: The file
+    @return **dict** The timing of each display, by _deviceKey(), empty if the file doesn't exist
+    """
+    profile = _timing_profiles.get(path)
+    if profile is None:
+        profile = _timing_profiles[path] = _readJson(path)
+    return profile
+
+# The contents of each settings cache file, read once and kept up to date
+_settings_files = {}
+
+def _readSettings(path):
+    """!
+    Read a settings cache file, once.
+
+    @param string path: The file
+    @return **dict** The saved settings of each display address, empty if the file doesn't exist
+    """
+    settings = _settings_files.get(path)
+    if settings is None:
+        settings = _settings_files[path] = _readJson(path)
+    return settings
+
+def _writeSettings(path):
+    """!
+    Write the cached contents of a settings cache file back to it. A failed
+    write is ignored - the settings are written to the display again next time.
+
+    @param string path: The file
+    """
+    _writeJson(path, _settings_files.get(path, {}))
+
+def _checkpointEntry(state):
+    """!
+    @param _DisplayState state: The display state
+    @return **dict** The checkpoint of the display state, as saved in a checkpoint file
+    """
+    return {
+        "text": [list(line) for line in state.shadow],
+        "display_control": state.displayControl,
+        "entry_mode": state.displayMode,
+        "cursor": [state.col, state.row],
+        "shift": state.shift,
+        "glyphs": [list(glyph) if glyph is not None else None for glyph in state.glyphs],
+        "glyph_chars": list(state.glyphChars),
+        "backlight": list(state.backlight) if state.backlight is not None else None,
+    }
+
+class Snapshot(object):
+    """!
+    A copy of the display state - text, cursor, display mode flags, custom
+    characters and backlight color - taken by QwiicSerlcd.snapshot() from the
+    cached state, without reading the display.
+    """
+    def __init__(self, state):
+        """!
+        @param _DisplayState state: The display state to copy
+        """
+        self.displayControl = state.displayControl
+        self.displayMode = state.displayMode
+        self.backlight = state.backlight
+        self.glyphs = list(state.glyphs)
+        self.glyphChars = list(state.glyphChars)
+        self.shadow = [bytes(line) for line in state.shadow]
+        self.col = state.col
+        self.row = state.row
+        self.shift = state.shift
+
+def _deviceKey(i2c_driver, address):
+    """!
+    The name of a display in the files kept on the host. Displays at the same
+    address on different buses get different names, if the driver tells its
+    bus number, as the Linux driver of qwiic_i2c does.
+
+    @param i2c_driver: The I2C driver object for the bus, or None for the default driver
+    @param int address: The I2C address of the display
+
+    @return **string** The address, example: "0x72", after the bus number if known, example: "3:0x72"
+    """
+    bus = getattr(i2c_driver, "iBus", getattr(i2c_driver, "_iBus", None))
+    if bus is None:
+        return "0x%02X" % address
+    return "%s:0x%02X" % (bus, address)
+
+def _getDisplayState(i2c_driver, address, state = None):
+    """!
+    Get the shared state for the display at an address on an I2C bus, creating
+    it on first use.
+
+    @param i2c_driver: The I2C driver object for the bus
+    @param int address: The I2C address of the display
+    @param _DisplayState state: If provided, register this state for the address instead
+
+    @return **_DisplayState** The state for the display
+    """
+    try:
+        states = _display_states.get(i2c_driver)
+        if states is None:
+            states = {}
+            _display_states[i2c_driver] = states
+    except TypeError: # no weak reference to it
+        states = _kept_display_states.setdefault(id(i2c_driver), (i2c_driver, {}))[1]
+    if state is None:
+        state = states.get(address)
+        if state is not None:
+            return state
+        state = _DisplayState()
+    states[address] = state
+    return state
+
+def _synchronized(method):
+    """!
+    Decorator for QwiicSerlcd methods that talk to the display. In thread-safe
+    mode the whole method runs while holding the device lock, so multi-byte
+    command sequences and display state updates are never interleaved. The
+    bus lock shared with other processes is only held for each I2C write, see
+    QwiicSerlcd._transfer().
+
+    @param function method: The method to wrap
+    @return **function** The wrapped method
+    """
+    def wrapper(self, *args, **kwargs):
+        lock = self._state.lock
+        if lock is None:
+            return method(self, *args, **kwargs)
+        with lock:
+            return method(self, *args, **kwargs)
+    try:
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+    except AttributeError: # MicroPython functions don't have these
+        pass
+    return wrapper
+
+class _BusQueue(object):
+    """!
+    The single writer for one I2C bus. Writes from any thread are queued and
+    performed in order by one worker thread, so transactions never overlap on
+    the bus. The settle delays after each command are slept by the calling
+    thread, so the bus stays free for other devices meanwhile.
+    """
+    def __init__(self, i2c_driver):
+        """!
+        @param i2c_driver: The I2C driver object for the bus
+        """
+        import queue
+        import threading
+
+        self._i2c = i2c_driver
+        self._event = threading.Event
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="qwiic_serlcd bus writer")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def submit(self, method, args):
+        """!
+        Queue a driver call and wait for the worker thread to perform it.
+
+        @param string method: Name of the I2C driver method
+        @param tuple args: Arguments for the driver method
+
+        @return The value returned by the driver method. Exceptions raised by
+                the driver are raised again in the calling thread.
+        """
+        request = [method, args, None, None, self._event()]
+        self._queue.put(request)
+        request[4].wait()
+        if request[3] is not None:
+            raise request[3]
+        return request[2]
+
+    def _run(self):
+        """!
+        Worker thread loop - perform queued driver calls one at a time.
+        """
+        while True:
+            request = self._queue.get()
+            try:
+                request[2] = getattr(self._i2c, request[0])(*request[1])
+            except Exception as ex: # pylint: disable=broad-except
+                request[3] = ex
+            request[4].set()
+
+class _NoLock(object):
+    """!
+    Stand-in for the device lock when thread-safe mode is disabled.
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+_NO_LOCK = _NoLock()
+
+class _Batch(object):
+    """!
+    Context manager for QwiicSerlcd.batch().
+    """
+    def __init__(self, lcd):
+        self._lcd = lcd
+        self._lock = lcd.atomic()
+
+    def __enter__(self):
+        self._lock.__enter__()
+        self._lcd.beginBatch()
+        return self._lcd
+
+    def __exit__(self, *args):
+        try:
+            self._lcd.endBatch()
+        finally:
+            self._lock.__exit__(*args)
+        return False
+
+class BusLock(object):
+    """!
+    Lock on an I2C bus shared by processes - an exclusive flock() on a lock
+    file. Other drivers on the same bus can hold it around their own
+    transactions. It can be taken again by the thread holding it, and records
+    how long it is waited for and held, so contention can be tuned.
+    """
+    def __init__(self, path):
+        """!
+        @param string path: The lock file, the same for every process using the bus
+        """
+        import fcntl
+        import threading
+
+        self.path = path
+        self._fcntl = fcntl
+        self._file = open(path, "a")
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._acquired = 0.0
+        self.resetStats()
+
+    def __enter__(self):
+        start = time.time()
+        self._lock.acquire()
+        if self._depth == 0:
+            try:
+                self._fcntl.flock(self._file.fileno(), self._fcntl.LOCK_EX)
+            except BaseException:
+                self._lock.release() # or this process deadlocks on the next call
+                raise
+            self._acquired = time.time()
+            wait = self._acquired - start
+            self.acquisitions += 1
+            self.waitTime += wait
+            self.maxWaitTime = max(self.maxWaitTime, wait)
+        self._depth += 1
+        return self
+
+    def __exit__(self, *args):
+        self._depth -= 1
+        if self._depth == 0:
+            hold = time.time() - self._acquired
+            self.holdTime += hold
+            self.maxHoldTime = max(self.maxHoldTime, hold)
+            self._fcntl.flock(self._file.fileno(), self._fcntl.LOCK_UN)
+        self._lock.release()
+        return False
+
+    def stats(self):
+        """!
+        @return **dict** Number of times the lock was taken, and the total and longest time it was waited for and held, in seconds
+        """
+        return {"acquisitions": self.acquisitions,
+                "wait_time": self.waitTime, "max_wait_time": self.maxWaitTime,
+                "hold_time": self.holdTime, "max_hold_time": self.maxHoldTime}
+
+    def resetStats(self):
+        """!
+        Start the statistics again from zero.
+        """
+        self.acquisitions = 0
+        self.waitTime = 0.0
+        self.maxWaitTime = 0.0
+        self.holdTime = 0.0
+        self.maxHoldTime = 0.0
+
+# One bus lock per lock file in this process
+_bus_locks = {}
+
+def getBusLock(path = _BUS_LOCK_FILE):
+    """!
+    Get the cross-process lock for an I2C bus, for use by any driver on the
+    bus. Example:
+
+        with qwiic_serlcd.getBusLock():
+            other_device.write(...)
+
+    @param string path: The lock file, the same for every process using the bus
+    @return **BusLock** The lock, or None if file locks aren't available (Windows, MicroPython)
+    """
+    lock = _bus_locks.get(path)
+    if lock is None:
+        try:
+            lock = BusLock(path)
+        except ImportError:
+            return None
+        _bus_locks[path] = lock
+    return lock
+
+# One writer queue per I2C driver (bus), shared by every thread-safe QwiicSerlcd
+_bus_queues = {}
+_bus_queues_lock = _thread.allocate_lock() if _thread is not None else None
+
+def _getBusQueue(i2c_driver):
+    """!
+    Get the writer queue for an I2C bus, creating it on first use.
+
+    @param i2c_driver: The I2C driver object for the bus
+    @return **_BusQueue** The writer queue for the bus
+    """
+    with _bus_queues_lock:
+        bus_queue = _bus_queues.get(id(i2c_driver))
+        if bus_queue is None or bus_queue._i2c is not i2c_driver:
+            bus_queue = _BusQueue(i2c_driver)
+            _bus_queues[id(i2c_driver)] = bus_queue
+        return bus_queue
+
+def _settingKeys(command):
+    """!
+    @param int command: The byte after the setting command prefix
+    @return **tuple** What the setting changes, for dropping it when a later setting changes the same, or None if it can't be dropped
+    """
+    if command == CONTRAST_COMMAND:
+        return ("contrast",)
+    if command == SET_RGB_COMMAND:
+        return ("red", "green", "blue")
+    if 128 <= command <= 217:
+        return (("red", "green", "blue")[(command - 128) // 30],)
+    if CREATE_CHAR_COMMAND <= command < CREATE_CHAR_COMMAND + 8:
+        return ("glyph", command - CREATE_CHAR_COMMAND)
+    return None
+
+# Number of bytes after a setting command, for the settings that take arguments
+_SETTING_ARGUMENTS = {CONTRAST_COMMAND: 1, ADDRESS_COMMAND: 1, SET_RGB_COMMAND: 3}
+for _location in range(8):
+    _SETTING_ARGUMENTS[CREATE_CHAR_COMMAND + _location] = 8
+
+def _nextAddress(address, step):
+    """!
+    Past the end of a row the controller and the OpenLCD firmware, which
+    keeps its own character count, don't agree on where the cursor goes, so
+    the cursor is then unknown.
+
+    @param int address: A display memory address on the screen
+    @param int step: 1 to move right, -1 to move left
+    @return **int** The address the display cursor moves to from an address, or None if it leaves the row
+    """
+    col = (address & 0x3F) % MAX_COLUMNS + step
+    if col < 0 or col >= MAX_COLUMNS:
+        return None
+    return address + step
+
+def _parseBatch(batch):
+    """!
+    Split the bytes of a batch of writes into commands.
+
+    @param list batch: The [bytes, pause] of each write
+    @return **list** [bytes, pause] for each command - a character, a special command or a setting command - with the pause after the write on its last setting command
+    """
+    commands = []
+    command = []
+    for data, pause in batch:
+        setting = None
+        for byte in data:
+            command.append(byte)
+            if command[0] == SPECIAL_COMMAND:
+                if len(command) < 2:
+                    continue
+            elif command[0] == SETTING_COMMAND:
+                if len(command) < 2 or len(command) - 2 < _SETTING_ARGUMENTS.get(command[1], 0):
+                    continue
+                setting = len(commands)
+            commands.append([command, 0.0])
+            command = []
+
+        # the pause after a write is for the settings in it
+        if setting is None:
+            setting = len(commands) - 1
+        if setting >= 0:
+            commands[setting][1] = max(commands[setting][1], pause)
+    if command:
+        commands.append([command, 0.0])
+    return commands
+
+def _isClear(command):
+    """!
+    @param list of int command: A command
+    @return **bool** True if the command clears the display
+    """
+    return command[:2] == [SETTING_COMMAND, CLEAR_COMMAND] or command == [SPECIAL_COMMAND, 0x01]
+
+def _optimizeBatch(batch, displayControl, displayMode):
+    """!
+    Peephole optimiser for the writes of a batch. Commands whose effect is
+    overwritten later in the batch are dropped, cursor moves are merged into
+    at most one cursor move before each write of characters, and characters
+    that are already on the display - known from earlier in the batch, such as
+    spaces after a clear - are skipped.
+
+    @param list batch: The [bytes, pause] of each write, as recorded
+    @param int displayControl: The display control flags at the start of the batch
+    @param int displayMode: The entry mode flags at the start of the batch
+
+    @return **list** [bytes, pause] of each run of bytes to send, with the pause to wait after it
+    """
+    commands = _parseBatch(batch)
+    for command, pause in commands:
+        if command[0] == SPECIAL_COMMAND and len(command) == 2 and command[1] & 0xC0 == 0x40:
+            return [[[byte for data, pause in batch for byte in data], 0.0]] # character generator writes
+        if command[:2] == [SETTING_COMMAND, SAVE_CURRENT_DISPLAY_AS_SPLASH]:
+            return [[[byte for data, pause in batch for byte in data], 0.0]] # the splash needs every step
+
+    # Backward pass - drop commands overridden later in the batch
+    last_clear = -1
+    for i in range(len(commands)):
+        if _isClear(commands[i][0]):
+            last_clear = i
+    seen = set()
+    later_control = False
+    later_mode = False
+    keep = [True] * len(commands)
+    for i in range(len(commands) - 1, -1, -1):
+        command = commands[i][0]
+        if command[0] == SETTING_COMMAND and len(command) > 1 and not (WRITE_CHAR_COMMAND <= command[1] < WRITE_CHAR_COMMAND + 8):
+            later_control = False # the display may be hidden while a setting is shown
+            keys = _settingKeys(command[1])
+            if keys is not None and len(command) - 2 == _SETTING_ARGUMENTS.get(command[1], 0):
+                key_set = set([keys]) if keys[0] == "glyph" else set(keys)
+                if key_set <= seen:
+                    keep[i] = False
+                seen |= key_set
+            if _isClear(command) and i < last_clear:
+                keep[i] = False
+        elif command[0] == SPECIAL_COMMAND and len(command) == 2:
+            code = command[1]
+            if code & 0xF8 == LCD_DISPLAYCONTROL:
+                keep[i] = not later_control
+                later_control = True
+            elif code & 0xFC == LCD_ENTRYMODESET:
+                keep[i] = not later_mode
+                later_mode = True
+            elif i < last_clear and (code & 0x80 or code & 0xF0 == LCD_CURSORSHIFT or code & 0xFE == LCD_RETURNHOME or code == 0x01):
+                keep[i] = False
+        else:
+            later_mode = False # characters are written in the entry mode
+            if i < last_clear:
+                keep[i] = False
+
+    # Forward pass - follow the cursor and the characters written, and send
+    # cursor moves only when characters are written
+    runs = []
+    data = []
+    content = {}    # the character at each display memory address, where known
+    address = None  # where the cursor should be, None if unknown
+    cursor = None   # where the cursor is, None if unknown
+    for i in range(len(commands)):
+        if not keep[i]:
+            continue
+        command, pause = commands[i]
+        send = True
+        if command[0] == SPECIAL_COMMAND and len(command) == 2:
+            code = command[1]
+            if code & 0x80:
+                address = code & 0x7F
+                if not displayMode & LCD_ENTRYLEFT:
+                    # The firmware sets its character count from each address,
+                    # and right to left the count decides where the cursor
+                    # jumps to the next row - so the moves are sent as they are
+                    address = None
+                    cursor = None
+                elif address <= 0x27 or 0x40 <= address <= 0x67:
+                    send = False
+                else:
+                    address = None # outside the display memory
+                    cursor = None
+            elif code & 0xF8 == LCD_CURSORSHIFT | LCD_CURSORMOVE and address is not None:
+                following = None
+                if displayMode & LCD_ENTRYLEFT:
+                    following = _nextAddress(address, 1 if code & LCD_MOVERIGHT else -1)
+                if following is None:
+                    # leaving the row - send the move from where the cursor should be
+                    if address != cursor:
+                        data.extend((SPECIAL_COMMAND, LCD_SETDDRAMADDR | address))
+                    cursor = None
+                else:
+                    send = False
+                address = following
+            elif code & 0xF0 == LCD_CURSORSHIFT and address is None:
+                cursor = None
+            elif code & 0xF8 == LCD_DISPLAYCONTROL:
+                send = code & 0x07 != displayControl
+                displayControl = code & 0x07
+            elif code & 0xFC == LCD_ENTRYMODESET:
+                send = code & 0x03 != displayMode
+                displayMode = code & 0x03
+            elif code & 0xFE == LCD_RETURNHOME or code == 0x01:
+                address = cursor = 0
+                if code == 0x01:
+                    content = dict.fromkeys(range(0x68), 0x20)
+        elif _isClear(command):
+            address = cursor = 0
+            content = dict.fromkeys(range(0x68), 0x20)
+        elif command[0] != SETTING_COMMAND or len(command) == 2 and WRITE_CHAR_COMMAND <= command[1] < WRITE_CHAR_COMMAND + 8:
+            # a character
+            code = command[-1] if command[0] != SETTING_COMMAND else command[1] - WRITE_CHAR_COMMAND
+            step = 1 if displayMode & LCD_ENTRYLEFT else -1
+            following = None
+            if address is not None and displayMode & LCD_ENTRYLEFT:
+                following = _nextAddress(address, step) # right to left, every character is sent, see above
+            if following is not None and not displayMode & LCD_ENTRYSHIFTINCREMENT and content.get(address) == code:
+                send = False # already on the display
+            elif address is None:
+                content = {} # written somewhere unknown
+                cursor = None
+            else:
+                if address != cursor:
+                    data.extend((SPECIAL_COMMAND, LCD_SETDDRAMADDR | address))
+                content[address] = code
+                cursor = following
+            address = following
+
+        if send:
+            data.extend(command)
+
+        # settings are saved to EEPROM by the display, keep their pauses
+        if pause and command[0] == SETTING_COMMAND and not WRITE_CHAR_COMMAND <= command[1] < WRITE_CHAR_COMMAND + 8 and data:
+            runs.append([data, pause])
+            data = []
+
+    if address is not None and address != cursor:
+        data.extend((SPECIAL_COMMAND, LCD_SETDDRAMADDR | address))
+    if data:
+        runs.append([data, 0.0])
+    return runs
+
 # define the class that encapsulates the device being created. All information associated with this
 # device is encapsulated by this class. The device class should be the only value exported
 # from this module.
@@ -158,8 +1004,6 @@ class QwiicSerlcd(object):
     # Constructor
     device_name = _DEFAULT_NAME
     available_addresses = _AVAILABLE_I2C_ADDRESS
-    _displayControl = LCD_DISPLAYON | LCD_CURSOROFF | LCD_BLINKOFF
-    _displayMode = LCD_ENTRYLEFT | LCD_ENTRYSHIFTDECREMENT
 
     # Constructor
     def __init__(self, address=None, i2c_driver=None):
@@ -167,21 +1011,36 @@ class QwiicSerlcd(object):
         @param address: The I2C address to use for the device.
                         If not provided, the default address is used.
         @param i2c_driver: An existing i2c driver object. If not provided
-                        a driver object is created.
+                        a driver object is created when the display is first used.
         @return: **Object** The QwiicSerlcd device object.
         """
         # Did the user specify an I2C address?
         self.address = address if address is not None else self.available_addresses[0]
 
-        # load the I2C driver if one isn't provided
+        # Resilient mode - disabled by default, see enableResilientMode()
+        self._retries = 0
+        self._retryDelay = 0.01
+        self._maxRetryDelay = 0.25
 
-        if i2c_driver is None:
-            self._i2c = qwiic_i2c.getI2CDriver()
-            if self._i2c is None:
-                print("Unable to load I2C driver for this platform.")
-                return
-        else:
-            self._i2c = i2c_driver
+        # The I2C driver is loaded on first use if one isn't provided, see _driver()
+        self._bus = i2c_driver
+        self._i2c = i2c_driver
+
+        # The cached display state, shared by every object for this display
+        self._state = _getDisplayState(self._bus, self.address)
+
+        # Pauses and block size - the defaults suit any bus speed, a calibrated
+        # timing profile can make them shorter, see loadTimingProfile()
+        self._writeDelay = 0.01
+        self._settingDelay = 0.05
+        self._blockSize = _MAX_BLOCK_SIZE
+        self._blockDelay = 0.01
+        self.loadTimingProfile()
+
+        # Verification mode - disabled by default, see enableVerification()
+        self._verifyThreshold = None
+        self._verifyTiming = None
+        self._verifiedWrites = 0
 
     def is_connected(self):
         """!
@@ -190,10 +1049,12 @@ class QwiicSerlcd(object):
         @return **bool** True if the device is connected, otherwise False.
         """
         # Another possible comment could be @retval bool True: Device is connected. above
+        import qwiic_i2c
         return qwiic_i2c.isDeviceConnected(self.address)
 
     connected = property(is_connected)
 
+    @_synchronized
     def begin(self):
         """!
         Initialize the operation of the SerLCD module
@@ -201,39 +1062,108 @@ class QwiicSerlcd(object):
         @return **bool** Returns true if the initialization was successful, otherwise False.
         """
         # set default settings, as defined in constructor
-        result0 = self.specialCommand(LCD_DISPLAYCONTROL | self._displayControl)
-        time.sleep(1)
-        result1 = self.specialCommand(LCD_ENTRYMODESET | self._displayMode)
-        time.sleep(1)
+        result0 = self.specialCommand(LCD_DISPLAYCONTROL | self._state.displayControl)
+        self._pause(1)
+        result1 = self.specialCommand(LCD_ENTRYMODESET | self._state.displayMode)
+        self._pause(1)
         result2 = self.clearScreen()
-        time.sleep(1)
+        self._pause(1)
 
         return (bool(result0) & bool(result1) & bool(result2))
 
+    @_synchronized
     def print(self, string):
         """!
             Print a string of characters to the LCD
 
-            @param string string: The string you would like to print. Aka ASCII characters. example: "Hello"
+            Characters are translated to the display character ROM, so for
+            example "25\u00b0C" shows a degree sign. Characters missing from
+            the ROM are shown with automatically loaded custom characters where
+            a bitmap is known (see defineGlyph()), otherwise as '?'. Control
+            characters below 0x20 and bytes are sent as raw character codes,
+            without translation.
+
+            @param string string: The string you would like to print. example: "Hello"
 
             @return **bool** Returns True if the I2C writes were successful, otherwise False.
         """
-        for c in string:
-                if self._i2c.writeCommand(self.address, ord(c)) == False:
-                        return False
-                time.sleep(0.01)
+        if isinstance(string, (bytes, bytearray)):
+            data = string
+        else:
+            data = self._encode(string)
+
+        state = self._state
+        for code in data:
+            # The character is cached before it is sent, so a restore() done
+            # once the display answers again includes it, and taken back if
+            # the write fails - it may or may not have reached the display.
+            row, col, shift = state.row, state.col, state.shift
+            previous = state.shadow[row][col]
+            self._shadowPut(code)
+            result = False
+            try:
+                if code < 8:
+                    result = self._write("writeByte", SETTING_COMMAND, WRITE_CHAR_COMMAND + code)
+                else:
+                    result = self._write("writeCommand", code)
+            finally:
+                if not result:
+                    state.row, state.col, state.shift = row, col, shift
+                    state.shadow[row][col] = previous
+                    state.unknown.add((row, col))
+            if not result:
+                return False
+            self._pause(self._writeDelay)
+        if self._verifyThreshold is not None and len(data) >= self._verifyThreshold:
+            return self._verify()
         return True
 
+    @_synchronized
+    def printAt(self, col, row, string):
+        """!
+            Print a string of characters at a position, sending only the
+            characters that differ from what is already on the display. The
+            string is translated as for print() and cut at the end of the row,
+            and the changes are sent in as few I2C writes as possible, so
+            changing one digit of a number costs a cursor move and one character.
+
+            @param int col: The column position (0-19)
+            @param int row: The row position (0-3)
+            @param string string: The string you would like to print. example: "Hello"
+
+            @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        if isinstance(string, (bytes, bytearray)):
+            data = string
+        else:
+            data = self._encode(string)
+
+        col = min(max(0, col), MAX_COLUMNS - 1)
+        row = min(max(0, row), MAX_ROWS - 1)
+        end = min(col + len(data), MAX_COLUMNS)
+
+        state = self._state
+        rows = list(state.shadow)
+        rows[row] = bytearray(rows[row])
+        rows[row][col:end] = data[:end - col]
+
+        commands = []
+        runs = self._diffText(rows, commands)
+        return self._sendRuns(rows, runs, commands)
+
+    @_synchronized
     def clearScreen(self):
         """!
             Sends the command to clear the screen
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
+        self._shadowClear()
         result = self.command(CLEAR_COMMAND)
-        time.sleep(0.01)
+        self._pause(self._writeDelay)
         return result
 
+    @_synchronized
     def home(self):
         """!
             Send the home command to the display. This returns the cursor
@@ -242,10 +1172,14 @@ class QwiicSerlcd(object):
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
+        self._state.col = 0
+        self._state.row = 0
+        self._state.shift = 0
         result = self.specialCommand(LCD_RETURNHOME)
-        time.sleep(0.01)
+        self._pause(self._writeDelay)
         return result
 
+    @_synchronized
     def setCursor(self, col, row):
         """!
             Set the cursor position to a particular column and row.
@@ -255,18 +1189,20 @@ class QwiicSerlcd(object):
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        row_offsets = [0x00, 0x40, 0x14, 0x54]
-
         # keep variables in bounds
         row = max(0, row)            # row cannot be less than 0
         row = min(row, (MAX_ROWS - 1)) # row cannot be greater than max rows
 
+        self._state.col = min(max(0, col), MAX_COLUMNS - 1)
+        self._state.row = row
+
         # construct the cursor "command"
-        command = LCD_SETDDRAMADDR | (col + row_offsets[row])
+        command = LCD_SETDDRAMADDR | (col + _ROW_OFFSETS[row])
 
         # send the complete bytes (special command + command)
-        return self._i2c.writeByte(self.address, SPECIAL_COMMAND, command)
+        return self._write("writeByte", SPECIAL_COMMAND, command)
 
+    @_synchronized
     def setContrast(self, contrast):
         """!
             Set the contrast of the LCD screen (0-255)
@@ -286,11 +1222,16 @@ class QwiicSerlcd(object):
 
         block = [CONTRAST_COMMAND, contrast]
 
+        # the contrast is stored in EEPROM - skip the write if it's set already
+        if self._checkSetting("contrast", contrast):
+            return True
+
         # send the complete bytes (address, settings command , contrast command, contrast value)
-        result = self._i2c.writeBlock(self.address, SETTING_COMMAND, block)
-        time.sleep(0.01)
-        return result
+        result = self._write("writeBlock", SETTING_COMMAND, block)
+        self._pause(self._writeDelay)
+        return self._settingWritten("contrast", contrast, result)
 
+    @_synchronized
     def setBacklight(self, r, g, b):
         """!
             Set the brightness of each backlight (red, green, blue)
@@ -313,9 +1254,8 @@ class QwiicSerlcd(object):
         blue = 188 + map(b, 0, 255, 0, 29)
 
         # Turn display off to hide confirmation messages
-        self._displayControl &= ~LCD_DISPLAYON
         block[0] = SPECIAL_COMMAND
-        block[1] = (LCD_DISPLAYCONTROL | self._displayControl)
+        block[1] = (LCD_DISPLAYCONTROL | (self._state.displayControl & ~LCD_DISPLAYON))
 
         # Set the red, green and blue values
         block[2] = SETTING_COMMAND
@@ -325,16 +1265,24 @@ class QwiicSerlcd(object):
         block[6] = SETTING_COMMAND
         block[7] = blue
 
-        # Turn display back on and end
-        self._displayControl |= LCD_DISPLAYON
+        # Turn display back on (unless it was off already) and end
         block[8] = SPECIAL_COMMAND
-        block[9] = (LCD_DISPLAYCONTROL | self._displayControl)
+        block[9] = (LCD_DISPLAYCONTROL | self._state.displayControl)
+
+        self._state.backlight = (r, g, b)
+
+        # the brightness is stored in EEPROM, scaled back to 0-255 - skip the
+        # write if it's set already
+        saved = [map(red - 128, 0, 29, 0, 255), map(green - 158, 0, 29, 0, 255), map(blue - 188, 0, 29, 0, 255)]
+        if self._checkSetting("backlight", saved):
+            return True
 
         # send the complete bytes (address, settings command , contrast command, contrast value)
-        result = self._i2c.writeBlock(self.address, SETTING_COMMAND, block)
-        time.sleep(0.05)
-        return result
+        result = self._write("writeBlock", SETTING_COMMAND, block)
+        self._pause(self._settingDelay)
+        return self._settingWritten("backlight", saved, result)
 
+    @_synchronized
     def specialCommand(self, command, count = 1):
         """!
             Send one (or multiple) special commands to the display.
@@ -347,10 +1295,13 @@ class QwiicSerlcd(object):
         """
         for i in range(0, count):
             # send the complete bytes (special command + command)
-            result = self._i2c.writeByte(self.address, SPECIAL_COMMAND, command)
-        time.sleep(0.05)
+            result = self._write("writeByte", SPECIAL_COMMAND, command)
+            if not result:
+                break
+        self._pause(self._settingDelay)
         return result
 
+    @_synchronized
     def command(self, command):
         """!
             Send one setting command to the display.
@@ -360,10 +1311,11 @@ class QwiicSerlcd(object):
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        result = self._i2c.writeByte(self.address, SETTING_COMMAND, command)
-        time.sleep(0.01)
+        result = self._write("writeByte", SETTING_COMMAND, command)
+        self._pause(self._writeDelay)
         return result
 
+    @_synchronized
     def moveCursorLeft(self, count = 1):
         """!
             Move the cursor one or more characters to the left.
@@ -372,8 +1324,10 @@ class QwiicSerlcd(object):
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
+        self._shadowMove(-count)
         return self.specialCommand(LCD_CURSORSHIFT | LCD_CURSORMOVE | LCD_MOVELEFT, count)
 
+    @_synchronized
     def moveCursorRight(self, count = 1):
         """!
             Move the cursor one or more characters to the right.
@@ -382,44 +1336,50 @@ class QwiicSerlcd(object):
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
+        self._shadowMove(count)
         return self.specialCommand(LCD_CURSORSHIFT | LCD_CURSORMOVE | LCD_MOVERIGHT, count)
 
+    @_synchronized
     def cursor(self):
         """!
             Turn the underline cursor on.
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        self._displayControl |= LCD_CURSORON
-        return self.specialCommand(LCD_DISPLAYCONTROL | self._displayControl)
+        self._state.displayControl |= LCD_CURSORON
+        return self.specialCommand(LCD_DISPLAYCONTROL | self._state.displayControl)
 
+    @_synchronized
     def noCursor(self):
         """!
             Turn the underline cursor off.
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        self._displayControl &= ~LCD_CURSORON
-        return self.specialCommand(LCD_DISPLAYCONTROL | self._displayControl)
+        self._state.displayControl &= ~LCD_CURSORON
+        return self.specialCommand(LCD_DISPLAYCONTROL | self._state.displayControl)
 
+    @_synchronized
     def blink(self):
         """!
             Turn the blink cursor on.
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        self._displayControl |= LCD_BLINKON
-        return self.specialCommand(LCD_DISPLAYCONTROL | self._displayControl)
+        self._state.displayControl |= LCD_BLINKON
+        return self.specialCommand(LCD_DISPLAYCONTROL | self._state.displayControl)
 
+    @_synchronized
     def noBlink(self):
         """!
             Turn the blink cursor off.
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        self._displayControl &= ~LCD_BLINKON
-        return self.specialCommand(LCD_DISPLAYCONTROL | self._displayControl)
+        self._state.displayControl &= ~LCD_BLINKON
+        return self.specialCommand(LCD_DISPLAYCONTROL | self._state.displayControl)
 
+    @_synchronized
     def scrollDisplayLeft(self, count = 1):
         """!
             Scroll the display one or multiple characters to the left, without changing the text.
@@ -428,8 +1388,10 @@ class QwiicSerlcd(object):
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
+        self._state.shift = (self._state.shift + count) % 40
         return self.specialCommand(LCD_CURSORSHIFT | LCD_DISPLAYMOVE | LCD_MOVELEFT, count)
 
+    @_synchronized
     def scrollDisplayRight(self, count = 1):
         """!
             Scroll the display one or multiple characters to the right, without changing the text.
@@ -438,44 +1400,50 @@ class QwiicSerlcd(object):
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
+        self._state.shift = (self._state.shift - count) % 40
         return self.specialCommand(LCD_CURSORSHIFT | LCD_DISPLAYMOVE | LCD_MOVERIGHT, count)
 
+    @_synchronized
     def autoscroll(self):
         """!
             Turn autoscrolling on. This will right-justify text from the cursor.
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        self._displayControl |= LCD_ENTRYSHIFTINCREMENT
-        return self.specialCommand(LCD_ENTRYMODESET | self._displayControl)
+        self._state.displayMode |= LCD_ENTRYSHIFTINCREMENT
+        return self.specialCommand(LCD_ENTRYMODESET | self._state.displayMode)
 
+    @_synchronized
     def noAutoscroll(self):
         """!
             Turn autoscrolling off.
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        self._displayControl &= ~LCD_ENTRYSHIFTINCREMENT
-        return self.specialCommand(LCD_ENTRYMODESET | self._displayControl)
+        self._state.displayMode &= ~LCD_ENTRYSHIFTINCREMENT
+        return self.specialCommand(LCD_ENTRYMODESET | self._state.displayMode)
 
+    @_synchronized
     def leftToRight(self):
         """!
             Set the text to flow from left to right.
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        self._displayControl |= LCD_ENTRYLEFT
-        return self.specialCommand(LCD_ENTRYMODESET | self._displayControl)
+        self._state.displayMode |= LCD_ENTRYLEFT
+        return self.specialCommand(LCD_ENTRYMODESET | self._state.displayMode)
 
+    @_synchronized
     def rightToLeft(self):
         """!
             Set the text to flow from right to left
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        self._displayControl &= ~LCD_ENTRYLEFT
-        return self.specialCommand(LCD_ENTRYMODESET | self._displayControl)
+        self._state.displayMode &= ~LCD_ENTRYLEFT
+        return self.specialCommand(LCD_ENTRYMODESET | self._state.displayMode)
 
+    @_synchronized
     def createChar(self, location, charmap):
         """!
             Create a custom character
@@ -490,18 +1458,24 @@ class QwiicSerlcd(object):
         # create a block of data bytes to send to the screen
         # This will include the location (with the addition of 27 to let the screen know)
         # and the 8 bytes of charmap
-        block = [0,1,2,3,4,5,6,7,8,9]
+        block = [CREATE_CHAR_COMMAND + location] + list(charmap[:8]) # command type/location, charmap
 
-        block[0] = (27 + location) # command type/location
-
-        for i in range(1,9):
-            block[i] = charmap[i-1]
+        # the location now belongs to the application, not to print()
+        state = self._state
+        char = state.glyphChars[location]
+        if char is not None:
+            state.glyphChars[location] = None
+            state.charmap.pop(ord(char), None)
+        state.glyphs[location] = None # not known until it is sent
 
         # send the complete bytes (address, settings command , write char command (includes location), charmap)
-        result = self._i2c.writeBlock(self.address, SETTING_COMMAND, block)
-        time.sleep(0.05)
+        result = self._write("writeBlock", SETTING_COMMAND, block)
+        if result:
+            state.glyphs[location] = block[1:9]
+        self._pause(self._settingDelay)
         return result
 
+    @_synchronized
     def writeChar(self, location):
         """!
             Write a custom character to the display
@@ -512,29 +1486,34 @@ class QwiicSerlcd(object):
         """
         location &= 0x7 # we only have 8 locations 0-7
 
+        self._shadowPut(location)
+
         # send command
-        result = self.command(35 + location)
-        time.sleep(0.05)
+        result = self.command(WRITE_CHAR_COMMAND + location)
+        self._pause(self._settingDelay)
         return result
 
+    @_synchronized
     def display(self):
         """!
             Turn the display on quickly.
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        self._displayControl |= LCD_DISPLAYON
-        return self.specialCommand(LCD_DISPLAYCONTROL | self._displayControl)
+        self._state.displayControl |= LCD_DISPLAYON
+        return self.specialCommand(LCD_DISPLAYCONTROL | self._state.displayControl)
 
+    @_synchronized
     def noDisplay(self):
         """!
             Turn the display off quickly.
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
-        self._displayControl &= ~LCD_DISPLAYON
-        return self.specialCommand(LCD_DISPLAYCONTROL | self._displayControl)
+        self._state.displayControl &= ~LCD_DISPLAYON
+        return self.specialCommand(LCD_DISPLAYCONTROL | self._state.displayControl)
 
+    @_synchronized
     def setFastBacklight(self, r, g, b):
         """!
             Set backlight with no LCD messages or delays
@@ -554,55 +1533,78 @@ class QwiicSerlcd(object):
         block[2] = g
         block[3] = b
 
+        self._state.backlight = (r, g, b)
+
+        # the brightness is stored in EEPROM - skip the write if it's set already
+        if self._checkSetting("backlight", [r, g, b]):
+            return True
+
         # send the complete bytes (address, settings command , rgb command , red byte, green byte, blue byte)
-        result = self._i2c.writeBlock(self.address, SETTING_COMMAND, block)
-        time.sleep(0.01)
-        return result
+        result = self._write("writeBlock", SETTING_COMMAND, block)
+        self._pause(self._writeDelay)
+        return self._settingWritten("backlight", [r, g, b], result)
 
+    @_synchronized
     def enableSystemMessages(self):
         """!
             Enable system messages
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
+        if self._checkSetting("messages", True):
+            return True
+
         # send command
         result = self.command(ENABLE_SYSTEM_MESSAGE_DISPLAY)
-        time.sleep(0.01)
-        return result
+        self._pause(self._writeDelay)
+        return self._settingWritten("messages", True, result)
 
+    @_synchronized
     def disableSystemMessages(self):
         """!
             Disable system messages
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
+        if self._checkSetting("messages", False):
+            return True
+
         # send command
         result = self.command(DISABLE_SYSTEM_MESSAGE_DISPLAY)
-        time.sleep(0.01)
-        return result
+        self._pause(self._writeDelay)
+        return self._settingWritten("messages", False, result)
 
+    @_synchronized
     def enableSplash(self):
         """!
             Enable splash screen at power on
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
+        if self._checkSetting("splash", True):
+            return True
+
         # send command
         result = self.command(ENABLE_SPLASH_DISPLAY)
-        time.sleep(0.01)
-        return result
+        self._pause(self._writeDelay)
+        return self._settingWritten("splash", True, result)
 
+    @_synchronized
     def disableSplash(self):
         """!
             Disable splash screen at power on
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
+        if self._checkSetting("splash", False):
+            return True
+
         # send command
         result = self.command(DISABLE_SPLASH_DISPLAY)
-        time.sleep(0.01)
-        return result
+        self._pause(self._writeDelay)
+        return self._settingWritten("splash", False, result)
 
+    @_synchronized
     def saveSplash(self):
         """!
             Save the current display as the splash
@@ -611,11 +1613,15 @@ class QwiicSerlcd(object):
 
             @return **bool** Returns True if the I2C write was successful, otherwise False.
         """
+        # never skipped, but spaced like other EEPROM writes
+        self._checkSetting()
+
         # send command
         result = self.command(SAVE_CURRENT_DISPLAY_AS_SPLASH)
-        time.sleep(0.01)
-        return result
+        self._pause(self._writeDelay)
+        return self._settingWritten(None, None, result)
 
+    @_synchronized
     def setAddress(self, new_addr):
         """!
             Change the I2C Address. 0x72 is the default.
@@ -634,8 +1640,1070 @@ class QwiicSerlcd(object):
         block[0] = ADDRESS_COMMAND # command
         block[1] = new_addr
 
+        # with the settings cache, setting the same address again is skipped
+        if self._state.settingsPath is not None and new_addr == self.address:
+            return True
+        self._checkSetting()
+
         # send the complete bytes (address, settings command , address command , new_addr byte)
-        result = self._i2c.writeBlock(self.address, SETTING_COMMAND, block)
-        time.sleep(0.05)
+        result = self._write("writeBlock", SETTING_COMMAND, block)
+        self._pause(self._settingDelay)
+        self._settingWritten(None, None, result)
+        old_addr = self.address
         self.address = new_addr # update our own address, so we can still talk to the display
+        _getDisplayState(self._bus, new_addr, self._state) # and keep the display state with it
+        if result and self._state.settingsPath is not None: # and the saved settings
+            settings = _readSettings(self._state.settingsPath)
+            saved = settings.pop(_deviceKey(self._bus, old_addr), None)
+            if saved is not None:
+                settings[_deviceKey(self._bus, new_addr)] = saved
+                _writeSettings(self._state.settingsPath)
         return result
+
+    @_synchronized
+    def snapshot(self):
+        """!
+            Capture the current screen: text, cursor, display mode flags, custom
+            characters and backlight color. The snapshot is taken from the
+            cached display state, so nothing is read from the display.
+
+            @return **Snapshot** The captured state, for restoreSnapshot()
+        """
+        return Snapshot(self._state)
+
+    @_synchronized
+    def saveCheckpoint(self, path = None):
+        """!
+            Save the display state - text, cursor, display mode flags, custom
+            characters and backlight color - to a checkpoint file, so the next
+            program using the display can take it over with attach() instead of
+            begin(). Call this after each complete update of the screen. The
+            file is only written if the state changed since the last checkpoint.
+
+            @param string path: The checkpoint file, if not the default - the QWIIC_SERLCD_CHECKPOINT environment variable or ~/.qwiic_serlcd_checkpoint.json
+
+            @return **bool** Returns True if the checkpoint was saved, otherwise False.
+        """
+        state = self._state
+        entry = _checkpointEntry(state)
+        if entry == state.checkpoint:
+            return True
+        if path is None:
+            path = _hostPath(_CHECKPOINT_VARIABLE, _CHECKPOINT_FILE)
+        checkpoints = _readJson(path)
+        checkpoints[_deviceKey(self._bus, self.address)] = entry
+        if not _writeJson(path, checkpoints):
+            return False
+        state.checkpoint = entry
+        return True
+
+    @_synchronized
+    def attach(self, path = None):
+        """!
+            Take over a running display without begin(): the display state is
+            loaded from the checkpoint saved by the previous program with
+            saveCheckpoint(), and only the display mode flags and the cursor
+            position are sent again. The screen isn't cleared, so a restarting
+            program shows no blank, and its first updates send only what
+            differs from the checkpoint.
+
+            Use begin() instead if the display lost power, or was changed
+            after the last checkpoint.
+
+            @param string path: The checkpoint file, if not the default
+
+            @return **bool** Returns True if the display was taken over, False if it has no valid checkpoint or doesn't respond.
+        """
+        if path is None:
+            path = _hostPath(_CHECKPOINT_VARIABLE, _CHECKPOINT_FILE)
+        entry = _readJson(path).get(_deviceKey(self._bus, self.address))
+        try:
+            shadow = [bytearray(line) for line in entry["text"]]
+            glyphs = [list(glyph) if glyph is not None else None for glyph in entry["glyphs"]]
+            glyphChars = list(entry["glyph_chars"])
+            col, row = entry["cursor"]
+            backlight = entry["backlight"]
+            if len(shadow) != MAX_ROWS or len(glyphs) != 8 or len(glyphChars) != 8 \
+                or [len(line) for line in shadow] != [MAX_COLUMNS] * MAX_ROWS:
+                return False
+            displayControl = int(entry["display_control"]) & 0x07
+            displayMode = int(entry["entry_mode"]) & 0x03
+            shift = int(entry["shift"]) % 40
+            col = min(max(0, int(col)), MAX_COLUMNS - 1)
+            row = min(max(0, int(row)), MAX_ROWS - 1)
+        except (KeyError, TypeError, ValueError):
+            return False
+        if not self._probe():
+            return False
+
+        state = self._state
+        state.shadow = shadow
+        state.glyphs = glyphs
+        self._setGlyphChars(glyphChars)
+        state.displayControl = displayControl
+        state.displayMode = displayMode
+        state.shift = shift
+        state.col = col
+        state.row = row
+        state.backlight = tuple(backlight) if backlight is not None else None
+        state.needsRestore = False
+        state.checkpoint = _checkpointEntry(state)
+
+        # the flags and cursor may have been changed after the checkpoint
+        return self._writeStream([SPECIAL_COMMAND, LCD_ENTRYMODESET | displayMode,
+                                  SPECIAL_COMMAND, LCD_DISPLAYCONTROL | displayControl,
+                                  SPECIAL_COMMAND, LCD_SETDDRAMADDR | (col + _ROW_OFFSETS[row])])
+
+    @_synchronized
+    def restoreSnapshot(self, snapshot):
+        """!
+            Bring the screen back to a snapshot taken with snapshot(). Only what
+            differs from the snapshot is sent: changed custom characters, the
+            changed characters on the screen, and the mode flags, cursor and
+            backlight color if they changed. After showing a pop-up message,
+            this costs about as many bytes as the pop-up covered.
+
+            @param Snapshot snapshot: The snapshot to restore
+
+            @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        state = self._state
+        result = True
+
+        # custom characters first, the text may use them
+        for location in range(8):
+            if snapshot.glyphs[location] is not None and snapshot.glyphs[location] != state.glyphs[location]:
+                result = self.createChar(location, snapshot.glyphs[location]) and result
+        self._setGlyphChars(snapshot.glyphChars)
+
+        data = []
+        runs = self._diffText(snapshot.shadow, data)
+
+        if snapshot.displayMode != state.displayMode:
+            data.extend((SPECIAL_COMMAND, LCD_ENTRYMODESET | snapshot.displayMode))
+        if snapshot.displayControl != state.displayControl:
+            data.extend((SPECIAL_COMMAND, LCD_DISPLAYCONTROL | snapshot.displayControl))
+
+        # scroll by the shorter way round the 40 character display line
+        shift = (snapshot.shift - state.shift) % 40
+        if shift <= 20:
+            data.extend((SPECIAL_COMMAND, LCD_CURSORSHIFT | LCD_DISPLAYMOVE | LCD_MOVELEFT) * shift)
+        else:
+            data.extend((SPECIAL_COMMAND, LCD_CURSORSHIFT | LCD_DISPLAYMOVE | LCD_MOVERIGHT) * (40 - shift))
+
+        if data or snapshot.col != state.col or snapshot.row != state.row:
+            data.extend((SPECIAL_COMMAND, LCD_SETDDRAMADDR | (snapshot.col + _ROW_OFFSETS[snapshot.row])))
+
+        backlight = snapshot.backlight is not None and snapshot.backlight != state.backlight
+        if backlight:
+            data.extend((SETTING_COMMAND, SET_RGB_COMMAND))
+            data.extend(snapshot.backlight)
+
+        # The state is changed before the stream is sent, so a restore() in
+        # resilient mode replays the snapshot. If the stream fails the flags
+        # are put back and the changed cells marked unknown, so the next
+        # restoreSnapshot() sends them again.
+        previous = (state.displayMode, state.displayControl, state.shift, state.backlight)
+        self._commitRuns(snapshot.shadow, runs)
+        state.displayMode = snapshot.displayMode
+        state.displayControl = snapshot.displayControl
+        state.shift = snapshot.shift
+        state.col = snapshot.col
+        state.row = snapshot.row
+        if backlight:
+            state.backlight = snapshot.backlight
+
+        sent = False
+        try:
+            sent = self._writeStream(data)
+        finally:
+            if not sent:
+                self._lostRuns(runs)
+                state.displayMode, state.displayControl, state.shift, state.backlight = previous
+        return sent and result
+
+    @_synchronized
+    def defineGlyph(self, char, charmap):
+        """!
+            Define the custom character bitmap used to print a character that
+            is missing from the display character ROM. The bitmap is loaded into
+            a free custom character location when the character is printed.
+
+            @param string char: The character, example: "\u00e5"
+            @param list of int charmap: byte array for character, as for createChar()
+        """
+        state = self._state
+        state.font[char] = list(charmap[:8])
+        if state.charmap is not None and ord(char) not in _ROM_CHARMAP:
+            state.charmap.pop(ord(char), None)
+
+    def enableThreadSafeMode(self):
+        """!
+            Enable thread-safe mode. Each method runs while holding a lock for
+            this device, so commands and display state updates from different
+            threads are never interleaved, and all writes go through a single
+            writer queue for the I2C bus, shared with every other thread-safe
+            device on the same bus.
+
+            @return **bool** Returns True if thread-safe mode was enabled, or False
+                    if this platform does not support threads.
+        """
+        try:
+            import threading
+        except ImportError:
+            return False
+        i2c = self._driver()
+        if i2c is None:
+            return False
+        if self._state.lock is None:
+            self._state.lock = threading.RLock()
+        with self._state.lock:
+            self._state.busQueue = _getBusQueue(i2c)
+        return True
+
+    def atomic(self):
+        """!
+            Get a context manager that holds the device lock, so a sequence of
+            calls is not interleaved with calls from other threads. Example:
+
+                with myLCD.atomic():
+                    myLCD.setCursor(0, 1)
+                    myLCD.print("Temp: 21C")
+
+            @return A context manager - the device lock in thread-safe mode,
+                    otherwise one that does nothing.
+        """
+        state = self._state
+        return state.lock if state.lock is not None else _NO_LOCK
+
+    def disableThreadSafeMode(self):
+        """!
+            Disable thread-safe mode. Writes go straight to the I2C driver again.
+        """
+        lock = self._state.lock
+        if lock is None:
+            return
+        with lock:
+            self._state.busQueue = None
+            self._state.lock = None
+
+    def enableBusLock(self, path = _BUS_LOCK_FILE):
+        """!
+            Enable the bus lock, shared with other processes through a lock
+            file. Each I2C write to the display holds it, so the writes are
+            never interleaved with traffic from other processes that use the
+            same lock file - see getBusLock(). The pauses after commands are
+            waited with the lock released, so other processes can use the bus
+            meanwhile. Use busLockStats() to see how long the lock is held and
+            waited for.
+
+            The lock keeps the bus transactions apart, not the screen contents:
+            to share one display between processes, use qwiic_serlcd_daemon.
+
+            @param string path: The lock file, the same for every process using the bus
+
+            @return **bool** Returns True if the bus lock was enabled, False if file locks aren't available.
+        """
+        lock = getBusLock(path)
+        if lock is None:
+            return False
+        self._state.busLock = lock
+        return True
+
+    def disableBusLock(self):
+        """!
+            Disable the bus lock.
+        """
+        self._state.busLock = None
+
+    def busLockStats(self):
+        """!
+            @return **dict** Number of times the bus lock was taken, and the total and longest
+                    time it was waited for and held, in seconds - or None if it isn't enabled.
+                    The statistics cover every display using the same lock file.
+        """
+        if self._state.busLock is None:
+            return None
+        return self._state.busLock.stats()
+
+    def enableSettingsCache(self, path = None, interval = _EEPROM_INTERVAL):
+        """!
+            Enable the settings cache. The settings the display keeps in its
+            EEPROM - contrast, backlight, splash screen and system messages -
+            are saved in a small file on the host when they are written, and
+            writing a value the display has already is skipped, with its
+            pauses. Programs that set up the display at every start then start
+            faster and don't wear the EEPROM. The settings are kept for each
+            address, and each bus if the I2C driver tells its bus number.
+            EEPROM writes that are sent, including saveSplash() and
+            setAddress(), are spaced by at least the interval (outside batch
+            mode).
+
+            If the settings are changed by other means, such as another program
+            without the cache or a hardware reset of the display, call
+            forgetSettings() so they are written again.
+
+            @param string path: The settings file, if not the default - the QWIIC_SERLCD_SETTINGS environment variable or ~/.qwiic_serlcd_settings.json
+            @param float interval: Shortest time between EEPROM writes, in seconds
+        """
+        self._state.settingsPath = path if path is not None else _hostPath(_SETTINGS_VARIABLE, _SETTINGS_FILE)
+        self._state.eepromInterval = max(0.0, interval)
+
+    def disableSettingsCache(self):
+        """!
+            Disable the settings cache. Every setting is written again.
+        """
+        self._state.settingsPath = None
+
+    def forgetSettings(self):
+        """!
+            Forget the saved settings of this display, so the next value of
+            each setting is written to the display.
+        """
+        path = self._state.settingsPath
+        if path is None:
+            return
+        if _readSettings(path).pop(_deviceKey(self._bus, self.address), None) is not None:
+            _writeSettings(path)
+
+    def _checkSetting(self, key = None, value = None):
+        """!
+            With the settings cache enabled, check whether the display has a
+            value of a setting in its EEPROM already. If it doesn't, wait until
+            the next EEPROM write is allowed.
+
+            @param string key: Name of the setting, or None for a write that is never skipped
+            @param value: The new value of the setting
+
+            @return **bool** Returns True if the write can be skipped, otherwise False.
+        """
+        state = self._state
+        if state.settingsPath is None:
+            return False
+        if key is not None:
+            saved = _readSettings(state.settingsPath).get(_deviceKey(self._bus, self.address))
+            if saved and saved.get(key) == value:
+                return True
+        if state.batch is None and state.eepromWrite is not None:
+            wait = state.eepromWrite + state.eepromInterval - time.time()
+            if wait > 0:
+                time.sleep(wait)
+        return False
+
+    def _settingWritten(self, key, value, result):
+        """!
+            With the settings cache enabled, save the value of a setting written
+            to the display's EEPROM. If the write failed, the setting is forgotten.
+            In batch mode nothing is sent yet, so the setting is saved by endBatch().
+
+            @param string key: Name of the setting, or None for a write that isn't saved
+            @param value: The value written
+            @param bool result: The result of the write
+
+            @return **bool** The result of the write
+        """
+        state = self._state
+        if state.settingsPath is None:
+            return result
+        state.eepromWrite = time.time()
+        if key is not None:
+            if state.batch is not None:
+                state.batchSettings.append((key, value))
+            else:
+                self._saveSetting(key, value, result)
+        return result
+
+    def _saveSetting(self, key, value, result):
+        """!
+            Save the value of a setting in the settings cache file, or forget
+            the setting if its write failed.
+
+            @param string key: Name of the setting
+            @param value: The value written
+            @param bool result: The result of the write
+        """
+        path = self._state.settingsPath
+        if path is None:
+            return
+        settings = _readSettings(path)
+        name = _deviceKey(self._bus, self.address)
+        saved = settings.get(name)
+        if saved is None:
+            saved = settings[name] = {}
+        if result:
+            saved[key] = value
+        else:
+            saved.pop(key, None)
+        _writeSettings(path)
+
+    def enableResilientMode(self, retries = 3, retry_delay = 0.01, max_retry_delay = 0.25):
+        """!
+            Enable resilient mode. Failed I2C writes are retried with an
+            exponential backoff, and if the display stops responding and then
+            comes back (for example after a brown-out) the cached display state
+            is replayed with restore().
+
+            @param int retries: Number of times a failed write is retried
+            @param float retry_delay: Delay before the first retry, in seconds
+            @param float max_retry_delay: Upper bound for the delay between retries, in seconds
+        """
+        self._retries = max(0, retries)
+        self._retryDelay = retry_delay
+        self._maxRetryDelay = max_retry_delay
+
+    def disableResilientMode(self):
+        """!
+            Disable resilient mode. Write failures are reported straight back
+            to the caller again.
+        """
+        self._retries = 0
+        self._state.needsRestore = False
+
+    @_synchronized
+    def restore(self):
+        """!
+            Replay the cached display state: custom characters, the text on the
+            screen, display mode flags, cursor position and backlight color.
+            Everything except the custom characters is sent as one batched
+            stream of block writes.
+
+            This is called automatically in resilient mode, but can also be
+            called directly when the application knows the display was reset.
+
+            @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        state = self._state
+        state.restoring = True
+        state.needsRestore = False
+        state.restores += 1
+        try:
+            result = self._write("writeByte", SETTING_COMMAND, CLEAR_COMMAND)
+            self._pause(self._writeDelay)
+
+            # the display stores custom characters in EEPROM, so pace each one
+            for location in range(8):
+                if result and state.glyphs[location] is not None:
+                    block = [CREATE_CHAR_COMMAND + location] + list(state.glyphs[location])
+                    result = self._write("writeBlock", SETTING_COMMAND, block)
+                    self._pause(self._settingDelay)
+
+            # Text is written left to right, before the real entry mode is set.
+            # Leading and trailing blanks are skipped - the screen was just cleared.
+            data = [SPECIAL_COMMAND, LCD_ENTRYMODESET | LCD_ENTRYLEFT]
+            for row in range(MAX_ROWS):
+                line = state.shadow[row]
+                first = 0
+                last = MAX_COLUMNS
+                while first < last and line[first] == 0x20:
+                    first += 1
+                while last > first and line[last - 1] == 0x20:
+                    last -= 1
+                if first == last:
+                    continue
+                data.append(SPECIAL_COMMAND)
+                data.append(LCD_SETDDRAMADDR | (first + _ROW_OFFSETS[row]))
+                for code in line[first:last]:
+                    if code < 8:
+                        data.append(SETTING_COMMAND)
+                        data.append(WRITE_CHAR_COMMAND + code)
+                    else:
+                        data.append(code)
+
+            data.extend((SPECIAL_COMMAND, LCD_ENTRYMODESET | state.displayMode))
+            data.extend((SPECIAL_COMMAND, LCD_DISPLAYCONTROL | state.displayControl))
+
+            # re-apply any display shift, in whichever direction is shorter
+            if state.shift <= 20:
+                data.extend((SPECIAL_COMMAND, LCD_CURSORSHIFT | LCD_DISPLAYMOVE | LCD_MOVELEFT) * state.shift)
+            else:
+                data.extend((SPECIAL_COMMAND, LCD_CURSORSHIFT | LCD_DISPLAYMOVE | LCD_MOVERIGHT) * (40 - state.shift))
+
+            data.extend((SPECIAL_COMMAND, LCD_SETDDRAMADDR | (state.col + _ROW_OFFSETS[state.row])))
+
+            if state.backlight is not None:
+                data.extend((SETTING_COMMAND, SET_RGB_COMMAND))
+                data.extend(state.backlight)
+
+            if result:
+                result = self._writeStream(data)
+            if result:
+                state.unknown.clear()
+        finally:
+            state.restoring = False
+
+        return result
+
+    def enableVerification(self, threshold = 64):
+        """!
+            Enable verification mode. After each write of at least threshold
+            bytes - batches, restoreSnapshot(), long strings - the display is
+            checked to still respond. The display can't report dropped bytes,
+            so the check is that it acknowledges its address.
+
+            If it doesn't, the pauses after writes are doubled and the block
+            writes made smaller, and once the display responds again the screen
+            is redrawn from the cached display state. After a run of good
+            checks the pacing steps back towards the timing in use when this
+            was called, so the slower pacing only lasts while problems are seen.
+
+            @param int threshold: Smallest write, in bytes, checked afterwards
+        """
+        self._verifyThreshold = max(1, threshold)
+        self._verifyTiming = self.getTiming()
+        self._verifiedWrites = 0
+
+    def disableVerification(self):
+        """!
+            Disable verification mode. The timing in use when verification was
+            enabled is restored.
+        """
+        if self._verifyThreshold is None:
+            return
+        self._verifyThreshold = None
+        self.setTiming(**self._verifyTiming)
+
+    def loadTimingProfile(self, path = None):
+        """!
+            Load the timing for this display from a timing profile written by
+            qwiic_serlcd_calibrate: the pauses after writes and settings, and
+            the size of and pause after block writes. This is called when the
+            object is created, with the profile in the QWIIC_SERLCD_TIMING
+            environment variable or ~/.qwiic_serlcd_timing.json.
+
+            @param string path: The timing profile file, if not the default
+
+            @return **bool** Returns True if a timing for the display was found, otherwise False.
+        """
+        profile = _readTimingProfile(path if path is not None else _timingProfilePath())
+        timing = profile.get(_deviceKey(self._bus, self.address), profile.get("default"))
+        if not timing:
+            return False
+        self.setTiming(timing.get("write_delay"), timing.get("setting_delay"),
+                       timing.get("block_size"), timing.get("block_delay"))
+        return True
+
+    def setTiming(self, write_delay = None, setting_delay = None, block_size = None, block_delay = None):
+        """!
+            Set the timing used for this display. Values not given are kept.
+
+            @param float write_delay: Pause after each character printed and after short commands such as clearScreen(), in seconds
+            @param float setting_delay: Pause after display commands and settings such as contrast, backlight and custom characters, in seconds
+            @param int block_size: The largest number of bytes sent in one I2C write (1-32)
+            @param float block_delay: Pause after each block write, in seconds
+        """
+        if write_delay is not None:
+            self._writeDelay = max(0.0, write_delay)
+        if setting_delay is not None:
+            self._settingDelay = max(0.0, setting_delay)
+        if block_size is not None:
+            self._blockSize = min(max(1, int(block_size)), _MAX_BLOCK_SIZE)
+        if block_delay is not None:
+            self._blockDelay = max(0.0, block_delay)
+
+    def getTiming(self):
+        """!
+            @return **dict** The timing used for this display, in the form of a timing profile entry
+        """
+        return {"write_delay": self._writeDelay, "setting_delay": self._settingDelay,
+                "block_size": self._blockSize, "block_delay": self._blockDelay}
+
+    @_synchronized
+    def beginBatch(self):
+        """!
+            Start batch mode. Until endBatch(), writes are collected instead of
+            sent, and the methods return True. endBatch() optimises the
+            collected commands and sends them in as few I2C writes as possible:
+            commands overwritten later in the batch are dropped (a noDisplay()
+            followed by display(), repeated setContrast() calls), cursor moves
+            are merged into one, and characters known to be on the display
+            already, such as spaces printed after clearScreen(), are skipped.
+
+            Batches can be nested - the outermost endBatch() sends the writes.
+            In thread-safe mode, use batch() to keep other threads out.
+        """
+        state = self._state
+        if state.batch is None:
+            state.batch = []
+            state.batchStart = (state.displayControl, state.displayMode)
+        state.batchDepth += 1
+
+    @_synchronized
+    def endBatch(self):
+        """!
+            End batch mode, and send the optimised writes of the batch.
+
+            @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        state = self._state
+        if state.batch is None:
+            return True
+        state.batchDepth -= 1
+        if state.batchDepth > 0:
+            return True
+
+        batch = state.batch
+        settings = state.batchSettings
+        state.batch = None
+        state.batchSettings = []
+        result = False
+        try:
+            for data, pause in _optimizeBatch(batch, *state.batchStart):
+                if not self._writeStream(data):
+                    return False
+                if pause:
+                    time.sleep(pause)
+            result = True
+        finally:
+            # the settings cache only holds what the display received
+            for key, value in settings:
+                self._saveSetting(key, value, result)
+        return True
+
+    def batch(self):
+        """!
+            Get a context manager for batch mode, which also holds the device
+            lock in thread-safe mode. Example:
+
+                with myLCD.batch():
+                    myLCD.clearScreen()
+                    myLCD.print("Temp: 21C")
+                    myLCD.setCursor(0, 1)
+                    myLCD.print("Humidity: 40%")
+
+            @return A context manager that calls beginBatch() and endBatch()
+        """
+        return _Batch(self)
+
+    def _write(self, method, *args):
+        """!
+            Perform one I2C write transaction. In resilient mode a failed write
+            is retried with a bounded exponential backoff, and once a display
+            that failed to respond is reachable again, restore() is called.
+
+            @param string method: Name of the I2C driver write method
+            @param args: Arguments for the driver method, after the device address
+
+            @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        batch = self._state.batch
+        if batch is not None:
+            if method == "writeCommand":
+                batch.append([[args[0]], 0.0])
+            elif method == "writeBlock":
+                batch.append([[args[0]] + list(args[1]), 0.0])
+            else:
+                batch.append([list(args), 0.0])
+            return True
+
+        if not self._retries:
+            return self._transfer(method, args) is not False
+
+        delay = self._retryDelay
+        for attempt in range(self._retries + 1):
+            if attempt:
+                time.sleep(delay)
+                delay = min(delay * 2, self._maxRetryDelay)
+            try:
+                if self._transfer(method, args) is not False:
+                    break
+            except OSError:
+                pass
+        else:
+            self._state.needsRestore = True
+            return False
+
+        # A display that stopped acknowledging may have reset and lost its state
+        if (attempt or self._state.needsRestore) and not self._state.restoring:
+            self.restore()
+        return True
+
+    def _transfer(self, method, args):
+        """!
+            Call an I2C driver method for this device, holding the bus lock
+            if it is enabled. In thread-safe mode the call is handed to the
+            writer queue of the bus.
+
+            @param string method: Name of the I2C driver method
+            @param tuple args: Arguments for the driver method, after the device address
+
+            @return The value returned by the driver method
+        """
+        state = self._state
+        if state.busLock is not None:
+            with state.busLock:
+                return self._call(method, args)
+        return self._call(method, args)
+
+    def _call(self, method, args):
+        """!
+            Call an I2C driver method for this device, through the writer
+            queue of the bus in thread-safe mode.
+
+            @param string method: Name of the I2C driver method
+            @param tuple args: Arguments for the driver method, after the device address
+
+            @return The value returned by the driver method
+        """
+        if self._state.busQueue is not None:
+            return self._state.busQueue.submit(method, (self.address,) + args)
+        i2c = self._i2c
+        if i2c is None:
+            i2c = self._driver()
+            if i2c is None:
+                return False
+        return getattr(i2c, method)(self.address, *args)
+
+    def _driver(self):
+        """!
+            Get the I2C driver, loading the driver for this platform on first use.
+
+            @return The I2C driver object, or None if no driver could be loaded.
+        """
+        if self._i2c is None:
+            import qwiic_i2c
+            self._i2c = qwiic_i2c.getI2CDriver()
+            if self._i2c is None:
+                print("Unable to load I2C driver for this platform.")
+        return self._i2c
+
+    def _writeStream(self, data, delay = None):
+        """!
+            Send a stream of raw bytes to the display in as few I2C writes
+            as possible.
+
+            @param list of int data: The bytes to send
+            @param float delay: Delay after each I2C write, in seconds, if not the block delay of the timing profile
+
+            @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        if delay is None:
+            delay = self._blockDelay
+        size = self._blockSize
+        restores = self._state.restores
+        for i in range(0, len(data), size):
+            chunk = data[i:i + size]
+            if len(chunk) == 1:
+                result = self._write("writeCommand", chunk[0])
+            else:
+                result = self._write("writeBlock", chunk[0], list(chunk[1:]))
+            if not result:
+                return False
+            self._pause(delay)
+            if self._state.restores != restores:
+                # resilient mode replayed the cached state, which already
+                # includes the rest of the stream - and the cursor moved
+                return True
+        if self._verifyThreshold is not None and len(data) >= self._verifyThreshold:
+            return self._verify()
+        return True
+
+    def _verify(self):
+        """!
+            Check that the display still responds after a large write. If it
+            doesn't, the pacing is made slower, and once the display responds
+            again the cached display state is replayed with restore(), as bytes
+            may have been lost. After enough good checks in a row the pacing
+            steps back towards the timing it had when verification was enabled.
+
+            @return **bool** Returns True if the display responded, otherwise False.
+        """
+        state = self._state
+        if state.batch is not None or state.restoring:
+            return True
+        if self._probe():
+            self._verifiedWrites += 1
+            if self._verifiedWrites >= _VERIFY_RELAX_AFTER:
+                self._verifiedWrites = 0
+                timing = self._verifyTiming
+                self.setTiming(max(timing["write_delay"], self._writeDelay / 2),
+                               None,
+                               min(timing["block_size"], self._blockSize * 2),
+                               max(timing["block_delay"], self._blockDelay / 2))
+            return True
+
+        # slow down - a failure never makes the timing faster than it is -
+        # and wait for the display to respond again
+        self._verifiedWrites = 0
+        self.setTiming(max(self._writeDelay, min(max(self._writeDelay * 2, 0.002), 0.05)), None,
+                       min(self._blockSize, max(self._blockSize // 2, 8)),
+                       max(self._blockDelay, min(max(self._blockDelay * 2, 0.002), 0.05)))
+        delay = self._settingDelay
+        for attempt in range(_VERIFY_RETRIES):
+            time.sleep(delay)
+            delay *= 2
+            if self._probe():
+                self.restore()
+                break
+        else:
+            state.needsRestore = True
+        return False
+
+    def _probe(self):
+        """!
+            Check whether the display acknowledges its address. The display has
+            no status that can be read back, so this is all it can report.
+
+            @return **bool** Returns True if the display acknowledged, otherwise False.
+        """
+        try:
+            return bool(self._transfer("isDeviceConnected", ()))
+        except OSError:
+            return False
+
+    def _pause(self, seconds):
+        """!
+            Give the display time to process a command. In batch mode the
+            pause is recorded with the last write instead, see endBatch().
+
+            @param float seconds: The pause, in seconds
+        """
+        batch = self._state.batch
+        if batch is None:
+            time.sleep(seconds)
+        elif batch:
+            batch[-1][1] = max(batch[-1][1], seconds)
+
+    def _diffText(self, rows, data):
+        """!
+            Append the commands that change the cached screen contents to new
+            contents to a list of bytes. Unchanged characters are skipped with
+            a cursor move, unless the gap is shorter than the move, and cells a
+            failed write left unknown are always written. If anything is
+            written the entry mode is set to left to right, without autoscroll,
+            for the writes and put back after them. The cached contents aren't
+            changed - send the commands with _sendRuns().
+
+            @param list of bytes rows: The new display character codes of each row
+            @param list of int data: List the commands are appended to
+
+            @return **list of tuple** The runs written, as for _writeRuns()
+        """
+        state = self._state
+        unknown = state.unknown
+        runs = []
+        for r in range(MAX_ROWS):
+            line = state.shadow[r]
+            new = rows[r]
+            if line == new and not unknown:
+                continue
+            c = 0
+            while c < MAX_COLUMNS:
+                if line[c] == new[c] and (r, c) not in unknown:
+                    c += 1
+                    continue
+
+                # a changed character - find the end of the run of changes
+                end = c + 1
+                i = end
+                while i < MAX_COLUMNS and i - end <= _MAX_DIFF_GAP:
+                    if line[i] != new[i] or (r, i) in unknown:
+                        end = i + 1
+                    i += 1
+                runs.append((r, c, end))
+                c = end
+
+        self._writeRuns(rows, runs, data)
+        return runs
+
+    def _writeRuns(self, rows, runs, data):
+        """!
+            Append the commands that write runs of new screen contents to a
+            list of bytes. The runs are found by _diffText(), or by a caller
+            that compares screens another way. The cached contents aren't
+            changed - send the commands with _sendRuns().
+
+            @param list of bytes rows: The new display character codes of each row
+            @param list of tuple runs: The row, first column and end column of each run, in order
+            @param list of int data: List the commands are appended to
+        """
+        state = self._state
+        col = None
+        row = None
+        for r, c, end in runs:
+            new = rows[r]
+            if col is None and state.displayMode != LCD_ENTRYLEFT:
+                data.extend((SPECIAL_COMMAND, LCD_ENTRYMODESET | LCD_ENTRYLEFT))
+            if c != col or r != row:
+                data.extend((SPECIAL_COMMAND, LCD_SETDDRAMADDR | (c + _ROW_OFFSETS[r])))
+            for code in new[c:end]:
+                if code < 8:
+                    data.extend((SETTING_COMMAND, WRITE_CHAR_COMMAND + code))
+                else:
+                    data.append(code)
+            col = end
+            row = r
+        if col is not None and state.displayMode != LCD_ENTRYLEFT:
+            data.extend((SPECIAL_COMMAND, LCD_ENTRYMODESET | state.displayMode))
+
+    def _sendRuns(self, rows, runs, data):
+        """!
+            Send the commands built by _writeRuns() for runs of new screen
+            contents. The cached contents are updated first, so a restore()
+            in resilient mode replays them. If the stream fails, the cells of
+            the runs are marked unknown, so the next diff writes them again.
+
+            @param list of bytes rows: The new display character codes of each row
+            @param list of tuple runs: The runs written, as for _writeRuns()
+            @param list of int data: The commands built by _writeRuns()
+
+            @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        self._commitRuns(rows, runs)
+        sent = False
+        try:
+            sent = self._writeStream(data)
+        finally:
+            if not sent:
+                self._lostRuns(runs)
+        return sent
+
+    def _commitRuns(self, rows, runs):
+        """!
+            Record runs of new screen contents in the cached contents, and
+            leave the cached cursor after the last run, as the display does.
+
+            @param list of bytes rows: The new display character codes of each row
+            @param list of tuple runs: The runs written, as for _writeRuns()
+        """
+        if not runs:
+            return
+        state = self._state
+        unknown = state.unknown
+        for r, c, end in runs:
+            state.shadow[r][c:end] = rows[r][c:end]
+            if unknown:
+                for col in range(c, end):
+                    unknown.discard((r, col))
+        r, c, end = runs[-1]
+        state.col = end - 1
+        state.row = r
+        self._shadowMove(1)
+
+    def _lostRuns(self, runs):
+        """!
+            Mark the cells of runs whose write failed as unknown, as some of
+            the bytes may have reached the display.
+
+            @param list of tuple runs: The runs written, as for _writeRuns()
+        """
+        unknown = self._state.unknown
+        for r, c, end in runs:
+            for col in range(c, end):
+                unknown.add((r, col))
+
+    def _setGlyphChars(self, glyphChars):
+        """!
+            Set which characters are automatically loaded in each custom
+            character location, and update the translation table to match.
+
+            @param list glyphChars: The character in each location, or None
+        """
+        state = self._state
+        for location in range(8):
+            char = state.glyphChars[location]
+            if char != glyphChars[location]:
+                if char is not None and state.charmap is not None:
+                    state.charmap.pop(ord(char), None)
+                char = glyphChars[location]
+                state.glyphChars[location] = char
+                if char is not None:
+                    if state.charmap is None:
+                        state.charmap = _Charmap()
+                    state.charmap[ord(char)] = location
+
+    def _encode(self, string):
+        """!
+            Translate a string to display character codes, using the cached
+            translation table of the display.
+
+            @param string string: The string to translate
+
+            @return **bytes** The display character codes
+        """
+        state = self._state
+        if state.charmap is None:
+            state.charmap = _Charmap()
+        return _encodeText(string, state.charmap, self)
+
+    def _glyphFor(self, code, text):
+        """!
+            Find the display character code for a character missing from the
+            translation table. If a bitmap is known for it, it is loaded into a
+            custom character location that isn't in use.
+
+            @param int code: The Unicode code point of the character
+            @param string text: The string being printed, whose characters must keep their locations
+
+            @return **int** The display character code
+        """
+        state = self._state
+        char = chr(code)
+        bitmap = state.font.get(char, _GLYPH_FONT.get(char))
+        if bitmap is None:
+            state.charmap[code] = _REPLACEMENT_CODE
+            return _REPLACEMENT_CODE
+
+        # Use a free location, or one holding an automatically loaded character
+        # that is neither on the screen nor in the string being printed
+        location = None
+        for i in range(8):
+            if state.glyphs[i] is None:
+                location = i
+                break
+        else:
+            for i in range(8):
+                used = state.glyphChars[i]
+                if used is None or used in text:
+                    continue
+                for line in state.shadow:
+                    if i in line or i + 8 in line: # codes 8-15 show locations 0-7 again
+                        break
+                else:
+                    location = i
+                    break
+        if location is None:
+            return _REPLACEMENT_CODE # not cached, a location may be free next time
+
+        if not self.createChar(location, bitmap):
+            return _REPLACEMENT_CODE # not cached, the upload may work next time
+        state.glyphChars[location] = char
+        state.charmap[code] = location
+        return location
+
+    def _shadowClear(self):
+        """!
+            Blank the cached screen contents and home the cached cursor.
+        """
+        state = self._state
+        for line in state.shadow:
+            line[:] = b" " * MAX_COLUMNS
+        state.unknown.clear()
+        state.col = 0
+        state.row = 0
+        state.shift = 0
+
+    def _shadowPut(self, code):
+        """!
+            Record a character written at the cursor in the cached screen
+            contents, and advance the cached cursor.
+
+            @param int code: The character code written to the display
+        """
+        state = self._state
+        state.shadow[state.row][state.col] = code & 0xFF
+        step = 1 if state.displayMode & LCD_ENTRYLEFT else -1
+        if state.displayMode & LCD_ENTRYSHIFTINCREMENT:
+            state.shift = (state.shift + step) % 40
+        self._shadowMove(step)
+
+    def _shadowMove(self, count):
+        """!
+            Move the cached cursor, wrapping from the end of one row to the
+            start of the next.
+
+            @param int count: Number of character spaces to move (negative moves left)
+        """
+        state = self._state
+        pos = (state.row * MAX_COLUMNS + state.col + count) % (MAX_ROWS * MAX_COLUMNS)
+        state.row = pos // MAX_COLUMNS
+        state.col = pos % MAX_COLUMNS
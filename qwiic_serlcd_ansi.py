@@ -0,0 +1,447 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_ansi.py
+#
+# ANSI terminal interpreter for the SparkFun Serial LCDs (QWIIC)
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_ansi
+=================
+ANSI/VT100 terminal for the SparkFun SerLCD QWIIC products.
+
+The output of command line tools - text with ANSI escape sequences for cursor
+moves, clears and colors - is interpreted into a screen buffer, and each
+flush sends only the characters that differ from the display. The text color
+set with SGR sequences becomes the backlight color.
+
+    some_tool | python qwiic_serlcd_ansi.py
+
+Supported: CR, LF, BS, TAB; cursor moves (CUU, CUD, CUF, CUB, CNL, CPL, CHA,
+CUP, HVP, VPA); erase (ED, EL, ECH); save and restore cursor; show and hide
+cursor; reset (RIS); SGR foreground colors, including 256 colors and RGB.
+Other sequences are skipped.
+"""
+#-----------------------------------------------------------------------------
+import sys
+import time
+import qwiic_serlcd
+
+_ESC = "\x1b"
+
+# Parser states
+_TEXT = 0
+_ESCAPE = 1  # after ESC
+_CSI = 2     # in a control sequence, ESC [
+_STRING = 3  # in an OSC, DCS or other string, until BEL or ESC backslash
+_CHARSET = 4 # after ESC ( or similar, one more character
+
+# The backlight color of each of the 8 ANSI colors, and their bright versions
+_COLORS = [(0, 0, 0), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+           (0, 0, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255)]
+_BRIGHT_COLORS = [(128, 128, 128), (255, 64, 64), (64, 255, 64), (255, 255, 128),
+                  (64, 64, 255), (255, 64, 255), (64, 255, 255), (255, 255, 255)]
+
+def _color256(index):
+    """!
+    @param int index: A color of the 256 color palette
+    @return **tuple** The (r, g, b) color
+    """
+    if index < 8:
+        return _COLORS[index]
+    if index < 16:
+        return _BRIGHT_COLORS[index - 8]
+    if index < 232:
+        index -= 16
+        levels = [0, 95, 135, 175, 215, 255]
+        return (levels[index // 36], levels[index // 6 % 6], levels[index % 6])
+    level = 8 + 10 * (index - 232)
+    return (level, level, level)
+
+class AnsiTerminal(object):
+    """!
+    A terminal that draws on a QwiicSerlcd display. write() interprets text
+    and escape sequences into the screen buffer, flush() sends the changes.
+    """
+    def __init__(self, lcd, columns = qwiic_serlcd.MAX_COLUMNS, rows = qwiic_serlcd.MAX_ROWS,
+                 color = (255, 255, 255)):
+        """!
+        @param QwiicSerlcd lcd: The display to draw on
+        @param int columns: Number of columns of the display
+        @param int rows: Number of rows of the display
+        @param tuple color: The (r, g, b) backlight color for the default text color, or None to leave the backlight alone
+
+        @return **Object** The AnsiTerminal object.
+        """
+        self.lcd = lcd
+        self.columns = min(columns, qwiic_serlcd.MAX_COLUMNS)
+        self.rows = min(rows, qwiic_serlcd.MAX_ROWS)
+        self.defaultColor = tuple(color) if color is not None else None
+        self._decoder = None
+        self.reset()
+
+    def reset(self):
+        """!
+        Blank the screen buffer, and reset the cursor and the color. Sent at the next flush().
+        """
+        ## The text of each row, a list of characters
+        self.screen = [[" "] * self.columns for i in range(self.rows)]
+        self.col = 0
+        self.row = 0
+        self.cursorVisible = False
+        self.color = self.defaultColor
+        self._saved = (0, 0)
+        self._wrap = False # the last column was written - the next character goes on the next row
+        self._state = _TEXT
+        self._params = ""
+
+    def write(self, data):
+        """!
+        Interpret text and escape sequences into the screen buffer. Nothing is
+        sent to the display until flush().
+
+        @param data: The text, a string or UTF-8 bytes
+        """
+        if isinstance(data, (bytes, bytearray)):
+            data = self._decode(data)
+        for char in data:
+            state = self._state
+            if state == _TEXT:
+                if char == _ESC:
+                    self._state = _ESCAPE
+                elif char >= " " and char != "\x7f":
+                    self._put(char)
+                else:
+                    self._control(char)
+            elif state == _ESCAPE:
+                self._escape(char)
+            elif state == _CSI:
+                if "0" <= char <= "?":
+                    self._params += char
+                elif "@" <= char <= "~":
+                    self._state = _TEXT
+                    self._csi(char, self._params)
+                elif char == _ESC:
+                    self._state = _ESCAPE
+                elif char < " ":
+                    self._control(char)
+                # intermediate characters are ignored
+            elif state == _STRING:
+                if char == "\x07":
+                    self._state = _TEXT
+                elif char == _ESC:
+                    self._state = _ESCAPE # the ESC of the ESC backslash ending the string
+            else: # _CHARSET
+                self._state = _TEXT
+
+    def flush(self):
+        """!
+        Send the changes since the last flush to the display: the changed
+        characters, the cursor, and the backlight color if it changed.
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        lcd = self.lcd
+        with lcd.atomic():
+            target = lcd.snapshot()
+            for row in range(self.rows):
+                line = bytearray(target.shadow[row])
+                line[:self.columns] = lcd._encode("".join(self.screen[row]))
+                target.shadow[row] = bytes(line)
+            if self.cursorVisible:
+                target.displayControl |= qwiic_serlcd.LCD_CURSORON
+            else:
+                target.displayControl &= ~qwiic_serlcd.LCD_CURSORON
+            target.col = min(self.col, self.columns - 1)
+            target.row = self.row
+            if self.color is not None:
+                target.backlight = self.color
+            return lcd.restoreSnapshot(target)
+
+    def _decode(self, data):
+        """!
+        @param bytes data: UTF-8 bytes, possibly ending in part of a character
+        @return **string** The characters, the rest is kept for the next call
+        """
+        if self._decoder is None:
+            try:
+                import codecs
+                self._decoder = codecs.getincrementaldecoder("utf-8")("replace").decode
+            except (ImportError, AttributeError): # MicroPython
+                self._decoder = lambda data: bytes(data).decode("utf-8")
+        return self._decoder(data)
+
+    def _put(self, char):
+        """!
+        Put a character at the cursor, and move the cursor right.
+
+        @param string char: The character
+        """
+        if self._wrap:
+            self._wrap = False
+            self.col = 0
+            self._lineFeed()
+        self.screen[self.row][self.col] = char
+        if self.col == self.columns - 1:
+            self._wrap = True
+        else:
+            self.col += 1
+
+    def _lineFeed(self):
+        """!
+        Move the cursor down a row, scrolling the screen up at the bottom.
+        """
+        if self.row < self.rows - 1:
+            self.row += 1
+        else:
+            self.screen.pop(0)
+            self.screen.append([" "] * self.columns)
+
+    def _moveTo(self, col, row):
+        """!
+        Move the cursor, keeping it on the screen.
+
+        @param int col: The column
+        @param int row: The row
+        """
+        self.col = min(max(0, col), self.columns - 1)
+        self.row = min(max(0, row), self.rows - 1)
+        self._wrap = False
+
+    def _erase(self, row, start, end):
+        """!
+        Blank part of a row.
+
+        @param int row: The row
+        @param int start: The first column
+        @param int end: The column after the last one
+        """
+        line = self.screen[row]
+        for col in range(max(0, start), min(end, self.columns)):
+            line[col] = " "
+
+    def _control(self, char):
+        """!
+        Carry out a control character.
+
+        @param string char: The control character
+        """
+        if char == "\n":
+            # there is no tty to add the carriage return
+            self.col = 0
+            self._wrap = False
+            self._lineFeed()
+        elif char == "\r":
+            self._moveTo(0, self.row)
+        elif char == "\b":
+            self._moveTo(self.col - 1, self.row)
+        elif char == "\t":
+            self._moveTo((self.col // 8 + 1) * 8, self.row)
+
+    def _escape(self, char):
+        """!
+        Carry out the character after ESC.
+
+        @param string char: The character
+        """
+        self._state = _TEXT
+        if char == "[":
+            self._state = _CSI
+            self._params = ""
+        elif char in "]PX^_":
+            self._state = _STRING
+        elif char in "()*+":
+            self._state = _CHARSET
+        elif char == "7":
+            self._saved = (self.col, self.row)
+        elif char == "8":
+            self._moveTo(*self._saved)
+        elif char == "c":
+            self.reset()
+        elif char == "D":
+            self._lineFeed()
+        elif char == "E":
+            self._control("\n")
+        elif char == "M":
+            if self.row > 0:
+                self.row -= 1
+            else:
+                self.screen.pop()
+                self.screen.insert(0, [" "] * self.columns)
+
+    def _csi(self, final, params):
+        """!
+        Carry out a control sequence.
+
+        @param string final: The final character of the sequence
+        @param string params: The parameter characters
+        """
+        private = params[:1] in ("?", ">", "<", "=")
+        values = []
+        for value in (params[1:] if private else params).replace(":", ";").split(";"):
+            try:
+                values.append(int(value))
+            except ValueError:
+                values.append(0)
+        count = max(1, values[0])
+
+        if private:
+            if final in "hl" and 25 in values:
+                self.cursorVisible = final == "h"
+        elif final == "A":
+            self._moveTo(self.col, self.row - count)
+        elif final == "B":
+            self._moveTo(self.col, self.row + count)
+        elif final == "C":
+            self._moveTo(self.col + count, self.row)
+        elif final == "D":
+            self._moveTo(self.col - count, self.row)
+        elif final == "E":
+            self._moveTo(0, self.row + count)
+        elif final == "F":
+            self._moveTo(0, self.row - count)
+        elif final == "G":
+            self._moveTo(count - 1, self.row)
+        elif final == "d":
+            self._moveTo(self.col, count - 1)
+        elif final in "Hf":
+            self._moveTo((max(1, values[1]) if len(values) > 1 else 1) - 1, count - 1)
+        elif final == "J":
+            if values[0] == 0:
+                self._erase(self.row, self.col, self.columns)
+                for row in range(self.row + 1, self.rows):
+                    self._erase(row, 0, self.columns)
+            elif values[0] == 1:
+                for row in range(self.row):
+                    self._erase(row, 0, self.columns)
+                self._erase(self.row, 0, self.col + 1)
+            else:
+                for row in range(self.rows):
+                    self._erase(row, 0, self.columns)
+        elif final == "K":
+            if values[0] == 0:
+                self._erase(self.row, self.col, self.columns)
+            elif values[0] == 1:
+                self._erase(self.row, 0, self.col + 1)
+            else:
+                self._erase(self.row, 0, self.columns)
+        elif final == "X":
+            self._erase(self.row, self.col, self.col + count)
+        elif final == "s":
+            self._saved = (self.col, self.row)
+        elif final == "u":
+            self._moveTo(*self._saved)
+        elif final == "m":
+            self._sgr(values)
+
+    def _sgr(self, values):
+        """!
+        Carry out the color settings of an SGR sequence - the text color
+        becomes the backlight color. Other attributes are ignored.
+
+        @param list of int values: The parameters of the sequence
+        """
+        i = 0
+        while i < len(values):
+            value = values[i]
+            if value == 0 or value == 39:
+                self.color = self.defaultColor
+            elif 30 <= value <= 37:
+                self.color = _COLORS[value - 30]
+            elif 90 <= value <= 97:
+                self.color = _BRIGHT_COLORS[value - 90]
+            elif value in (38, 48) and i + 1 < len(values):
+                # extended colors - the background color is skipped
+                if values[i + 1] == 5 and i + 2 < len(values):
+                    if value == 38:
+                        self.color = _color256(min(values[i + 2], 255))
+                    i += 2
+                elif values[i + 1] == 2 and i + 4 < len(values):
+                    if value == 38:
+                        self.color = tuple(min(level, 255) for level in values[i + 2:i + 5])
+                    i += 4
+            i += 1
+
+def main(argv):
+    """!
+    Show the standard input on a display, as a terminal.
+
+    @param list of string argv: The command line arguments
+    """
+    import argparse
+    import os
+    import select
+    parser = argparse.ArgumentParser(description="Show terminal output with ANSI escape sequences on a SerLCD display.")
+    parser.add_argument("--address", type=lambda value: int(value, 0), default=qwiic_serlcd.QwiicSerlcd.available_addresses[0],
+                        help="I2C address of the display")
+    parser.add_argument("--columns", type=int, default=qwiic_serlcd.MAX_COLUMNS, help="number of columns of the display")
+    parser.add_argument("--rows", type=int, default=qwiic_serlcd.MAX_ROWS, help="number of rows of the display")
+    parser.add_argument("--rate", type=float, default=20.0, help="maximum updates of the display per second")
+    args = parser.parse_args(argv)
+
+    lcd = qwiic_serlcd.QwiicSerlcd(args.address)
+    if not lcd.connected:
+        print("No Qwiic SerLCD at address 0x%02X. Please check your connection" % args.address, file=sys.stderr)
+        return 1
+    terminal = AnsiTerminal(lcd, args.columns, args.rows)
+
+    # flush when the input pauses, or at the maximum rate while it keeps coming
+    interval = 1.0 / args.rate
+    fd = sys.stdin.fileno()
+    flushed = 0.0
+    pending = False
+    while True:
+        timeout = max(0.0, flushed + interval - time.time()) if pending else None
+        if select.select([fd], [], [], timeout)[0]:
+            data = os.read(fd, 4096)
+            if not data:
+                break
+            terminal.write(data)
+            pending = True
+            if time.time() - flushed < interval:
+                continue
+        if pending:
+            terminal.flush()
+            flushed = time.time()
+            pending = False
+    terminal.flush()
+    return 0
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main(sys.argv[1:]))
+    except KeyboardInterrupt:
+        sys.exit(0)
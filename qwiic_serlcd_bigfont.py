@@ -0,0 +1,177 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_bigfont.py
+#
+# Big digit font for the SparkFun Serial LCDs (QWIIC)
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_bigfont
+====================
+Big digits for the SparkFun SerLCD QWIIC products.
+
+Digits 2 or 4 rows tall are drawn from a fixed set of eight block segment
+custom characters, loaded once. Each big character is a grid of segment
+characters and spaces, and redrawing sends only the cells that changed, so a
+big clock costs a few bytes a second.
+"""
+#-----------------------------------------------------------------------------
+
+# The segment custom characters, for locations 0-7
+_GLYPHS = [
+    [0x07, 0x0F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F], # 0 rounded upper left
+    [0x1F, 0x1F, 0x1F, 0x00, 0x00, 0x00, 0x00, 0x00], # 1 upper bar
+    [0x1C, 0x1E, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F], # 2 rounded upper right
+    [0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x0F, 0x07], # 3 rounded lower left
+    [0x00, 0x00, 0x00, 0x00, 0x00, 0x1F, 0x1F, 0x1F], # 4 lower bar
+    [0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1F, 0x1E, 0x1C], # 5 rounded lower right
+    [0x1F, 0x1F, 0x1F, 0x00, 0x00, 0x00, 0x1F, 0x1F], # 6 upper and lower bars
+    [0x1F, 0x00, 0x00, 0x00, 0x00, 0x1F, 0x1F, 0x1F], # 7 upper and lower bars, for the bottom half
+]
+
+_F = 0xFF # full block, in the character ROM
+_S = 0x20 # space
+_DOT = 0xA5 # middle dot, in the character ROM
+
+# The rows of segment character codes of each big character, 2 rows tall
+_FONT_2 = {
+    "0": ([0, 1, 2], [3, 4, 5]),
+    "1": ([1, 2, _S], [4, _F, 4]),
+    "2": ([6, 6, 2], [3, 7, 7]),
+    "3": ([6, 6, 2], [7, 7, 5]),
+    "4": ([3, 4, _F], [_S, _S, _F]),
+    "5": ([_F, 6, 6], [7, 7, 5]),
+    "6": ([0, 6, 6], [3, 7, 5]),
+    "7": ([1, 1, 2], [_S, _S, _F]),
+    "8": ([0, 6, 2], [3, 7, 5]),
+    "9": ([0, 6, 2], [_S, _S, _F]),
+    "-": ([4, 4, 4], [_S, _S, _S]),
+    ":": ([_DOT], [_DOT]),
+    ".": ([_S], [4]),
+    " ": ([_S, _S, _S], [_S, _S, _S]),
+}
+
+# The same, 4 rows tall
+_FONT_4 = {
+    "0": ([0, 1, 2], [_F, _S, _F], [_F, _S, _F], [3, 4, 5]),
+    "1": ([1, 2, _S], [_S, _F, _S], [_S, _F, _S], [4, _F, 4]),
+    "2": ([1, 1, 2], [4, 4, 5], [0, _S, _S], [3, 4, 4]),
+    "3": ([1, 1, 2], [_S, 4, _F], [_S, _S, _F], [4, 4, 5]),
+    "4": ([_F, _S, _F], [3, 4, _F], [_S, _S, _F], [_S, _S, _F]),
+    "5": ([_F, 1, 1], [3, 4, 4], [_S, _S, 2], [4, 4, 5]),
+    "6": ([0, 1, 1], [_F, 4, 4], [_F, _S, 2], [3, 4, 5]),
+    "7": ([1, 1, 2], [_S, _S, _F], [_S, _S, _F], [_S, _S, _F]),
+    "8": ([0, 1, 2], [3, 4, 5], [_F, _S, _F], [3, 4, 5]),
+    "9": ([0, 1, 2], [3, 4, _F], [_S, _S, _F], [4, 4, 5]),
+    "-": ([_S, _S, _S], [4, 4, 4], [_S, _S, _S], [_S, _S, _S]),
+    ":": ([_S], [_DOT], [_DOT], [_S]),
+    ".": ([_S], [_S], [_S], [4]),
+    " ": ([_S, _S, _S], [_S, _S, _S], [_S, _S, _S], [_S, _S, _S]),
+}
+
+class BigFont(object):
+    """!
+    Draws big digits on a QwiicSerlcd display. The font owns all eight custom
+    character locations while big characters are on the screen.
+    """
+    def __init__(self, lcd, height = 2, spacing = 1):
+        """!
+        @param QwiicSerlcd lcd: The display to draw on
+        @param int height: Height of the characters, 2 or 4 rows
+        @param int spacing: Number of blank columns between characters
+
+        @return **Object** The BigFont object.
+        """
+        self.lcd = lcd
+        self.height = 4 if height >= 4 else 2
+        self.spacing = spacing
+        self._font = _FONT_4 if self.height == 4 else _FONT_2
+
+    def load(self):
+        """!
+        Load the segment custom characters, if they aren't loaded already.
+        print() does this when needed.
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        loaded = self.lcd.snapshot().glyphs
+        result = True
+        for location in range(8):
+            if loaded[location] != _GLYPHS[location]:
+                result = self.lcd.createChar(location, _GLYPHS[location]) and result
+        return result
+
+    def width(self, text):
+        """!
+        @param string text: The text to draw
+        @return **int** Number of columns the text takes
+        """
+        columns = 0
+        for char in text:
+            columns += len(self._font.get(char, self._font[" "])[0]) + self.spacing
+        return max(0, columns - self.spacing)
+
+    def print(self, col, row, text):
+        """!
+        Draw text in big characters, with its top left corner at a position.
+        Only the cells that differ from the screen are sent, in one batch.
+        Characters other than digits, '-', ':', '.' and space are drawn as spaces.
+
+        @param int col: The column position (0-19)
+        @param int row: The row position of the top row (0-3)
+        @param string text: The text to draw, example: "12:45"
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        rows = [bytearray() for i in range(self.height)]
+        gap = bytearray(b" " * self.spacing)
+        for i in range(len(text)):
+            cells = self._font.get(text[i], self._font[" "])
+            for r in range(self.height):
+                if i:
+                    rows[r].extend(gap)
+                rows[r].extend(bytearray(cells[r]))
+
+        lcd = self.lcd
+        with lcd.atomic():
+            lcd.beginBatch()
+            try:
+                self.load()
+                for r in range(self.height):
+                    lcd.printAt(col, row + r, rows[r])
+            finally:
+                result = lcd.endBatch()
+        return result
@@ -0,0 +1,278 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_calibrate.py
+#
+# Timing calibration for the SparkFun Serial LCDs (QWIIC)
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_calibrate
+======================
+Timing calibration for the SparkFun SerLCD QWIIC products.
+
+The default pauses of the driver are safe for any host and bus speed, and
+slow on most. Calibration finds the largest block write the display takes
+without dropping bytes, and the shortest pauses after block writes and after
+each character, by drawing test patterns and checking them - on a real display
+by asking whether the pattern is shown, or automatically with the emulator.
+The result, with a safety margin, is saved to the timing profile that
+QwiicSerlcd loads when it is created.
+
+    python qwiic_serlcd_calibrate.py [--address 0x72] [--emulator] [--profile file]
+"""
+#-----------------------------------------------------------------------------
+import json
+import sys
+import time
+import qwiic_serlcd
+
+# Candidate values, tried from the safest
+_BLOCK_SIZES = [32, 24, 16, 8, 4]
+_DELAYS = [0.02, 0.01, 0.005, 0.002, 0.001, 0.0]
+
+# The calibrated pauses are made this much longer. A pause of 0 that works is
+# first raised to the shortest pause tried before it, so it still gets a margin.
+_MARGIN = 1.5
+_MIN_DELAY = min(delay for delay in _DELAYS if delay > 0)
+
+# Time for the display to finish a test pattern before it is checked, in seconds
+_SETTLE = 0.2
+
+# Characters used in the test patterns (the same in ASCII and the display ROM)
+_PATTERN = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+# Receive buffer model of the emulator used with --emulator
+_EMULATED_BUFFER = 32
+_EMULATED_BYTE_TIME = 0.0002
+
+def _pattern(trial):
+    """!
+    @param int trial: The trial number
+    @return **list of string** A test pattern, different for each trial
+    """
+    rows = []
+    for row in range(qwiic_serlcd.MAX_ROWS):
+        start = (trial * 7 + row * qwiic_serlcd.MAX_COLUMNS) % len(_PATTERN)
+        text = (_PATTERN * 2)[start:start + qwiic_serlcd.MAX_COLUMNS]
+        rows.append(text)
+    return rows
+
+class Calibration(object):
+    """!
+    Calibration of the timing of one display.
+    """
+    def __init__(self, lcd, verify, margin = _MARGIN):
+        """!
+        @param QwiicSerlcd lcd: The display to calibrate
+        @param function verify: Called with the rows a test pattern should show, returns True if the display shows them
+        @param float margin: Factor the shortest working pauses are multiplied by
+
+        @return **Object** The Calibration object.
+        """
+        self.lcd = lcd
+        self.verify = verify
+        self.margin = margin
+        self.trials = 0
+
+    def run(self):
+        """!
+        Find the largest working block size, then the shortest working pauses
+        after block writes and after characters. The pause after settings is
+        not calibrated, as the display saves settings to its EEPROM.
+
+        @return **dict** The timing, as for QwiicSerlcd.setTiming(), or None if no block size worked
+        """
+        default = self.lcd.getTiming()
+        try:
+            block_size = None
+            for size in _BLOCK_SIZES:
+                if self._streamWorks(size, _DELAYS[0]):
+                    block_size = size
+                    break
+            if block_size is None:
+                return None
+
+            block_delay = self._shortest(lambda delay: self._streamWorks(block_size, delay))
+            write_delay = self._shortest(self._printWorks)
+        finally:
+            self.lcd.setTiming(**default)
+
+        return {"write_delay": self._withMargin(write_delay),
+                "setting_delay": default["setting_delay"],
+                "block_size": block_size,
+                "block_delay": self._withMargin(block_delay)}
+
+    def _withMargin(self, delay):
+        """!
+        @param float delay: The shortest pause that works
+        @return **float** The pause with the safety margin, never 0
+        """
+        return round(max(delay, _MIN_DELAY) * self.margin, 4)
+
+    def _shortest(self, works):
+        """!
+        @param function works: Called with a pause, returns True if the display works with it
+        @return **float** The shortest pause of the candidates that works, before the longer ones stop working
+        """
+        best = _DELAYS[0]
+        for delay in _DELAYS[1:]:
+            if not works(delay):
+                break
+            best = delay
+        return best
+
+    def _streamWorks(self, block_size, block_delay):
+        """!
+        @return **bool** True if a test pattern sent in block writes is shown correctly
+        """
+        def draw(rows):
+            self.lcd.setTiming(block_size=block_size, block_delay=block_delay)
+            with self.lcd.batch():
+                for row in range(len(rows)):
+                    self.lcd.printAt(0, row, rows[row])
+            return True
+        return self._trial(draw)
+
+    def _printWorks(self, write_delay):
+        """!
+        @return **bool** True if a test pattern printed one character at a time is shown correctly
+        """
+        def draw(rows):
+            self.lcd.setTiming(write_delay=write_delay)
+            for row in range(len(rows)):
+                self.lcd.setCursor(0, row)
+                if not self.lcd.print(rows[row]):
+                    return False
+            return True
+        return self._trial(draw)
+
+    def _trial(self, draw):
+        """!
+        Clear the display with the default timing, draw a test pattern and check it.
+
+        @param function draw: Called with the rows of the pattern to draw them
+        @return **bool** True if the pattern was drawn and shown correctly
+        """
+        self.trials += 1
+        rows = _pattern(self.trials)
+        self.lcd.setTiming(0.01, 0.05, qwiic_serlcd._MAX_BLOCK_SIZE, 0.01)
+        try:
+            self.lcd.clearScreen()
+            time.sleep(_SETTLE)
+            drawn = draw(rows)
+        except (IOError, OSError):
+            drawn = False
+        time.sleep(_SETTLE)
+        return drawn and self.verify(rows)
+
+def saveTimingProfile(address, timing, path = None, i2c_driver = None):
+    """!
+    Save the timing of a display to a timing profile, keeping the timing of
+    other displays in it.
+
+    @param int address: The I2C address of the display
+    @param dict timing: The timing, from Calibration.run()
+    @param string path: The timing profile file, if not the default
+    @param i2c_driver: The I2C driver object of the display's bus, or None for the default driver
+
+    @return **bool** True if the timing profile was saved
+    """
+    if path is None:
+        path = qwiic_serlcd._timingProfilePath()
+    profile = qwiic_serlcd._readJson(path)
+    profile[qwiic_serlcd._deviceKey(i2c_driver, address)] = timing
+    qwiic_serlcd._timing_profiles.pop(path, None) # read it again next time
+    return qwiic_serlcd._writeJson(path, profile)
+
+def _ask(rows):
+    """!
+    Ask whether the display shows a test pattern.
+
+    @param list of string rows: The rows the display should show
+    @return **bool** True if the answer is yes
+    """
+    print("")
+    for row in rows:
+        print("    " + row)
+    answer = input("Does the display show exactly this? [y/n] ")
+    return answer.strip().lower().startswith("y")
+
+def main(argv):
+    """!
+    Calibrate a display and save its timing profile.
+
+    @param list of string argv: The command line arguments
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Calibrate the timing of a SerLCD and save it to the timing profile.")
+    parser.add_argument("--address", type=lambda value: int(value, 0), default=qwiic_serlcd.QwiicSerlcd.available_addresses[0],
+                        help="I2C address of the display")
+    parser.add_argument("--emulator", action="store_true", help="calibrate against the emulator instead of a display")
+    parser.add_argument("--profile", help="timing profile file to save to")
+    parser.add_argument("--dry-run", action="store_true", help="print the timing without saving it")
+    args = parser.parse_args(argv)
+
+    if args.emulator:
+        import qwiic_serlcd_emulator
+        emulator = qwiic_serlcd_emulator.Emulator(args.address, buffer_size=_EMULATED_BUFFER, byte_time=_EMULATED_BYTE_TIME)
+        lcd = qwiic_serlcd.QwiicSerlcd(args.address, emulator)
+        verify = lambda rows: emulator.text() == rows
+    else:
+        lcd = qwiic_serlcd.QwiicSerlcd(args.address)
+        if not lcd.connected:
+            print("The Qwiic SerLCD device isn't connected to the system. Please check your connection", file=sys.stderr)
+            return 1
+        verify = _ask
+
+    calibration = Calibration(lcd, verify)
+    timing = calibration.run()
+    if timing is None:
+        print("The display didn't show any test pattern correctly", file=sys.stderr)
+        return 1
+
+    print("Timing after %d trials:" % calibration.trials)
+    print(json.dumps(timing, indent=4, sort_keys=True))
+    print("setting_delay keeps its default of %g s: settings are saved to the display's EEPROM, "
+          "which calibrating them would wear" % timing["setting_delay"])
+    if not args.dry_run:
+        if not saveTimingProfile(args.address, timing, args.profile, lcd._bus):
+            print("The timing profile couldn't be saved", file=sys.stderr)
+            return 1
+        print("Saved to " + (args.profile or qwiic_serlcd._timingProfilePath()))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
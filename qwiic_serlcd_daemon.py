@@ -0,0 +1,374 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_daemon.py
+#
+# Display daemon for sharing SparkFun Serial LCDs (QWIIC) between processes
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_daemon
+===================
+Display daemon for the SparkFun SerLCD QWIIC products.
+
+The daemon owns the displays on the bus. Local processes send it frames (the
+text of the whole screen) or regions (text at a position) over a Unix datagram
+socket with DisplayClient, which returns as soon as the message is queued. The
+daemon merges the updates of all clients and draws the result at a limited
+frame rate, sending only the characters that changed.
+
+    python qwiic_serlcd_daemon.py [--socket /tmp/qwiic_serlcd.sock] [--address 0x72 ...]
+
+    client = DisplayClient()
+    client.region(0, 1, "Temp: 21.5C")
+"""
+#-----------------------------------------------------------------------------
+import errno
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import qwiic_serlcd
+
+_DEFAULT_SOCKET = "/tmp/qwiic_serlcd.sock"
+
+# Largest message accepted, in bytes
+_MAX_MESSAGE = 4096
+
+class DisplayDaemon(object):
+    """!
+    Serves updates from local clients to one or more QwiicSerlcd displays.
+
+    Messages are JSON objects, sent as one datagram each. The keys, applied in
+    this order, are:
+        "display": I2C address of the display, or its name for a display on
+                   another bus, example: "3:0x72" (default: the first display)
+        "clear": true to blank the screen
+        "frame": list of the text of each row
+        "text", "col", "row": text to put at a position
+        "backlight": [r, g, b] backlight color
+    """
+    def __init__(self, lcds, socket_path = _DEFAULT_SOCKET, max_rate = 20.0):
+        """!
+        @param list of QwiicSerlcd lcds: The displays to serve
+        @param string socket_path: Path of the Unix socket to listen on
+        @param float max_rate: Maximum number of redraws of each display per second
+
+        @return **Object** The DisplayDaemon object.
+        """
+        self.lcds = list(lcds)
+        self.socketPath = socket_path
+        self.interval = 1.0 / max_rate
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        # Displays are known by their bus and address, as in the files kept on the host
+        self._keys = [qwiic_serlcd._deviceKey(lcd._bus, lcd.address) for lcd in self.lcds]
+        self._frames = {}      # the text each display should show
+        self._backlights = {}  # backlight color each display should have
+        self._dirty = set()    # keys of the displays to redraw
+        for key in self._keys:
+            self._frames[key] = [" " * qwiic_serlcd.MAX_COLUMNS for i in range(qwiic_serlcd.MAX_ROWS)]
+        self._socket = None
+        self._running = False
+        self._threads = []
+
+    def start(self):
+        """!
+        Listen on the socket, and start drawing. Each display is cleared once.
+        A socket left by a daemon that didn't stop cleanly is replaced, but
+        not one that another daemon is still listening on.
+        """
+        if os.path.exists(self.socketPath):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            try:
+                probe.connect(self.socketPath)
+                listening = True
+            except (IOError, OSError):
+                listening = False
+            finally:
+                probe.close()
+            if listening:
+                raise OSError(errno.EADDRINUSE, "A display daemon is already listening on %s" % self.socketPath)
+            os.unlink(self.socketPath)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.bind(self.socketPath)
+        self._socket.settimeout(0.5)
+
+        for lcd in self.lcds:
+            lcd.clearScreen()
+        self._running = True
+        for target in (self._receive, self._draw):
+            thread = threading.Thread(target=target, name="qwiic_serlcd daemon")
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """!
+        Stop serving, after drawing the updates already received.
+        """
+        if self._socket is None:
+            return # not started
+        self._running = False
+        self._changed.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._socket.close()
+        self._socket = None
+        if os.path.exists(self.socketPath):
+            os.unlink(self.socketPath)
+
+    def submit(self, message):
+        """!
+        Merge an update into the screen of a display. The display is redrawn
+        by the drawing thread.
+
+        @param dict message: The update, as described for the class
+
+        @return **bool** Returns True if the update was valid, otherwise False.
+        """
+        try:
+            key = self._key(message.get("display"))
+            with self._lock:
+                frame = self._frames[key]
+                if message.get("clear"):
+                    for row in range(len(frame)):
+                        frame[row] = " " * qwiic_serlcd.MAX_COLUMNS
+                if "frame" in message:
+                    rows = message["frame"]
+                    for row in range(len(frame)):
+                        text = str(rows[row]) if row < len(rows) else ""
+                        frame[row] = (text + " " * qwiic_serlcd.MAX_COLUMNS)[:qwiic_serlcd.MAX_COLUMNS]
+                if "text" in message:
+                    col = min(max(0, int(message.get("col", 0))), qwiic_serlcd.MAX_COLUMNS - 1)
+                    row = min(max(0, int(message.get("row", 0))), qwiic_serlcd.MAX_ROWS - 1)
+                    text = str(message["text"])[:qwiic_serlcd.MAX_COLUMNS - col]
+                    frame[row] = frame[row][:col] + text + frame[row][col + len(text):]
+                if "backlight" in message:
+                    self._backlights[key] = tuple(int(value) for value in message["backlight"][:3])
+                self._dirty.add(key)
+        except (AttributeError, KeyError, TypeError, ValueError, IndexError):
+            return False
+        self._changed.set()
+        return True
+
+    def _key(self, display):
+        """!
+        @param display: I2C address or name of a display, or None for the first display
+        @return **string** The key of the display, see qwiic_serlcd._deviceKey()
+        """
+        if display is None:
+            return self._keys[0]
+        if display in self._frames:
+            return display
+        for key, lcd in zip(self._keys, self.lcds):
+            if lcd.address == display:
+                return key
+        raise KeyError(display)
+
+    def _receive(self):
+        """!
+        Receiving thread - merge the updates sent to the socket.
+        """
+        while self._running:
+            try:
+                data = self._socket.recv(_MAX_MESSAGE)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            try:
+                message = json.loads(data.decode("utf-8"))
+            except ValueError:
+                continue
+            self.submit(message)
+
+    def _draw(self):
+        """!
+        Drawing thread - redraw the displays with changes, at most once per
+        interval, so updates that arrive meanwhile are merged into one redraw.
+        """
+        while True:
+            self._changed.wait()
+            self._changed.clear()
+            start = time.time()
+            with self._lock:
+                dirty = self._dirty
+                self._dirty = set()
+                frames = dict((key, list(self._frames[key])) for key in dirty)
+                backlights = dict((key, self._backlights.pop(key)) for key in dirty if key in self._backlights)
+
+            failed = False
+            for key, lcd in zip(self._keys, self.lcds):
+                if key not in frames:
+                    continue
+                try:
+                    with lcd.atomic():
+                        target = lcd.snapshot()
+                        target.shadow = [lcd._encode(text) for text in frames[key]]
+                        if key in backlights:
+                            target.backlight = backlights[key]
+                        drawn = lcd.restoreSnapshot(target)
+                except (IOError, OSError):
+                    drawn = False
+                if not drawn:
+                    # try again next time - the merged frame is still pending
+                    failed = True
+                    with self._lock:
+                        self._dirty.add(key)
+                        if key in backlights:
+                            self._backlights.setdefault(key, backlights[key])
+                    self._changed.set()
+
+            if not self._running and (failed or not self._dirty):
+                break # stopping - don't wait for a display that fails
+            elapsed = time.time() - start
+            if elapsed < self.interval:
+                time.sleep(self.interval - elapsed)
+
+class DisplayClient(object):
+    """!
+    Sends updates to a DisplayDaemon. Each call returns as soon as the update
+    is queued on the socket, without waiting for the display.
+    """
+    def __init__(self, socket_path = _DEFAULT_SOCKET, display = None):
+        """!
+        @param string socket_path: Path of the Unix socket of the daemon
+        @param display: I2C address of the display, its name for a display on another bus, example: "3:0x72", or None for the first display of the daemon
+
+        @return **Object** The DisplayClient object.
+        """
+        self.socketPath = socket_path
+        self.display = display
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+
+    def frame(self, rows):
+        """!
+        Set the text of the whole screen.
+
+        @param list of string rows: The text of each row
+
+        @return **bool** Returns True if the update was sent, otherwise False.
+        """
+        return self._send({"frame": list(rows)})
+
+    def region(self, col, row, text):
+        """!
+        Set the text at a position of the screen.
+
+        @param int col: The column position (0-19)
+        @param int row: The row position (0-3)
+        @param string text: The text
+
+        @return **bool** Returns True if the update was sent, otherwise False.
+        """
+        return self._send({"col": col, "row": row, "text": text})
+
+    def clearScreen(self):
+        """!
+        Blank the screen.
+
+        @return **bool** Returns True if the update was sent, otherwise False.
+        """
+        return self._send({"clear": True})
+
+    def setBacklight(self, r, g, b):
+        """!
+        Set the backlight color.
+
+        @param int r: The new red brightness value (0-255)
+        @param int g: The new green brightness value (0-255)
+        @param int b: The new blue brightness value (0-255)
+
+        @return **bool** Returns True if the update was sent, otherwise False.
+        """
+        return self._send({"backlight": [r, g, b]})
+
+    def close(self):
+        """!
+        Close the socket.
+        """
+        self._socket.close()
+
+    def _send(self, message):
+        """!
+        @param dict message: The update to send
+        @return **bool** Returns True if the update was sent, otherwise False.
+        """
+        if self.display is not None:
+            message["display"] = self.display
+        try:
+            self._socket.sendto(json.dumps(message).encode("utf-8"), self.socketPath)
+        except (IOError, OSError):
+            return False
+        return True
+
+def main(argv):
+    """!
+    Run the daemon until interrupted.
+
+    @param list of string argv: The command line arguments
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Share SerLCD displays between local processes.")
+    parser.add_argument("--socket", default=_DEFAULT_SOCKET, help="Unix socket to listen on")
+    parser.add_argument("--address", action="append", type=lambda value: int(value, 0),
+                        help="I2C address of a display (can be repeated)")
+    parser.add_argument("--rate", type=float, default=20.0, help="maximum redraws of each display per second")
+    args = parser.parse_args(argv)
+
+    lcds = []
+    for address in args.address or qwiic_serlcd.QwiicSerlcd.available_addresses[:1]:
+        lcd = qwiic_serlcd.QwiicSerlcd(address)
+        if not lcd.connected:
+            print("No Qwiic SerLCD at address 0x%02X. Please check your connection" % address, file=sys.stderr)
+            return 1
+        lcds.append(lcd)
+
+    daemon = DisplayDaemon(lcds, args.socket, args.rate)
+    daemon.start()
+    print("Serving %d display(s) on %s" % (len(lcds), args.socket))
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        daemon.stop()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,280 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_discovery.py
+#
+# Discovery of SparkFun Serial LCDs (QWIIC) on I2C buses
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_discovery
+======================
+Discovery of SparkFun SerLCD QWIIC products at any address, on one or more
+I2C buses.
+
+setAddress() can move a display to any address, so finding the displays means
+probing a range of addresses. The buses are scanned at the same time, one
+thread each, and the displays found are saved in a cache file. At the next
+start only the cached addresses are probed again, and a bus is scanned again
+only if one of its displays stopped answering, or the cache is too old.
+
+    for bus, address in qwiic_serlcd_discovery.discover(buses=[1, 3]):
+        print("SerLCD on bus %d at 0x%02X" % (bus, address))
+"""
+#-----------------------------------------------------------------------------
+import sys
+import time
+import qwiic_serlcd
+
+# Cache file - the environment variable overrides the file in the home directory
+_CACHE_FILE = ".qwiic_serlcd_discovery.json"
+_CACHE_VARIABLE = "QWIIC_SERLCD_DISCOVERY"
+
+# Scans older than this are done again, in seconds
+_MAX_AGE = 24 * 60 * 60
+
+# Every address a display can be given (the 7 bit addresses that aren't reserved)
+_ADDRESSES = range(0x08, 0x78)
+
+# The I2C driver of each bus, so displays on a bus share it
+_drivers = {}
+
+def _busKey(bus):
+    """!
+    @param int bus: The bus number, or None for the default bus
+    @return **string** The name of the bus in the cache file
+    """
+    return "default" if bus is None else str(bus)
+
+def _getDriver(bus):
+    """!
+    qwiic_i2c.getI2CDriver() creates one driver for the process and returns
+    it on every later call, whatever bus is asked for. So the default bus
+    uses it, and any other bus gets its own driver object, of the driver
+    class for the platform.
+
+    @param int bus: The bus number, or None for the default bus
+    @return The I2C driver object for the bus, or None if there is no driver for the platform
+    """
+    driver = _drivers.get(bus)
+    if driver is None:
+        import qwiic_i2c
+        if bus is None:
+            driver = qwiic_i2c.getI2CDriver()
+        else:
+            for driverClass in getattr(qwiic_i2c, "_drivers", []):
+                if driverClass.isPlatform():
+                    try:
+                        driver = driverClass(iBus=bus)
+                    except TypeError:
+                        pass # the driver can't be given a bus number
+                    break
+        if driver is not None:
+            _drivers[bus] = driver
+    return driver
+
+def _addressList(addresses):
+    """!
+    @param addresses: Addresses and ranges of addresses, or None for every address
+    @return **list of int** The addresses, sorted
+    """
+    if addresses is None:
+        return list(_ADDRESSES)
+    result = set()
+    for item in addresses:
+        if isinstance(item, int):
+            result.add(item)
+        else:
+            result.update(item)
+    return sorted(result)
+
+def _identify(driver, address, strict):
+    """!
+    Check whether a SerLCD answers at an address. The display has no ID that
+    can be read, but it answers a read with 0, which rules out most other
+    devices. With a driver that can't read, nothing is identified in strict mode.
+
+    @param driver: The I2C driver object of the bus
+    @param int address: The address
+    @param bool strict: False to accept any device that acknowledges the address
+
+    @return **bool** True if a SerLCD answers at the address
+    """
+    try:
+        if not driver.isDeviceConnected(address):
+            return False
+        if not strict:
+            return True
+        readByte = getattr(driver, "readByte", None)
+        return readByte is not None and readByte(address) == 0
+    except (IOError, OSError):
+        return False
+
+def _scan(bus, addresses, strict, results):
+    """!
+    Scan the addresses of one bus. The addresses are probed one after another:
+    the bus carries one transaction at a time, and drivers aren't thread-safe.
+
+    @param int bus: The bus number, or None for the default bus
+    @param list of int addresses: The addresses to probe
+    @param bool strict: False to accept any device that acknowledges its address
+    @param dict results: Where to store the list of addresses found, by bus - nothing is stored if the bus can't be opened
+    """
+    try:
+        driver = _getDriver(bus)
+    except (ImportError, IOError, OSError):
+        driver = None
+    if driver is None: # no such bus, or no driver
+        return
+    results[bus] = [address for address in addresses if _identify(driver, address, strict)]
+
+def discover(buses = None, addresses = None, strict = True, max_age = _MAX_AGE, path = None, refresh = False):
+    """!
+    Find the SerLCDs on I2C buses. Buses with a recent scan of the same
+    addresses in the cache are not scanned again, as long as all the displays
+    found then still answer. Buses that need a scan are scanned at the same
+    time. A display added to a bus is found when the cache is older than
+    max_age, or with refresh=True or invalidate().
+
+    @param list of int buses: The bus numbers, or None for the default bus only
+    @param addresses: Addresses and ranges of addresses to scan, such as [range(0x70, 0x78)], or None for every address
+    @param bool strict: False to report any device that acknowledges its address
+    @param float max_age: Scans older than this are done again, in seconds
+    @param string path: The cache file, if not the default - the QWIIC_SERLCD_DISCOVERY environment variable or ~/.qwiic_serlcd_discovery.json
+    @param bool refresh: True to scan every bus, ignoring the cache
+
+    @return **list of tuple** The bus number and address of each display found
+    """
+    buses = [None] if buses is None else list(buses)
+    addresses = _addressList(addresses)
+    if path is None:
+        path = qwiic_serlcd._hostPath(_CACHE_VARIABLE, _CACHE_FILE)
+    cache = qwiic_serlcd._readJson(path)
+    now = time.time()
+
+    found = {}
+    scans = []
+    for bus in buses:
+        entry = cache.get(_busKey(bus))
+        try:
+            if refresh or now - entry["time"] > max_age or entry["strict"] != strict \
+                or not set(addresses) <= set(entry["scanned"]):
+                raise ValueError()
+            driver = _getDriver(bus)
+            cached = [address for address in entry["found"] if address in addresses]
+            for address in cached:
+                if not _identify(driver, address, strict):
+                    raise ValueError() # moved or gone
+            if driver is None:
+                raise ValueError()
+            found[bus] = cached
+        except (KeyError, TypeError, ValueError, ImportError, IOError, OSError):
+            scans.append(bus)
+
+    if scans:
+        results = {}
+        try:
+            import threading
+        except ImportError: # no threads - scan one bus after another
+            for bus in scans:
+                _scan(bus, addresses, strict, results)
+        else:
+            threads = [threading.Thread(target=_scan, args=(bus, addresses, strict, results),
+                                        name="qwiic_serlcd discovery") for bus in scans]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # a bus that couldn't be opened isn't cached, so it is tried again next time
+        for bus in scans:
+            found[bus] = results.get(bus, [])
+            if bus in results:
+                cache[_busKey(bus)] = {"time": now, "strict": strict, "scanned": addresses, "found": found[bus]}
+        if results:
+            qwiic_serlcd._writeJson(path, cache)
+
+    return [(bus, address) for bus in buses for address in found[bus]]
+
+def getDisplays(buses = None, addresses = None, strict = True, max_age = _MAX_AGE, path = None, refresh = False):
+    """!
+    Find the SerLCDs on I2C buses, as with discover(), and create a
+    QwiicSerlcd object for each. Displays on the same bus share its driver.
+
+    @return **list of QwiicSerlcd** The displays found
+    """
+    return [qwiic_serlcd.QwiicSerlcd(address, _getDriver(bus))
+            for bus, address in discover(buses, addresses, strict, max_age, path, refresh)]
+
+def invalidate(buses = None, path = None):
+    """!
+    Forget the cached scans, so the next discover() scans again.
+
+    @param list of int buses: The bus numbers to forget (None is the default bus), or None for every bus
+    @param string path: The cache file, if not the default
+    """
+    if path is None:
+        path = qwiic_serlcd._hostPath(_CACHE_VARIABLE, _CACHE_FILE)
+    cache = {}
+    if buses is not None:
+        cache = qwiic_serlcd._readJson(path)
+        for bus in buses:
+            cache.pop(_busKey(bus), None)
+    qwiic_serlcd._writeJson(path, cache)
+
+def main(argv):
+    """!
+    List the SerLCDs found.
+
+    @param list of string argv: The command line arguments
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Find SerLCD displays on I2C buses.")
+    parser.add_argument("--bus", action="append", type=int, help="I2C bus number (can be repeated)")
+    parser.add_argument("--first", type=lambda value: int(value, 0), default=_ADDRESSES[0], help="first address to scan")
+    parser.add_argument("--last", type=lambda value: int(value, 0), default=_ADDRESSES[-1], help="last address to scan")
+    parser.add_argument("--any", action="store_true", help="report any device that acknowledges its address")
+    parser.add_argument("--refresh", action="store_true", help="scan again, ignoring the cache")
+    args = parser.parse_args(argv)
+
+    start = time.time()
+    found = discover(args.bus, [range(args.first, args.last + 1)], not args.any, refresh=args.refresh)
+    for bus, address in found:
+        print("bus %s  address 0x%02X" % (_busKey(bus), address))
+    print("%d display(s) found in %.2f s" % (len(found), time.time() - start))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,343 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_emulator.py
+#
+# Emulator of the SparkFun Serial LCDs (QWIIC), for testing without hardware
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_emulator
+=====================
+Emulator of the SparkFun SerLCD QWIIC products.
+
+Emulator stands in for the I2C driver: pass it as the i2c_driver of a
+QwiicSerlcd object, or replay a trace into it. It interprets the bytes sent to
+the display the way the OpenLCD firmware does, keeps the display memory, cursor,
+mode flags, custom characters and backlight, and adds up the time the bytes
+would take on the bus. Optionally it also models how fast the display takes
+bytes from its receive buffer, and drops bytes sent faster than that, like a
+real display does.
+"""
+#-----------------------------------------------------------------------------
+import time
+import qwiic_serlcd
+
+# Command prefixes of the OpenLCD firmware, as in qwiic_serlcd
+_SETTING_COMMAND = 0x7C
+_SPECIAL_COMMAND = 0xFE
+
+# Length of a display line in the display memory
+_LINE_LENGTH = 40
+
+# Display memory addresses of the first character of each row
+_ROW_OFFSETS = [0x00, 0x40, 0x14, 0x54]
+
+# Number of bytes after a setting command, for the settings that take arguments
+_SETTING_ARGUMENTS = {0x18: 1, 0x19: 1, 0x2B: 3}
+for _location in range(8):
+    _SETTING_ARGUMENTS[27 + _location] = 8
+
+# The character shown for each character code of the display character ROM
+_ROM_TEXT = {}
+for _char in sorted(qwiic_serlcd._ROM_CHARMAP):
+    if _char < 0x20:
+        continue # control characters, sent unchanged and shown as custom characters
+    _ROM_TEXT.setdefault(qwiic_serlcd._ROM_CHARMAP[_char], chr(_char))
+
+# Categories of the bytes sent to the display, see Emulator.bytes
+TEXT = "text"
+CURSOR = "cursor"
+MODE = "mode"
+CLEAR = "clear"
+GLYPH = "glyph"
+BACKLIGHT = "backlight"
+SETTING = "setting"
+
+class Emulator(object):
+    """!
+    Emulated SerLCD display, with the interface of a qwiic_i2c driver.
+    """
+    def __init__(self, address = 0x72, columns = 20, rows = 4, clock = 100000, buffer_size = None, byte_time = 0.0):
+        """!
+        @param int address: The I2C address of the display
+        @param int columns: Number of columns of the display
+        @param int rows: Number of rows of the display
+        @param int clock: I2C clock frequency in Hz, used for the bus time
+        @param int buffer_size: Size of the receive buffer, or None to never drop bytes
+        @param float byte_time: Time the display takes to process each byte, in seconds
+
+        @return **Object** The Emulator object.
+        """
+        self.address = address
+        self.columns = columns
+        self.rows = rows
+        self.clock = clock
+        self.bufferSize = buffer_size
+        self.byteTime = byte_time
+        self.reset()
+
+    def reset(self):
+        """!
+        Put the display in its power on state.
+        """
+        self.ddram = [bytearray(b" " * _LINE_LENGTH), bytearray(b" " * _LINE_LENGTH)]
+        self.glyphs = [[0] * 8 for i in range(8)]
+        self.line = 0
+        self.position = 0
+        self.count = 0 # the characters written since the cursor was at the top left, as the firmware counts them
+        self.shift = 0
+        self.leftToRight = True
+        self.autoscroll = False
+        self.displayOn = True
+        self.cursorOn = False
+        self.blinkOn = False
+        self.backlight = (255, 255, 255)
+        self.contrast = 40
+
+        self.busTime = 0.0 # seconds the bytes sent so far took on the bus
+        self.transactions = 0
+        self.dropped = 0   # bytes dropped because the receive buffer was full
+        self._busyUntil = 0.0
+        self.bytes = {}     # number of bytes sent, for each category
+        self._pending = []  # command being received
+
+    # The qwiic_i2c driver interface
+    def writeCommand(self, address, commandCode):
+        self._receive(address, [commandCode])
+
+    def writeByte(self, address, commandCode, value):
+        self._receive(address, [commandCode, value])
+
+    def writeWord(self, address, commandCode, value):
+        self._receive(address, [commandCode, value & 0xFF, value >> 8])
+
+    def writeBlock(self, address, commandCode, value):
+        self._receive(address, [commandCode] + list(value))
+
+    def isDeviceConnected(self, devAddress):
+        return devAddress == self.address
+
+    def text(self):
+        """!
+        @return **list of string** The characters shown on each row, with custom characters as their location number and other unknown codes as '?'
+        """
+        lines = []
+        for row in range(self.rows):
+            line = self.ddram[row % 2]
+            start = (_ROW_OFFSETS[row] & 0x3F) + self.shift
+            chars = []
+            for col in range(self.columns):
+                code = line[(start + col) % _LINE_LENGTH]
+                chars.append(str(code & 0x7) if code < 16 else _ROM_TEXT.get(code, "?"))
+            lines.append("".join(chars))
+        return lines
+
+    def _receive(self, address, data):
+        """!
+        Take the bytes of one I2C write.
+
+        @param int address: The I2C address written to
+        @param list of int data: The bytes written
+        """
+        if address != self.address:
+            raise OSError("No device at address 0x%02X" % address)
+        self.transactions += 1
+        self.busTime += (len(data) + 1) * 9.0 / self.clock # address byte, 9 clocks per byte
+
+        if self.bufferSize is not None:
+            # the bytes not processed yet are still in the receive buffer
+            now = time.time()
+            waiting = max(0.0, self._busyUntil - now) / self.byteTime if self.byteTime else 0
+            accepted = max(0, min(len(data), int(self.bufferSize - waiting)))
+            self.dropped += len(data) - accepted
+            data = data[:accepted]
+            self._busyUntil = max(self._busyUntil, now) + accepted * self.byteTime
+
+        for byte in data:
+            self._byte(byte & 0xFF)
+
+    def _byte(self, byte):
+        """!
+        Interpret one byte, as part of a command or as a character.
+
+        @param int byte: The byte
+        """
+        pending = self._pending
+        if not pending:
+            if byte == _SETTING_COMMAND or byte == _SPECIAL_COMMAND:
+                pending.append(byte)
+            else:
+                self._count(TEXT, 1)
+                self._put(byte)
+            return
+
+        pending.append(byte)
+        if pending[0] == _SPECIAL_COMMAND:
+            self._special(byte)
+        elif len(pending) - 2 >= _SETTING_ARGUMENTS.get(pending[1], 0):
+            self._setting(pending[1], pending[2:])
+        else:
+            return
+        self._pending = []
+
+    def _count(self, category, count):
+        """!
+        Add bytes to the count for a category.
+
+        @param string category: The category, example: TEXT
+        @param int count: Number of bytes
+        """
+        self.bytes[category] = self.bytes.get(category, 0) + count
+
+    def _put(self, code):
+        """!
+        Write a character at the cursor, and move the cursor by the entry mode.
+        The firmware counts the characters written, and at the end of each
+        row it moves the cursor to the start of the next one - the display
+        controller alone would carry on into the row two below.
+
+        @param int code: The character code
+        """
+        self.ddram[self.line][self.position] = code
+        step = 1 if self.leftToRight else -1
+        self.position = (self.position + step) % _LINE_LENGTH
+        if self.autoscroll:
+            self.shift = (self.shift + step) % _LINE_LENGTH
+        self.count = (self.count + 1) % (self.columns * self.rows)
+        if self.count % self.columns == 0:
+            self._setAddress(_ROW_OFFSETS[self.count // self.columns])
+
+    def _setAddress(self, address):
+        """!
+        Move the cursor to a display memory address.
+
+        @param int address: The display memory address
+        """
+        self.line = 1 if address >= 0x40 else 0
+        self.position = (address & 0x3F) % _LINE_LENGTH
+
+    def _special(self, command):
+        """!
+        Carry out a display controller command.
+
+        @param int command: The command byte
+        """
+        if command & 0x80:
+            self._count(CURSOR, 2)
+            address = command & 0x7F
+            self._setAddress(address)
+            # the firmware works out its count from the row and column
+            for row in range(self.rows):
+                if _ROW_OFFSETS[row] <= address < _ROW_OFFSETS[row] + self.columns:
+                    self.count = row * self.columns + address - _ROW_OFFSETS[row]
+        elif command & 0x40:
+            self._count(GLYPH, 2) # character generator address, not used by the library
+        elif command & 0x20:
+            self._count(SETTING, 2)
+        elif command & 0x10:
+            self._count(CURSOR, 2)
+            step = 1 if command & 0x04 else -1
+            if command & 0x08:
+                self.shift = (self.shift - step) % _LINE_LENGTH
+            else:
+                # the controller moves through its memory, the firmware only counts
+                self.position = (self.position + step) % _LINE_LENGTH
+                self.count = (self.count + step) % (self.columns * self.rows)
+        elif command & 0x08:
+            self._count(MODE, 2)
+            self.displayOn = bool(command & 0x04)
+            self.cursorOn = bool(command & 0x02)
+            self.blinkOn = bool(command & 0x01)
+        elif command & 0x04:
+            self._count(MODE, 2)
+            self.leftToRight = bool(command & 0x02)
+            self.autoscroll = bool(command & 0x01)
+        elif command & 0x02:
+            self._count(CURSOR, 2)
+            self.line = 0
+            self.position = 0
+            self.count = 0
+            self.shift = 0
+        elif command & 0x01:
+            self._count(CLEAR, 2)
+            self._clear()
+
+    def _setting(self, command, arguments):
+        """!
+        Carry out an OpenLCD setting command.
+
+        @param int command: The byte after the setting command prefix
+        @param list of int arguments: The bytes the command takes
+        """
+        length = 2 + len(arguments)
+        if command == 0x2D:
+            self._count(CLEAR, length)
+            self._clear()
+        elif 27 <= command <= 34:
+            self._count(GLYPH, length)
+            self.glyphs[command - 27] = list(arguments)
+        elif 35 <= command <= 42:
+            self._count(TEXT, length)
+            self._put(command - 35)
+        elif command == 0x2B:
+            self._count(BACKLIGHT, length)
+            self.backlight = tuple(arguments)
+        elif 128 <= command <= 217:
+            # one color of the backlight, 0-29
+            self._count(BACKLIGHT, length)
+            color = list(self.backlight)
+            index = (command - 128) // 30
+            color[index] = ((command - 128) % 30) * 255 // 29
+            self.backlight = tuple(color)
+        elif command == 0x18:
+            self._count(SETTING, length)
+            self.contrast = arguments[0]
+        elif command == 0x19:
+            self._count(SETTING, length)
+            self.address = arguments[0]
+        else:
+            self._count(SETTING, length)
+
+    def _clear(self):
+        """!
+        Blank the display memory and home the cursor.
+        """
+        for line in self.ddram:
+            line[:] = b" " * _LINE_LENGTH
+        self.line = 0
+        self.position = 0
+        self.count = 0
+        self.shift = 0
@@ -0,0 +1,106 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_fields.py
+#
+# Numeric readout fields for the SparkFun Serial LCDs (QWIIC)
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_fields
+===================
+Numeric readout fields for the SparkFun SerLCD QWIIC products.
+
+A field is a fixed position, width, alignment and precision on the display.
+Each new value is formatted into the field's own buffer and compared digit by
+digit with what the display shows, and only the digits that changed are sent.
+"""
+#-----------------------------------------------------------------------------
+
+# Character codes used to fill a field
+_SPACE = 0x20
+_OVERFLOW = 0x23 # '#', shown across the field when a value doesn't fit
+
+class NumericField(object):
+    """!
+    A numeric readout at a fixed position of a QwiicSerlcd display.
+    """
+    def __init__(self, lcd, col, row, width, precision = 0, align = "right"):
+        """!
+        @param QwiicSerlcd lcd: The display to show the value on
+        @param int col: The first column of the field
+        @param int row: The row of the field
+        @param int width: Number of characters in the field
+        @param int precision: Number of digits after the decimal point
+        @param string align: "right" or "left"
+
+        @return **Object** The NumericField object.
+        """
+        self.lcd = lcd
+        self.col = col
+        self.row = row
+        self.width = width
+        self.precision = precision
+        self.align = align
+        self.value = None
+        self._format = "%." + str(precision) + "f"
+        self._buffer = bytearray(width)
+
+    def update(self, value):
+        """!
+        Show a value. Only the characters of the field that differ from the
+        display are sent, in one batched I2C write. A value that doesn't fit
+        in the field is shown as '#' characters.
+
+        @param float value: The value to show
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        self.value = value
+        text = self._format % value
+        length = len(text)
+        buffer = self._buffer
+        width = self.width
+
+        if length > width:
+            for i in range(width):
+                buffer[i] = _OVERFLOW
+        else:
+            start = width - length if self.align == "right" else 0
+            for i in range(width):
+                buffer[i] = _SPACE
+            for i in range(length):
+                buffer[start + i] = ord(text[i])
+        return self.lcd.printAt(self.col, self.row, buffer)
@@ -0,0 +1,194 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_fleet.py
+#
+# Fleet framebuffer for the SparkFun Serial LCDs (QWIIC)
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_fleet
+==================
+NumPy framebuffer for many SparkFun SerLCD QWIIC products.
+
+The screens of all the displays are kept in one array of character codes,
+displays x rows x columns. A flush compares it with what the displays show in
+one vectorised pass, finds the runs of changed characters of every display,
+and hands each display only its runs to write. The host time of a flush hardly
+grows with the number of displays - only displays with changes cost any
+Python work.
+
+Requires NumPy.
+
+    fleet = FleetFramebuffer(lcds)
+    fleet.write(3, 0, 1, "Pressure: %6.1f" % value)
+    fleet.frames[:, 0, :] = fleet.frames[0, 0, :] # or write the array directly
+    fleet.flush()
+"""
+#-----------------------------------------------------------------------------
+import numpy
+import qwiic_serlcd
+
+def findRuns(changed, gap = qwiic_serlcd._MAX_DIFF_GAP):
+    """!
+    Find the runs of changed characters of many screens at once. Runs in the
+    same row with at most gap unchanged characters between them are joined,
+    as rewriting those characters costs no more than a cursor move.
+
+    @param numpy.ndarray changed: Boolean array, displays x rows x columns, of the characters that changed
+    @param int gap: Runs with at most this many characters between them are joined
+
+    @return **tuple** Arrays of the display, row, first column and end column of each run, in order
+    """
+    displays, rows, columns = changed.shape
+    lines = numpy.zeros((displays * rows, columns + 2), numpy.int8)
+    lines[:, 1:-1] = changed.reshape(displays * rows, columns)
+    edges = numpy.diff(lines, axis=1)
+    line, start = numpy.nonzero(edges == 1)
+    end = numpy.nonzero(edges == -1)[1]
+
+    if gap > 0 and len(start) > 1:
+        join = (line[1:] == line[:-1]) & (start[1:] - end[:-1] <= gap)
+        first = numpy.concatenate(([True], ~join))
+        last = numpy.concatenate((~join, [True]))
+        line = line[first]
+        start = start[first]
+        end = end[last]
+
+    return line // rows, line % rows, start, end
+
+class FleetFramebuffer(object):
+    """!
+    The screens of many QwiicSerlcd displays, as one NumPy array.
+    """
+    def __init__(self, lcds):
+        """!
+        @param list of QwiicSerlcd lcds: The displays
+
+        @return **Object** The FleetFramebuffer object.
+        """
+        self.lcds = list(lcds)
+        shape = (len(self.lcds), qwiic_serlcd.MAX_ROWS, qwiic_serlcd.MAX_COLUMNS)
+        ## The character codes each display should show, displays x rows x columns
+        self.frames = numpy.empty(shape, numpy.uint8)
+        ## The indices of the displays the last flush() failed to write, sent again by the next one
+        self.failed = []
+        self._shown = numpy.empty(shape, numpy.uint8)
+        self.sync()
+
+    def sync(self):
+        """!
+        Load what each display shows from its cached display state, and
+        start the frames from it. Call this after drawing on the displays
+        other than through the framebuffer.
+        """
+        for index in range(len(self.lcds)):
+            shadow = self.lcds[index]._state.shadow
+            self._shown[index] = numpy.frombuffer(b"".join(bytes(line) for line in shadow), numpy.uint8).reshape(
+                qwiic_serlcd.MAX_ROWS, qwiic_serlcd.MAX_COLUMNS)
+        self.frames[:] = self._shown
+
+    def write(self, index, col, row, text):
+        """!
+        Put text in the frame of a display, cut at the end of the row. It is
+        sent by the next flush().
+
+        @param int index: The index of the display in the fleet
+        @param int col: The column position (0-19)
+        @param int row: The row position (0-3)
+        @param string text: The text, translated as by QwiicSerlcd.print(), or bytes of character codes
+        """
+        if not isinstance(text, (bytes, bytearray)):
+            text = self.lcds[index]._encode(text)
+        text = text[:qwiic_serlcd.MAX_COLUMNS - col]
+        self.frames[index, row, col:col + len(text)] = numpy.frombuffer(bytes(text), numpy.uint8)
+
+    def clear(self, index = None):
+        """!
+        Blank the frame of a display, or of every display. Sent by the next flush().
+
+        @param int index: The index of the display in the fleet, or None for every display
+        """
+        if index is None:
+            self.frames[:] = 0x20
+        else:
+            self.frames[index] = 0x20
+
+    def plan(self):
+        """!
+        Find the changes to send to each display.
+
+        @return **dict** The runs to write for each display with changes, by
+                index - a list of the row, first column and end column of each run
+        """
+        display, row, start, end = findRuns(self.frames != self._shown)
+        if not len(display):
+            return {}
+        runs = list(zip(row.tolist(), start.tolist(), end.tolist()))
+
+        # split the runs at the boundaries between displays
+        bounds = (numpy.flatnonzero(numpy.diff(display)) + 1).tolist()
+        plans = {}
+        first = 0
+        for last in bounds + [len(runs)]:
+            plans[int(display[first])] = runs[first:last]
+            first = last
+        return plans
+
+    def flush(self):
+        """!
+        Send the changes of every display. A display that fails doesn't stop
+        the others - its index is listed in failed, and its changes are sent
+        again by the next flush().
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        failed = []
+        for index, runs in self.plan().items():
+            lcd = self.lcds[index]
+            rows = [bytes(line) for line in self.frames[index]]
+            try:
+                with lcd.atomic():
+                    data = []
+                    lcd._writeRuns(rows, runs, data)
+                    sent = lcd._sendRuns(rows, runs, data)
+            except (IOError, OSError):
+                sent = False
+            if sent:
+                self._shown[index] = self.frames[index]
+            else:
+                failed.append(index)
+        self.failed = failed
+        return not failed
@@ -0,0 +1,185 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_marquee.py
+#
+# Scrolling marquee text for the SparkFun Serial LCDs (QWIIC)
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_marquee
+====================
+Marquee text for the SparkFun SerLCD QWIIC products.
+
+Text that fits in the 40 character display line is loaded into the display once
+and scrolled by the display itself, one 2 byte shift command per step. Longer
+text is scrolled by rewriting the row, sending only the characters that change.
+"""
+#-----------------------------------------------------------------------------
+import time
+import qwiic_serlcd
+
+# Length of a display line in the display memory. A row shows 20 characters of
+# it, and on a 4 row display rows 0 and 2 (1 and 3) are the two halves of one line.
+_LINE_LENGTH = 40
+
+class Marquee(object):
+    """!
+    Text scrolling from right to left along a row of a QwiicSerlcd display.
+
+    In hardware mode, used for text that fits in the display line with the
+    gap, the whole display scrolls, so other rows move with the text; on a
+    4 row display the text carries on from row 0 to row 2 (1 to 3). Otherwise
+    only the marquee row is rewritten.
+    """
+    def __init__(self, lcd, text, row = 0, rate = 4.0, gap = 4):
+        """!
+        @param QwiicSerlcd lcd: The display to show the text on
+        @param string text: The text to scroll
+        @param int row: The row position (0-3)
+        @param float rate: Scroll speed, in characters per second
+        @param int gap: Number of spaces between the end of the text and its next start
+
+        @return **Object** The Marquee object.
+        """
+        self.lcd = lcd
+        self.row = min(max(0, row), qwiic_serlcd.MAX_ROWS - 1)
+        self.interval = 1.0 / rate
+        self.gap = gap
+        self.position = 0
+        self._data = None
+        self._lastStep = None
+        self.setText(text)
+
+    def setText(self, text):
+        """!
+        Set the text to scroll. It is shown from the start by the next call
+        to start() or service().
+
+        @param string text: The text to scroll
+        """
+        self.text = text
+        self.hardware = len(text) + self.gap <= _LINE_LENGTH
+        self._data = None
+
+    def start(self):
+        """!
+        Show the text from its start. In hardware mode this loads the text
+        into the display line; only the characters that differ from the screen
+        are sent.
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        lcd = self.lcd
+        with lcd.atomic():
+            data = lcd._encode(self.text)
+            self.position = 0
+            self._lastStep = time.time()
+            if not self.hardware:
+                self._data = data + b" " * self.gap
+                return self._show()
+
+            # the text starts at the first column of the row
+            line = self.row % 2
+            start = qwiic_serlcd.MAX_COLUMNS if self.row >= 2 else 0
+            buffer = bytearray(b" " * _LINE_LENGTH)
+            for i in range(len(data)):
+                buffer[(start + i) % _LINE_LENGTH] = data[i]
+            self._data = data
+
+            target = lcd.snapshot()
+            target.shadow[line] = bytes(buffer[:qwiic_serlcd.MAX_COLUMNS])
+            if line + 2 < qwiic_serlcd.MAX_ROWS:
+                target.shadow[line + 2] = bytes(buffer[qwiic_serlcd.MAX_COLUMNS:])
+            target.shift = 0
+            return lcd.restoreSnapshot(target)
+
+    def step(self):
+        """!
+        Scroll the text one character to the left.
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        if self._data is None:
+            return self.start()
+        if self.hardware:
+            self.position = (self.position + 1) % _LINE_LENGTH
+            return self.lcd.scrollDisplayLeft()
+        self.position = (self.position + 1) % len(self._data)
+        return self._show()
+
+    def service(self):
+        """!
+        Scroll the text by the steps that are due at the scroll rate. Call this
+        often from the application loop.
+
+        @return **int** Number of steps scrolled
+        """
+        if self._data is None:
+            self.start()
+            return 0
+        now = time.time()
+        steps = int((now - self._lastStep) / self.interval)
+        if steps <= 0:
+            return 0
+        self._lastStep += steps * self.interval
+        if self.hardware:
+            # steps that were missed are caught up with one repeated command
+            if steps % _LINE_LENGTH:
+                self.lcd.scrollDisplayLeft(steps % _LINE_LENGTH)
+            self.position = (self.position + steps) % _LINE_LENGTH
+        else:
+            self.position = (self.position + steps) % len(self._data)
+            self._show()
+        return steps
+
+    def _show(self):
+        """!
+        Rewrite the marquee row in software mode, sending only the characters
+        that changed since the last step.
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        data = self._data
+        window = data[self.position:self.position + qwiic_serlcd.MAX_COLUMNS]
+        while len(window) < qwiic_serlcd.MAX_COLUMNS:
+            window += data[:qwiic_serlcd.MAX_COLUMNS - len(window)]
+
+        lcd = self.lcd
+        with lcd.atomic():
+            target = lcd.snapshot()
+            target.shadow[self.row] = window
+            target.shift = 0
+            return lcd.restoreSnapshot(target)
@@ -0,0 +1,408 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_micro.py
+#
+# Compact build of the qwiic_serlcd library for MicroPython boards, for I2C
+# control of the SparkFun Serial LCDs (QWIIC)
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# Constants are micropython.const() values with leading underscores, so they are
+# folded into the bytecode instead of taking RAM in the module dictionary. All
+# command buffers are allocated once per object.
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_micro
+==================
+Compact build of qwiic_serlcd for MicroPython boards. QwiicSerlcd has the same
+methods for controlling the display as qwiic_serlcd.QwiicSerlcd, without the
+resilient and thread-safe modes, the text translation and the cached display
+state. See manifest.py to freeze it into firmware.
+
+The I2C driver can be a qwiic_i2c driver, or a machine.I2C object, which is
+written directly without allocating memory.
+"""
+#-----------------------------------------------------------------------------
+import time
+
+try:
+    from micropython import const
+except ImportError:
+    def const(value):
+        return value
+
+try:
+    _sleep_ms = time.sleep_ms
+except AttributeError:
+    def _sleep_ms(ms):
+        time.sleep(ms / 1000)
+
+_DEFAULT_ADDRESS = const(0x72)
+
+# OpenLCD command characters
+_SPECIAL_COMMAND = const(254)
+_SETTING_COMMAND = const(0x7C)
+
+# OpenLCD commands
+_CLEAR_COMMAND = const(0x2D)
+_CONTRAST_COMMAND = const(0x18)
+_ADDRESS_COMMAND = const(0x19)
+_SET_RGB_COMMAND = const(0x2B)
+_ENABLE_SYSTEM_MESSAGE_DISPLAY = const(0x2E)
+_DISABLE_SYSTEM_MESSAGE_DISPLAY = const(0x2F)
+_ENABLE_SPLASH_DISPLAY = const(0x30)
+_DISABLE_SPLASH_DISPLAY = const(0x31)
+_SAVE_CURRENT_DISPLAY_AS_SPLASH = const(0x0A)
+_CREATE_CHAR_COMMAND = const(27)
+_WRITE_CHAR_COMMAND = const(35)
+
+# special commands and flags
+_LCD_RETURNHOME = const(0x02)
+_LCD_ENTRYMODESET = const(0x04)
+_LCD_DISPLAYCONTROL = const(0x08)
+_LCD_CURSORSHIFT = const(0x10)
+_LCD_SETDDRAMADDR = const(0x80)
+_LCD_ENTRYLEFT = const(0x02)
+_LCD_ENTRYSHIFTINCREMENT = const(0x01)
+_LCD_DISPLAYON = const(0x04)
+_LCD_CURSORON = const(0x02)
+_LCD_BLINKON = const(0x01)
+_LCD_DISPLAYMOVE = const(0x08)
+_LCD_MOVERIGHT = const(0x04)
+
+# DDRAM address of the first column of each row
+_ROW_OFFSETS = b"\x00\x40\x14\x54"
+
+class QwiicSerlcd(object):
+    """!
+    Compact QwiicSerlcd for MicroPython.
+    """
+    device_name = "SparkFun Qwiic SerLCD"
+    available_addresses = [_DEFAULT_ADDRESS]
+
+    def __init__(self, address=None, i2c_driver=None):
+        """!
+        @param address: The I2C address to use for the device.
+                        If not provided, the default address is used.
+        @param i2c_driver: A qwiic_i2c driver or machine.I2C object. If not
+                        provided a qwiic_i2c driver is created on first use.
+        @return: **Object** The QwiicSerlcd device object.
+        """
+        self.address = address if address is not None else _DEFAULT_ADDRESS
+        self._i2c = i2c_driver
+        self._raw = hasattr(i2c_driver, "writeto")
+        self._control = _LCD_DISPLAYON
+        self._mode = _LCD_ENTRYLEFT
+
+        # command buffers, one for each command length
+        self._b1 = bytearray(1)
+        self._b2 = bytearray(2)
+        self._b3 = bytearray(3)
+        self._b5 = bytearray(5)
+        self._b10 = bytearray(10)
+        self._b11 = bytearray(11)
+
+        # the bytes after the first of each block buffer, for writeBlock()
+        # without slicing a new buffer at each write
+        self._payloads = {}
+        for buf in (self._b3, self._b5, self._b10, self._b11):
+            self._payloads[len(buf)] = memoryview(buf)[1:]
+
+    def is_connected(self):
+        """!
+        @return **bool** True if the device is connected, otherwise False.
+        """
+        if self._raw:
+            return self.address in self._i2c.scan()
+        import qwiic_i2c
+        return qwiic_i2c.isDeviceConnected(self.address)
+
+    connected = property(is_connected)
+
+    def _send(self, buf, ms):
+        """!
+        Send a command buffer and wait for the display to process it.
+
+        @param bytearray buf: The bytes to send
+        @param int ms: Delay after sending, in milliseconds
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        i2c = self._i2c
+        if i2c is None:
+            import qwiic_i2c
+            i2c = self._i2c = qwiic_i2c.getI2CDriver()
+        if self._raw:
+            i2c.writeto(self.address, buf)
+            result = True
+        elif len(buf) == 1:
+            result = i2c.writeCommand(self.address, buf[0])
+        elif len(buf) == 2:
+            result = i2c.writeByte(self.address, buf[0], buf[1])
+        else:
+            result = i2c.writeBlock(self.address, buf[0], self._payloads[len(buf)])
+        if ms:
+            _sleep_ms(ms)
+        return result is not False
+
+    def _special(self, command, count = 1, ms = 50):
+        buf = self._b2
+        buf[0] = _SPECIAL_COMMAND
+        buf[1] = command
+        result = True
+        for i in range(count):
+            result = self._send(buf, 0)
+            if not result:
+                break
+        if ms:
+            _sleep_ms(ms)
+        return result
+
+    def _setting(self, command, ms = 10):
+        buf = self._b2
+        buf[0] = _SETTING_COMMAND
+        buf[1] = command
+        return self._send(buf, ms)
+
+    def begin(self):
+        """!
+        Initialize the operation of the SerLCD module
+
+        @return **bool** Returns true if the initialization was successful, otherwise False.
+        """
+        result = self._special(_LCD_DISPLAYCONTROL | self._control, 1, 1000)
+        result = self._special(_LCD_ENTRYMODESET | self._mode, 1, 1000) and result
+        return self.clearScreen() and result
+
+    def print(self, string):
+        """!
+        Print a string of characters (or bytes) to the LCD
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        buf = self._b1
+        for c in string:
+            buf[0] = c if isinstance(c, int) else ord(c)
+            if not self._send(buf, 10):
+                return False
+        return True
+
+    def clearScreen(self):
+        """!
+        Clear the screen and home the cursor
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        return self._setting(_CLEAR_COMMAND, 20)
+
+    def home(self):
+        """!
+        Return the cursor to the beginning of the display
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        return self._special(_LCD_RETURNHOME, 1, 60)
+
+    def setCursor(self, col, row):
+        """!
+        Set the cursor position to a column (0-19) and row (0-3)
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        row = min(max(0, row), 3)
+        return self._special(_LCD_SETDDRAMADDR | (col + _ROW_OFFSETS[row]), 1, 0)
+
+    def setContrast(self, contrast):
+        """!
+        Set the contrast of the LCD screen (0-255)
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        buf = self._b3
+        buf[0] = _SETTING_COMMAND
+        buf[1] = _CONTRAST_COMMAND
+        buf[2] = contrast
+        return self._send(buf, 10)
+
+    def setBacklight(self, r, g, b):
+        """!
+        Set the brightness of each backlight (red, green, blue - 0-255)
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        # the display is turned off while the settings change, to hide the messages
+        buf = self._b11
+        buf[0] = _SETTING_COMMAND
+        buf[1] = _SPECIAL_COMMAND
+        buf[2] = _LCD_DISPLAYCONTROL | (self._control & ~_LCD_DISPLAYON)
+        buf[3] = _SETTING_COMMAND
+        buf[4] = 128 + r * 29 // 255
+        buf[5] = _SETTING_COMMAND
+        buf[6] = 158 + g * 29 // 255
+        buf[7] = _SETTING_COMMAND
+        buf[8] = 188 + b * 29 // 255
+        buf[9] = _SPECIAL_COMMAND
+        buf[10] = _LCD_DISPLAYCONTROL | self._control
+        return self._send(buf, 50)
+
+    def setFastBacklight(self, r, g, b):
+        """!
+        Set backlight with no LCD messages or delays (red, green, blue - 0-255)
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        buf = self._b5
+        buf[0] = _SETTING_COMMAND
+        buf[1] = _SET_RGB_COMMAND
+        buf[2] = r
+        buf[3] = g
+        buf[4] = b
+        return self._send(buf, 10)
+
+    def specialCommand(self, command, count = 1):
+        """!
+        Send one (or multiple) special commands to the display.
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        return self._special(command, count)
+
+    def command(self, command):
+        """!
+        Send one setting command to the display.
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        return self._setting(command)
+
+    def moveCursorLeft(self, count = 1):
+        return self._special(_LCD_CURSORSHIFT, count)
+
+    def moveCursorRight(self, count = 1):
+        return self._special(_LCD_CURSORSHIFT | _LCD_MOVERIGHT, count)
+
+    def scrollDisplayLeft(self, count = 1):
+        return self._special(_LCD_CURSORSHIFT | _LCD_DISPLAYMOVE, count)
+
+    def scrollDisplayRight(self, count = 1):
+        return self._special(_LCD_CURSORSHIFT | _LCD_DISPLAYMOVE | _LCD_MOVERIGHT, count)
+
+    def _setControl(self, flag, on):
+        self._control = (self._control | flag) if on else (self._control & ~flag)
+        return self._special(_LCD_DISPLAYCONTROL | self._control)
+
+    def _setMode(self, flag, on):
+        self._mode = (self._mode | flag) if on else (self._mode & ~flag)
+        return self._special(_LCD_ENTRYMODESET | self._mode)
+
+    def cursor(self):
+        return self._setControl(_LCD_CURSORON, True)
+
+    def noCursor(self):
+        return self._setControl(_LCD_CURSORON, False)
+
+    def blink(self):
+        return self._setControl(_LCD_BLINKON, True)
+
+    def noBlink(self):
+        return self._setControl(_LCD_BLINKON, False)
+
+    def display(self):
+        return self._setControl(_LCD_DISPLAYON, True)
+
+    def noDisplay(self):
+        return self._setControl(_LCD_DISPLAYON, False)
+
+    def autoscroll(self):
+        return self._setMode(_LCD_ENTRYSHIFTINCREMENT, True)
+
+    def noAutoscroll(self):
+        return self._setMode(_LCD_ENTRYSHIFTINCREMENT, False)
+
+    def leftToRight(self):
+        return self._setMode(_LCD_ENTRYLEFT, True)
+
+    def rightToLeft(self):
+        return self._setMode(_LCD_ENTRYLEFT, False)
+
+    def createChar(self, location, charmap):
+        """!
+        Create custom character 0-7 from a list of 8 row bytes
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        buf = self._b10
+        buf[0] = _SETTING_COMMAND
+        buf[1] = _CREATE_CHAR_COMMAND + (location & 0x7)
+        for i in range(8):
+            buf[i + 2] = charmap[i]
+        return self._send(buf, 50)
+
+    def writeChar(self, location):
+        """!
+        Write custom character 0-7 to the display
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        return self._setting(_WRITE_CHAR_COMMAND + (location & 0x7), 60)
+
+    def enableSystemMessages(self):
+        return self._setting(_ENABLE_SYSTEM_MESSAGE_DISPLAY, 20)
+
+    def disableSystemMessages(self):
+        return self._setting(_DISABLE_SYSTEM_MESSAGE_DISPLAY, 20)
+
+    def enableSplash(self):
+        return self._setting(_ENABLE_SPLASH_DISPLAY, 20)
+
+    def disableSplash(self):
+        return self._setting(_DISABLE_SPLASH_DISPLAY, 20)
+
+    def saveSplash(self):
+        return self._setting(_SAVE_CURRENT_DISPLAY_AS_SPLASH, 20)
+
+    def setAddress(self, new_addr):
+        """!
+        Change the I2C address (persistent). 0x72 is the default.
+
+        @return **bool** Returns True if the I2C write was successful, otherwise False.
+        """
+        buf = self._b3
+        buf[0] = _SETTING_COMMAND
+        buf[1] = _ADDRESS_COMMAND
+        buf[2] = new_addr
+        result = self._send(buf, 50)
+        self.address = new_addr
+        return result
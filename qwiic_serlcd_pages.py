@@ -0,0 +1,295 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_pages.py
+#
+# Virtual screens (pages) for the SparkFun Serial LCDs (QWIIC)
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_pages
+==================
+Virtual screens for the SparkFun SerLCD QWIIC products.
+
+Each page is an off-screen copy of the display, with its own text and custom
+characters, that can be updated at any time without touching the bus. Showing
+a page sends only the characters that differ from the screen and uploads only
+the custom characters the page uses, so rotating through pages is fast and
+doesn't flicker.
+"""
+#-----------------------------------------------------------------------------
+import qwiic_serlcd
+
+class Page(object):
+    """!
+    An off-screen display page. The methods mirror the QwiicSerlcd methods of
+    the same name, but change only the page. If the page is being shown, the
+    changes are sent to the display straight away.
+    """
+    def __init__(self, manager = None):
+        """!
+        @param PageManager manager: The page manager showing the page
+
+        @return **Object** The Page object.
+        """
+        self.manager = manager
+        self.rows = [bytearray(b" " * qwiic_serlcd.MAX_COLUMNS) for i in range(qwiic_serlcd.MAX_ROWS)]
+        self.glyphs = [None] * 8
+        self.glyphChars = [None] * 8 # characters automatically loaded into each location
+        self.charmap = None # translation table, with the automatically loaded characters
+        self.col = 0
+        self.row = 0
+
+    def clearScreen(self):
+        """!
+            Clear the page and home the page cursor.
+
+            @return **bool** Returns True if the page isn't shown or the I2C writes were successful, otherwise False.
+        """
+        for line in self.rows:
+            line[:] = b" " * qwiic_serlcd.MAX_COLUMNS
+        self.col = 0
+        self.row = 0
+        return self._changed()
+
+    def setCursor(self, col, row):
+        """!
+            Set the page cursor position, where the next print() starts.
+
+            @param int col: The column position (0-19)
+            @param int row: The row position (0-3)
+        """
+        self.col = min(max(0, col), qwiic_serlcd.MAX_COLUMNS - 1)
+        self.row = min(max(0, row), qwiic_serlcd.MAX_ROWS - 1)
+
+    def print(self, string):
+        """!
+            Print a string of characters on the page, at the page cursor.
+            Characters are translated to the display character ROM as for
+            QwiicSerlcd.print(), and characters with a known bitmap are given a
+            custom character location of the page. Bytes are written as raw
+            character codes.
+
+            @param string string: The string you would like to print. example: "Hello"
+
+            @return **bool** Returns True if the page isn't shown or the I2C writes were successful, otherwise False.
+        """
+        if isinstance(string, (bytes, bytearray)):
+            data = string
+        else:
+            data = self._encode(string)
+
+        pos = self.row * qwiic_serlcd.MAX_COLUMNS + self.col
+        for code in data:
+            self.rows[pos // qwiic_serlcd.MAX_COLUMNS][pos % qwiic_serlcd.MAX_COLUMNS] = code & 0xFF
+            pos = (pos + 1) % (qwiic_serlcd.MAX_ROWS * qwiic_serlcd.MAX_COLUMNS)
+        self.row = pos // qwiic_serlcd.MAX_COLUMNS
+        self.col = pos % qwiic_serlcd.MAX_COLUMNS
+        return self._changed()
+
+    def createChar(self, location, charmap):
+        """!
+            Set the custom character bitmap for a location on this page. It is
+            uploaded to the display when the page is shown and uses it.
+
+            @param int location: character number 0 to 7
+            @param list of int charmap: byte array for character
+
+            @return **bool** Returns True if the page isn't shown or the I2C writes were successful, otherwise False.
+        """
+        location &= 0x7
+        self.glyphs[location] = list(charmap[:8])
+        self._setGlyphChar(location, None)
+        return self._changed()
+
+    def writeChar(self, location):
+        """!
+            Write a custom character on the page, at the page cursor.
+
+            @param int location: character number 0 to 7
+
+            @return **bool** Returns True if the page isn't shown or the I2C writes were successful, otherwise False.
+        """
+        return self.print(bytes([location & 0x7]))
+
+    def isShown(self):
+        """!
+        @return **bool** True if the page is the one on the display.
+        """
+        return self.manager is not None and self.manager.current is self
+
+    def _changed(self):
+        """!
+            Send the changes to the display if the page is shown.
+
+            @return **bool** Returns True if the page isn't shown or the I2C writes were successful, otherwise False.
+        """
+        if self.isShown():
+            return self.manager.show(self)
+        return True
+
+    def _encode(self, string):
+        """!
+            Translate a string to display character codes, using the cached
+            translation table of the page.
+
+            @param string string: The string to translate
+
+            @return **bytes** The display character codes
+        """
+        if self.charmap is None:
+            self.charmap = qwiic_serlcd._Charmap()
+        return qwiic_serlcd._encodeText(string, self.charmap, self)
+
+    def _glyphFor(self, code, text):
+        """!
+            Find the display character code for a character missing from the
+            translation table, giving it a free custom character location of
+            the page if a bitmap is known for it.
+
+            @param int code: The Unicode code point of the character
+            @param string text: The string being printed, whose characters must keep their locations
+
+            @return **int** The display character code
+        """
+        char = chr(code)
+        font = self.manager.lcd._state.font if self.manager is not None else {}
+        bitmap = font.get(char, qwiic_serlcd._GLYPH_FONT.get(char))
+        if bitmap is None:
+            return qwiic_serlcd._REPLACEMENT_CODE # not cached, a bitmap may be defined later
+
+        # Use a free location, or one holding an automatically loaded character
+        # that is neither on the page nor in the string being printed
+        for location in range(8):
+            if self.glyphs[location] is None:
+                break
+        else:
+            for location in range(8):
+                used = self.glyphChars[location]
+                if used is None or used in text:
+                    continue
+                for line in self.rows:
+                    if location in line or location + 8 in line:
+                        break
+                else:
+                    break
+            else:
+                return qwiic_serlcd._REPLACEMENT_CODE
+
+        self.glyphs[location] = list(bitmap)
+        self._setGlyphChar(location, char)
+        return location
+
+    def _setGlyphChar(self, location, char):
+        """!
+            Set the character automatically loaded in a custom character
+            location, and update the translation table to match.
+
+            @param int location: character number 0 to 7
+            @param string char: The character, or None
+        """
+        old = self.glyphChars[location]
+        if old is not None and self.charmap is not None:
+            self.charmap.pop(ord(old), None)
+        self.glyphChars[location] = char
+        if char is not None and self.charmap is not None:
+            self.charmap[ord(char)] = location
+
+class PageManager(object):
+    """!
+    Shows one of a set of pages on a QwiicSerlcd display. While a page is
+    shown its custom characters own the display's custom character locations.
+    """
+    def __init__(self, lcd):
+        """!
+        @param QwiicSerlcd lcd: The display to show the pages on
+
+        @return **Object** The PageManager object.
+        """
+        self.lcd = lcd
+        self.pages = []
+        self.current = None
+
+    def addPage(self):
+        """!
+        Add a blank page.
+
+        @return **Page** The new page
+        """
+        page = Page(self)
+        self.pages.append(page)
+        return page
+
+    def show(self, page):
+        """!
+        Show a page. Only the custom characters the page uses that aren't
+        already loaded, and the characters that differ from the screen, are
+        sent. The cursor is left at the page cursor.
+
+        @param Page page: The page to show
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        lcd = self.lcd
+        with lcd.atomic():
+            self.current = page
+            target = lcd.snapshot()
+            used = set()
+            for line in page.rows:
+                used.update(code for code in line if code < 8)
+            for location in used:
+                if page.glyphs[location] is not None:
+                    target.glyphs[location] = page.glyphs[location]
+                    target.glyphChars[location] = page.glyphChars[location]
+            target.shadow = page.rows
+            target.col = page.col
+            target.row = page.row
+            target.shift = 0
+            return lcd.restoreSnapshot(target)
+
+    def next(self):
+        """!
+        Show the page after the current one, going back to the first page
+        after the last.
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        if not self.pages:
+            return True
+        if self.current in self.pages:
+            index = (self.pages.index(self.current) + 1) % len(self.pages)
+        else:
+            index = 0
+        return self.show(self.pages[index])
@@ -0,0 +1,210 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_scheduler.py
+#
+# Frame-rate limited redraw scheduler for the SparkFun Serial LCDs (QWIIC)
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_scheduler
+======================
+Redraw scheduler for the SparkFun SerLCD QWIIC products.
+
+The screen is split into regions, each with an update priority and a maximum
+refresh rate. Applications update the text of a region whenever they like, and
+each call to service() redraws the most important changed regions that fit in
+the bus time available for one cycle.
+"""
+#-----------------------------------------------------------------------------
+import time
+
+# Initial estimate of the bus time taken by one character or cursor write, in
+# seconds. The scheduler refines this from the time each redraw actually takes.
+_WRITE_TIME = 0.011
+
+class Region(object):
+    """!
+    A fixed area of one row of the display.
+    """
+    def __init__(self, col, row, width, priority = 0, max_rate = None):
+        """!
+        @param int col: The first column of the region
+        @param int row: The row of the region
+        @param int width: Number of characters in the region
+        @param int priority: Update priority - higher priority regions are redrawn first
+        @param float max_rate: Maximum number of redraws per second, or None for no limit
+
+        @return **Object** The Region object.
+        """
+        self.col = col
+        self.row = row
+        self.width = width
+        self.priority = priority
+        self.interval = 1.0 / max_rate if max_rate else 0.0
+        self.text = " " * width
+        self._shown = None  # the text on the display, None if not drawn yet
+        self._dirtySince = None
+        self._lastDraw = None
+
+    def update(self, text):
+        """!
+        Set the text of the region. It is padded or cut to the region width,
+        and drawn by a later call to RedrawScheduler.service().
+
+        @param string text: The new text
+        """
+        text = str(text)[:self.width]
+        text = text + " " * (self.width - len(text))
+        if text != self.text:
+            self.text = text
+            if text == self._shown:
+                self._dirtySince = None # changed back to what is on the display
+            elif self._dirtySince is None:
+                self._dirtySince = time.time()
+
+    def isDirty(self):
+        """!
+        @return **bool** True if the region has changes that are not on the display yet.
+        """
+        return self.text != self._shown
+
+    def _span(self):
+        """!
+        @return **tuple** The first and last+1 column of the changed part of the region
+        """
+        text = self.text
+        shown = self._shown
+        if shown is None:
+            return 0, self.width
+        first = 0
+        while text[first] == shown[first]:
+            first += 1
+        last = self.width
+        while text[last - 1] == shown[last - 1]:
+            last -= 1
+        return first, last
+
+class RedrawScheduler(object):
+    """!
+    Redraw scheduler for a QwiicSerlcd display.
+    """
+    def __init__(self, lcd, cycle_time = 0.1):
+        """!
+        @param QwiicSerlcd lcd: The display to draw on
+        @param float cycle_time: Bus time available for each call to service(), in seconds
+
+        @return **Object** The RedrawScheduler object.
+        """
+        self.lcd = lcd
+        self.cycleTime = cycle_time
+        self.regions = []
+        self._writeTime = _WRITE_TIME
+
+    def addRegion(self, col, row, width, priority = 0, max_rate = None):
+        """!
+        Add a region to the screen.
+
+        @param int col: The first column of the region
+        @param int row: The row of the region
+        @param int width: Number of characters in the region
+        @param int priority: Update priority - higher priority regions are redrawn first
+        @param float max_rate: Maximum number of redraws per second, or None for no limit
+
+        @return **Region** The new region
+        """
+        region = Region(col, row, width, priority, max_rate)
+        self.regions.append(region)
+        return region
+
+    def service(self):
+        """!
+        Run one redraw cycle. The changed regions that are due for a redraw are
+        taken in order of priority (oldest change first for equal priority),
+        and drawn while their estimated bus time fits in the cycle time. A
+        region that doesn't fit is skipped, so smaller ones can still be drawn.
+
+        @return **int** Number of regions drawn
+        """
+        now = time.time()
+        due = []
+        for region in self.regions:
+            if not region.isDirty():
+                continue
+            if region._lastDraw is not None and now - region._lastDraw < region.interval:
+                continue
+            due.append(region)
+        due.sort(key=lambda region: (-region.priority, region._dirtySince or 0))
+
+        budget = self.cycleTime
+        tried = False
+        drawn = 0
+        for region in due:
+            first, last = region._span()
+            cost = (last - first + 1) * self._writeTime
+            if tried and cost > budget:
+                continue
+            budget -= self._draw(region, first, last)
+            tried = True
+            if not region.isDirty():
+                drawn += 1
+            if budget <= 0:
+                break
+        return drawn
+
+    def _draw(self, region, first, last):
+        """!
+        Draw the changed part of a region, and learn the time per write. If
+        the writes fail the region stays dirty, and is drawn again by a later
+        cycle.
+
+        @param Region region: The region to draw
+        @param int first: The first changed column in the region
+        @param int last: The last changed column in the region, plus one
+
+        @return **float** The time taken, in seconds
+        """
+        text = region.text
+        start = time.time()
+        with self.lcd.atomic():
+            result = self.lcd.setCursor(region.col + first, region.row) and self.lcd.print(text[first:last])
+        elapsed = time.time() - start
+
+        region._lastDraw = start + elapsed
+        if result:
+            region._shown = text
+            region._dirtySince = None
+            self._writeTime = 0.8 * self._writeTime + 0.2 * elapsed / (last - first + 1)
+        return elapsed
@@ -0,0 +1,293 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_shm.py
+#
+# Shared-memory framebuffer for the SparkFun Serial LCDs (QWIIC)
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_shm
+================
+Shared-memory framebuffer for the SparkFun SerLCD QWIIC products.
+
+A producer in another process writes the screen straight into a shared memory
+block (multiprocessing.shared_memory) or a memory-mapped file, without a
+message or a lock per update. A flusher in the process that owns the display
+polls the generation counter of the block, and pushes only the cells that
+changed to the display.
+
+The block is a generation counter followed by the display character codes of
+each row. The counter works as a sequence lock: the producer makes it odd
+while writing and even when done, so the flusher never draws a half-written
+update. There must be only one producer for each block.
+
+    # producer process
+    fb = SharedFramebuffer("serlcd", create=True)
+    fb.write(0, 1, "Speed: %5.1f" % speed)
+
+    # display process
+    flusher = SharedFrameFlusher(lcd, SharedFramebuffer("serlcd"))
+    flusher.start()
+"""
+#-----------------------------------------------------------------------------
+import struct
+import threading
+import time
+import qwiic_serlcd
+
+# Block layout - the generation counter, then the rows of character codes
+_HEADER = "<I"
+_HEADER_SIZE = 4
+_CELLS = qwiic_serlcd.MAX_ROWS * qwiic_serlcd.MAX_COLUMNS
+_SIZE = _HEADER_SIZE + _CELLS
+
+class SharedFramebuffer(object):
+    """!
+    A framebuffer in a shared memory block or a memory-mapped file.
+    """
+    def __init__(self, name = None, path = None, create = False):
+        """!
+        @param string name: Name of the multiprocessing.shared_memory block
+        @param string path: The file to map instead, example: "/dev/shm/serlcd"
+        @param bool create: Create the block (or file), blank, instead of opening it
+
+        @return **Object** The SharedFramebuffer object.
+        """
+        self._shm = None
+        self._mmap = None
+        if path is not None:
+            import mmap
+            mode = "w+b" if create else "r+b"
+            with open(path, mode) as f:
+                if create:
+                    f.truncate(_SIZE)
+                self._mmap = mmap.mmap(f.fileno(), _SIZE)
+            self._buffer = memoryview(self._mmap)
+        else:
+            from multiprocessing import shared_memory
+            if create:
+                self._shm = shared_memory.SharedMemory(name, create=True, size=_SIZE)
+            else:
+                # Only the creator should remove the block. Before Python 3.13
+                # every process using it would remove it when exiting.
+                try:
+                    self._shm = shared_memory.SharedMemory(name, track=False)
+                except TypeError:
+                    self._shm = shared_memory.SharedMemory(name)
+                    from multiprocessing import resource_tracker
+                    resource_tracker.unregister(self._shm._name, "shared_memory")
+            self._buffer = self._shm.buf
+        self.name = name
+        self.path = path
+
+        ## The character codes of the screen, row after row, for writing in place between begin() and end()
+        self.cells = self._buffer[_HEADER_SIZE:_SIZE]
+        if create:
+            self.cells[:] = b" " * _CELLS
+
+    @property
+    def generation(self):
+        """!
+        @return **int** The generation counter - odd while an update is being written
+        """
+        return struct.unpack_from(_HEADER, self._buffer, 0)[0]
+
+    def begin(self):
+        """!
+        Start an update - the flusher ignores the block until end().
+        """
+        struct.pack_into(_HEADER, self._buffer, 0, (self.generation | 1) & 0xFFFFFFFF)
+
+    def end(self):
+        """!
+        Finish an update, so the flusher draws it.
+        """
+        struct.pack_into(_HEADER, self._buffer, 0, (self.generation + 1) & 0xFFFFFFFE)
+
+    def write(self, col, row, text):
+        """!
+        Write text at a position. Characters are translated to the display
+        character ROM; characters missing from it are shown as '?'. Bytes are
+        written as raw character codes.
+
+        @param int col: The column position (0-19)
+        @param int row: The row position (0-3)
+        @param string text: The text
+        """
+        col = min(max(0, col), qwiic_serlcd.MAX_COLUMNS - 1)
+        row = min(max(0, row), qwiic_serlcd.MAX_ROWS - 1)
+        if not isinstance(text, (bytes, bytearray)):
+            text = _encode(text)
+        text = text[:qwiic_serlcd.MAX_COLUMNS - col]
+        start = row * qwiic_serlcd.MAX_COLUMNS + col
+        self.begin()
+        self.cells[start:start + len(text)] = text
+        self.end()
+
+    def setFrame(self, rows):
+        """!
+        Write the text of the whole screen.
+
+        @param list of string rows: The text of each row
+        """
+        self.begin()
+        for row in range(qwiic_serlcd.MAX_ROWS):
+            text = rows[row] if row < len(rows) else b""
+            if not isinstance(text, (bytes, bytearray)):
+                text = _encode(text)
+            text = bytes(text[:qwiic_serlcd.MAX_COLUMNS]).ljust(qwiic_serlcd.MAX_COLUMNS)
+            start = row * qwiic_serlcd.MAX_COLUMNS
+            self.cells[start:start + qwiic_serlcd.MAX_COLUMNS] = text
+        self.end()
+
+    def read(self):
+        """!
+        Read a consistent copy of the screen.
+
+        @return **tuple** The generation and the character codes of each row, or None while an update is being written
+        """
+        generation = self.generation
+        if generation & 1:
+            return None
+        cells = bytes(self.cells)
+        if self.generation != generation:
+            return None
+        columns = qwiic_serlcd.MAX_COLUMNS
+        return generation, [cells[row * columns:(row + 1) * columns] for row in range(qwiic_serlcd.MAX_ROWS)]
+
+    def close(self):
+        """!
+        Stop using the block. It stays available to other processes.
+        """
+        self.cells.release()
+        if self._shm is not None:
+            self._buffer = None
+            self._shm.close()
+        else:
+            self._buffer.release()
+            self._mmap.close()
+
+    def unlink(self):
+        """!
+        Remove the block, once every process has closed it.
+        """
+        if self._shm is not None:
+            self._shm.unlink()
+        else:
+            import os
+            os.unlink(self.path)
+
+# Translation table to the display character ROM, shared by every framebuffer
+_CHARMAP = qwiic_serlcd._Charmap()
+
+def _encode(text):
+    """!
+    @param string text: Text to translate
+    @return **bytes** The display character codes, with '?' for characters missing from the ROM
+    """
+    return qwiic_serlcd._encodeText(text, _CHARMAP)
+
+class SharedFrameFlusher(object):
+    """!
+    Draws a shared framebuffer on a QwiicSerlcd display.
+    """
+    def __init__(self, lcd, framebuffer, interval = 0.02):
+        """!
+        @param QwiicSerlcd lcd: The display to draw on
+        @param SharedFramebuffer framebuffer: The framebuffer to draw
+        @param float interval: Time between polls of the generation counter, in seconds
+
+        @return **Object** The SharedFrameFlusher object.
+        """
+        self.lcd = lcd
+        self.framebuffer = framebuffer
+        self.interval = interval
+        self._generation = None
+        self._running = False
+        self._thread = None
+
+    def poll(self):
+        """!
+        Draw the framebuffer if it changed since the last drawn generation,
+        sending only the cells that differ from the display. A generation that
+        fails to draw is drawn again by the next poll.
+
+        @return **bool** True if a new generation was drawn
+        """
+        generation = self.framebuffer.generation
+        if generation == self._generation or generation & 1:
+            return False
+        frame = self.framebuffer.read()
+        if frame is None:
+            return False # being written, try again next poll
+
+        lcd = self.lcd
+        with lcd.atomic():
+            target = lcd.snapshot()
+            target.shadow = frame[1]
+            if not lcd.restoreSnapshot(target):
+                return False
+        self._generation = frame[0]
+        return True
+
+    def start(self):
+        """!
+        Poll in a background thread, until stop().
+        """
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="qwiic_serlcd flusher")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """!
+        Stop the background thread.
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """!
+        Background thread loop.
+        """
+        while self._running:
+            try:
+                self.poll()
+            except (IOError, OSError):
+                pass # try again next poll
+            time.sleep(self.interval)
@@ -0,0 +1,257 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_template.py
+#
+# Screen templates for the SparkFun Serial LCDs (QWIIC)
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_template
+=====================
+Compiled screen templates for the SparkFun SerLCD QWIIC products.
+
+A screen layout is written as text with slots for values, in str.format()
+style. The layout is parsed once into static text, which is written once, and
+slots with a fixed position and width. Rendering the template sends only the
+slots whose text changed, in one stream with a cursor move between slots that
+aren't next to each other. The text of a render is translated to character
+codes in one pass, so the custom characters it needs keep their locations.
+
+    screen = ScreenTemplate(lcd, "Temp {temp:5.1f}C\\n"
+                                 "RH   {rh:3d}%  {state:<6}")
+    screen.render(temp=21.5, rh=40, state="idle")
+
+A slot is {name} or {name:spec}. Its width is the width in the format spec, or
+else the length of the slot in the layout, so the layout looks like the screen.
+Use {{ and }} for braces in the static text.
+"""
+#-----------------------------------------------------------------------------
+import qwiic_serlcd
+
+_SPACE = 0x20
+_OVERFLOW = 0x23 # '#', shown across a number slot when the value doesn't fit
+
+def _shows(state, col, row, data):
+    """!
+    @param _DisplayState state: The cached display state
+    @param int col: The first column
+    @param int row: The row
+    @param bytes data: Character codes
+    @return **bool** True if the display is known to show the character codes at the position
+    """
+    if state.shadow[row][col:col + len(data)] != data:
+        return False
+    unknown = state.unknown
+    return not unknown or not any((row, c) in unknown for c in range(col, col + len(data)))
+
+def _specWidth(spec):
+    """!
+    @param string spec: A format spec, such as ">6.1f"
+    @return **int** The width given in the format spec, or None
+    """
+    i = 0
+    if len(spec) > 1 and spec[1] in "<>=^":
+        i = 2
+    elif spec[:1] in "<>=^":
+        i = 1
+    if spec[i:i + 1] in ("+", "-", " "):
+        i += 1
+    for flag in "z#0":
+        if spec[i:i + 1] == flag:
+            i += 1
+    start = i
+    while i < len(spec) and "0" <= spec[i] <= "9":
+        i += 1
+    return int(spec[start:i]) if i > start else None
+
+class _Slot(object):
+    """!
+    A value slot of a template.
+    """
+    def __init__(self, name, spec, col, row, width):
+        """!
+        @param string name: Name of the value
+        @param string spec: The format spec of the value
+        @param int col: The first column of the slot
+        @param int row: The row of the slot
+        @param int width: Number of characters in the slot
+        """
+        self.name = name
+        self.format = "{:" + spec + "}"
+        self.col = col
+        self.row = row
+        self.width = width
+
+class ScreenTemplate(object):
+    """!
+    A screen layout of static text and value slots, for a QwiicSerlcd display.
+    """
+    def __init__(self, lcd, layout):
+        """!
+        @param QwiicSerlcd lcd: The display to show the screen on
+        @param layout: The text of each row, as a list or separated by newlines
+
+        @return **Object** The ScreenTemplate object.
+        """
+        self.lcd = lcd
+        ## The slots, in the order they appear on the screen
+        self.slots = []
+        ## The static text: the column, row and text of each segment
+        self.static = []
+
+        if isinstance(layout, str):
+            layout = layout.split("\n")
+        for row in range(min(len(layout), qwiic_serlcd.MAX_ROWS)):
+            self._compileRow(row, layout[row])
+
+    def _compileRow(self, row, line):
+        """!
+        Split the layout of a row into static text and slots.
+
+        @param int row: The row
+        @param string line: The layout of the row
+        """
+        col = 0
+        text = ""
+        start = 0
+        i = 0
+        while i < len(line) and col + len(text) < qwiic_serlcd.MAX_COLUMNS:
+            char = line[i]
+            if char in "{}" and line[i + 1:i + 2] == char:
+                text += char
+                i += 2
+                continue
+            if char != "{":
+                text += char
+                i += 1
+                continue
+
+            end = line.find("}", i)
+            if end < 0:
+                raise ValueError("Unterminated slot in template row %d: %s" % (row, line))
+            field = line[i + 1:end]
+            name, colon, spec = field.partition(":")
+            width = _specWidth(spec)
+            if width is None:
+                width = end + 1 - i
+
+            if text:
+                self.static.append((start, row, text))
+            col = start + len(text)
+            width = min(width, qwiic_serlcd.MAX_COLUMNS - col)
+            self.slots.append(_Slot(name, spec, col, row, width))
+            col += width
+            start = col
+            text = ""
+            i = end + 1
+
+        text = text[:qwiic_serlcd.MAX_COLUMNS - start]
+        if text:
+            self.static.append((start, row, text))
+
+    def _format(self, slot, value):
+        """!
+        Format a value to the width of its slot. Numbers that don't fit are
+        shown as '#' across the slot, other values are cut.
+
+        @param _Slot slot: The slot
+        @param value: The value
+
+        @return **string** The text of the slot, exactly as wide as the slot
+        """
+        try:
+            text = slot.format.format(value)
+        except (TypeError, ValueError):
+            text = str(value)
+        if len(text) > slot.width and isinstance(value, (int, float)):
+            return chr(_OVERFLOW) * slot.width
+        text = text[:slot.width]
+        return text + chr(_SPACE) * (slot.width - len(text))
+
+    def render(self, values = None, **kwargs):
+        """!
+        Show the template with values in its slots. The static text is written
+        if the display doesn't show it already, and only the slots whose text
+        changed are sent, as one stream. Slots without a value are left as
+        they are.
+
+        @param dict values: The value of each slot, by name
+        @param kwargs: More values, by name
+
+        @return **bool** Returns True if the I2C writes were successful, otherwise False.
+        """
+        if values is None:
+            values = kwargs
+        elif kwargs:
+            values = dict(values)
+            values.update(kwargs)
+
+        slots = [slot for slot in self.slots if slot.name in values]
+        texts = [text for col, row, text in self.static]
+        texts.extend(self._format(slot, values[slot.name]) for slot in slots)
+
+        lcd = self.lcd
+        with lcd.atomic():
+            # one translation for the whole screen, so a custom character
+            # loaded for one segment isn't taken by another
+            data = lcd._encode("".join(texts))
+            state = lcd._state
+            result = True
+            pos = 0
+            for col, row, text in self.static:
+                segment = data[pos:pos + len(text)]
+                pos += len(text)
+                if not _shows(state, col, row, segment):
+                    result = lcd.printAt(col, row, segment) and result
+
+            # each changed slot is a run, in screen order
+            rows = list(state.shadow)
+            runs = []
+            for slot in slots:
+                segment = data[pos:pos + slot.width]
+                pos += slot.width
+                if _shows(state, slot.col, slot.row, segment):
+                    continue
+                if rows[slot.row] is state.shadow[slot.row]:
+                    rows[slot.row] = bytearray(rows[slot.row])
+                rows[slot.row][slot.col:slot.col + slot.width] = segment
+                runs.append((slot.row, slot.col, slot.col + slot.width))
+
+            if runs:
+                stream = []
+                lcd._writeRuns(rows, runs, stream)
+                result = lcd._sendRuns(rows, runs, stream) and result
+        return result
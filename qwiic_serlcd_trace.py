@@ -0,0 +1,320 @@
+#-----------------------------------------------------------------------------
+# qwiic_serlcd_trace.py
+#
+# Recording and replay of SparkFun Serial LCD (QWIIC) I2C traffic
+#
+#------------------------------------------------------------------------
+#
+# Written by  SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electroncis qwiic
+# qwiic sensor/board ecosystem
+#
+# More information on qwiic is at https:// www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun. Buy a board!
+#==================================================================================
+# Copyright (c) 2026 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#==================================================================================
+#
+# pylint: disable=line-too-long, invalid-name
+#
+
+"""
+qwiic_serlcd_trace
+==================
+Recording and replay of the I2C traffic of the SparkFun SerLCD QWIIC products.
+
+RecordingDriver wraps an I2C driver and saves every write, with its start time
+and duration, to a compact binary trace. A trace can be replayed into the
+emulator or a real display, and the report shows where the time went: in
+writes of each kind (text, cursor moves, mode changes, custom characters...)
+and idle between writes.
+
+    lcd = qwiic_serlcd.QwiicSerlcd(i2c_driver=RecordingDriver(qwiic_i2c.getI2CDriver(), "app.trace"))
+
+    python qwiic_serlcd_trace.py app.trace [--display] [--realtime]
+"""
+#-----------------------------------------------------------------------------
+import struct
+import sys
+import time
+import qwiic_serlcd_emulator
+
+# Trace file format: the magic bytes, then one record per write - the time since
+# the previous write started and the write duration in microseconds, the
+# operation (with _FAILED set if it raised an error), the I2C address and the
+# number of bytes, followed by the bytes written.
+_MAGIC = b"SLCDTRC1"
+_RECORD = "<IIBBB"
+_RECORD_SIZE = struct.calcsize(_RECORD)
+_MAX_MICROSECONDS = 0xFFFFFFFF
+
+_OPERATIONS = ["writeCommand", "writeByte", "writeWord", "writeBlock"]
+_FAILED = 0x80
+
+class RecordingDriver(object):
+    """!
+    I2C driver wrapper that records every write to a trace file. Everything
+    else is passed to the wrapped driver.
+    """
+    def __init__(self, i2c_driver, trace):
+        """!
+        @param i2c_driver: The I2C driver object to wrap
+        @param trace: The trace file name, or a binary file object to write to
+
+        @return **Object** The RecordingDriver object.
+        """
+        self._driver = i2c_driver
+        if hasattr(trace, "write"):
+            self._file = trace
+        else:
+            self._file = open(trace, "wb")
+        self._file.write(_MAGIC)
+        self._last = None
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def writeCommand(self, address, commandCode):
+        return self._record(0, address, [commandCode], commandCode)
+
+    def writeByte(self, address, commandCode, value):
+        return self._record(1, address, [commandCode, value], commandCode, value)
+
+    def writeWord(self, address, commandCode, value):
+        return self._record(2, address, [commandCode, value & 0xFF, value >> 8], commandCode, value)
+
+    def writeBlock(self, address, commandCode, value):
+        return self._record(3, address, [commandCode] + list(value), commandCode, value)
+
+    def close(self):
+        """!
+        Close the trace file.
+        """
+        self._file.close()
+
+    def _record(self, operation, address, data, *args):
+        """!
+        Write to the wrapped driver, and record the write.
+
+        @param int operation: Index of the driver method in _OPERATIONS
+        @param int address: The I2C address written to
+        @param list of int data: The bytes written
+        @param args: The arguments of the driver method, after the address
+
+        @return The value returned by the driver method
+        """
+        start = time.time()
+        try:
+            result = getattr(self._driver, _OPERATIONS[operation])(address, *args)
+        except Exception:
+            self._save(start, operation | _FAILED, address, data)
+            raise
+        self._save(start, operation, address, data)
+        return result
+
+    def _save(self, start, operation, address, data):
+        """!
+        Append a record to the trace file.
+
+        @param float start: Time the write started
+        @param int operation: The operation, with _FAILED set if it failed
+        @param int address: The I2C address written to
+        @param list of int data: The bytes written
+        """
+        gap = 0 if self._last is None else int((start - self._last) * 1e6)
+        duration = int((time.time() - start) * 1e6)
+        self._last = start
+        self._file.write(struct.pack(_RECORD, min(gap, _MAX_MICROSECONDS), min(duration, _MAX_MICROSECONDS),
+                                      operation, address, len(data)))
+        self._file.write(bytes(bytearray(data)))
+        self._file.flush()
+
+class Transaction(object):
+    """!
+    One write from a trace.
+    """
+    def __init__(self, start, duration, operation, address, data, failed):
+        """!
+        @param float start: Time the write started, in seconds from the first write
+        @param float duration: Time the write took, in seconds
+        @param string operation: The driver method, example: "writeBlock"
+        @param int address: The I2C address written to
+        @param bytes data: The bytes written
+        @param bool failed: True if the write raised an error
+
+        @return **Object** The Transaction object.
+        """
+        self.start = start
+        self.duration = duration
+        self.operation = operation
+        self.address = address
+        self.data = data
+        self.failed = failed
+
+def readTrace(trace):
+    """!
+    Read the writes from a trace file.
+
+    @param trace: The trace file name, or a binary file object to read from
+
+    @return **list of Transaction** The writes, in order
+    """
+    if hasattr(trace, "read"):
+        content = trace.read()
+    else:
+        with open(trace, "rb") as f:
+            content = f.read()
+    if content[:len(_MAGIC)] != _MAGIC:
+        raise ValueError("Not a SerLCD trace file")
+
+    transactions = []
+    offset = len(_MAGIC)
+    start = 0.0
+    while offset + _RECORD_SIZE <= len(content):
+        gap, duration, operation, address, length = struct.unpack_from(_RECORD, content, offset)
+        offset += _RECORD_SIZE
+        data = content[offset:offset + length]
+        offset += length
+        if transactions:
+            start += gap / 1e6
+        transactions.append(Transaction(start, duration / 1e6, _OPERATIONS[operation & 0x3],
+                                        address, data, bool(operation & _FAILED)))
+    return transactions
+
+class Report(object):
+    """!
+    Where the time of a trace went, from replay().
+    """
+    def __init__(self):
+        self.transactions = 0
+        self.failures = 0
+        self.duration = 0.0      # seconds from the first write to the end of the last one
+        self.writeTime = 0.0     # recorded seconds spent in writes
+        self.replayTime = 0.0    # seconds spent in writes during the replay
+        self.bytes = {}          # bytes sent, for each category
+        self.categoryTime = {}   # recorded seconds spent in writes, for each category
+        self.categoryReplay = {} # replay seconds spent in writes, for each category
+        self.emulator = None     # the emulator the trace was replayed into, if any
+
+    def text(self):
+        """!
+        @return **string** The report as text, one line for each category
+        """
+        lines = ["%-10s %8s %12s %12s" % ("", "bytes", "recorded ms", "replay ms")]
+        for category in sorted(self.bytes, key=lambda category: -self.categoryTime.get(category, 0)):
+            lines.append("%-10s %8d %12.1f %12.1f" % (category, self.bytes[category],
+                         self.categoryTime.get(category, 0) * 1000, self.categoryReplay.get(category, 0) * 1000))
+        lines.append("%-10s %8d %12.1f %12.1f" % ("writes", sum(self.bytes.values()),
+                     self.writeTime * 1000, self.replayTime * 1000))
+        lines.append("%-10s %8s %12.1f" % ("idle", "", (self.duration - self.writeTime) * 1000))
+        lines.append("%d writes (%d failed) over %.3f s" % (self.transactions, self.failures, self.duration))
+        return "\n".join(lines)
+
+def replay(trace, i2c_driver = None, realtime = False):
+    """!
+    Replay a trace into the emulator or a display, and work out where the
+    time went. The time of each write is shared between the kinds of bytes it
+    carried. For the emulator, the replay time is the emulated bus time.
+
+    @param trace: The trace file name, a binary file object, or a list of Transaction
+    @param i2c_driver: The I2C driver to replay the writes to, or None for the emulator
+    @param bool realtime: Keep the recorded time between the writes, instead of replaying as fast as possible
+
+    @return **Report** Where the time went
+    """
+    transactions = trace if isinstance(trace, list) else readTrace(trace)
+    report = Report()
+    if i2c_driver is None:
+        i2c_driver = qwiic_serlcd_emulator.Emulator()
+        report.emulator = i2c_driver
+
+    # a second emulator sorts the bytes of each write into categories
+    classifier = qwiic_serlcd_emulator.Emulator()
+    begin = time.time()
+    for transaction in transactions:
+        if realtime:
+            delay = begin + transaction.start - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+        data = list(transaction.data)
+        args = (data[0],) + ((data[1],) if transaction.operation == "writeByte" else ())
+        if transaction.operation == "writeWord":
+            args = (data[0], data[1] | (data[2] << 8))
+        elif transaction.operation == "writeBlock":
+            args = (data[0], data[1:])
+        start = time.time()
+        busTime = getattr(i2c_driver, "busTime", None)
+        try:
+            getattr(i2c_driver, transaction.operation)(transaction.address, *args)
+        except (IOError, OSError):
+            pass
+        if busTime is None:
+            elapsed = time.time() - start
+        else:
+            elapsed = i2c_driver.busTime - busTime # the emulated bus time
+
+        # share the time by the bytes of each category
+        counts = dict(classifier.bytes)
+        classifier.address = transaction.address
+        classifier._receive(transaction.address, data)
+        for category in classifier.bytes:
+            share = (classifier.bytes[category] - counts.get(category, 0)) / float(len(data))
+            if share:
+                report.bytes[category] = report.bytes.get(category, 0) + classifier.bytes[category] - counts.get(category, 0)
+                report.categoryTime[category] = report.categoryTime.get(category, 0) + share * transaction.duration
+                report.categoryReplay[category] = report.categoryReplay.get(category, 0) + share * elapsed
+
+        report.transactions += 1
+        report.failures += transaction.failed
+        report.writeTime += transaction.duration
+        report.replayTime += elapsed
+        report.duration = transaction.start + transaction.duration
+    return report
+
+def main(argv):
+    """!
+    Replay a trace and print where the time went.
+
+    @param list of string argv: The command line arguments
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Replay a SerLCD trace and report where the time went.")
+    parser.add_argument("trace", help="trace file recorded with RecordingDriver")
+    parser.add_argument("--display", action="store_true", help="replay to the display on the I2C bus, instead of the emulator")
+    parser.add_argument("--realtime", action="store_true", help="keep the recorded time between writes")
+    args = parser.parse_args(argv)
+
+    i2c_driver = None
+    if args.display:
+        import qwiic_i2c
+        i2c_driver = qwiic_i2c.getI2CDriver()
+    report = replay(args.trace, i2c_driver, args.realtime)
+    print(report.text())
+    if report.emulator is not None:
+        print("")
+        for line in report.emulator.text():
+            print("|" + line + "|")
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,61 @@
+# Shared helpers for the tests - a display on the emulator, with the writes recorded.
+import qwiic_serlcd
+import qwiic_serlcd_emulator
+
+class RecordingEmulator(qwiic_serlcd_emulator.Emulator):
+    """!
+    Emulator that also keeps the bytes of each I2C write, and can be made to fail.
+    """
+    def __init__(self, *args, **kwargs):
+        qwiic_serlcd_emulator.Emulator.__init__(self, *args, **kwargs)
+        self.writes = []
+        self.failures = 0 # number of writes to fail, with OSError
+
+    def _receive(self, address, data):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("injected failure")
+        self.writes.append(list(data))
+        qwiic_serlcd_emulator.Emulator._receive(self, address, data)
+
+def makeDisplay(address = 0x72):
+    """!
+    @return **tuple** A QwiicSerlcd with no pauses, and the RecordingEmulator it draws on
+    """
+    emulator = RecordingEmulator(address)
+    lcd = qwiic_serlcd.QwiicSerlcd(address, emulator)
+    lcd.setTiming(0.0, 0.0, 32, 0.0)
+    return lcd, emulator
+
+def shadowText(lcd):
+    """!
+    @return **list of bytes** The cached screen contents of a display
+    """
+    return [bytes(line) for line in lcd._state.shadow]
+
+def shadowScreen(lcd):
+    """!
+    @return **list of string** The cached screen contents of a display, in the form of Emulator.text()
+    """
+    rows = []
+    for line in lcd._state.shadow:
+        rows.append("".join(str(code & 0x7) if code < 16 else qwiic_serlcd_emulator._ROM_TEXT.get(code, "?")
+                            for code in line))
+    return rows
+
+class BusEmulator(RecordingEmulator):
+    """!
+    RecordingEmulator that tells its bus number, like the Linux driver of qwiic_i2c.
+    """
+    def __init__(self, bus, *args, **kwargs):
+        RecordingEmulator.__init__(self, *args, **kwargs)
+        self._iBus = bus
+
+def makeBusDisplay(bus, address = 0x72):
+    """!
+    @return **tuple** A QwiicSerlcd with no pauses, and the BusEmulator of its bus
+    """
+    emulator = BusEmulator(bus, address)
+    lcd = qwiic_serlcd.QwiicSerlcd(address, emulator)
+    lcd.setTiming(0.0, 0.0, 32, 0.0)
+    return lcd, emulator
@@ -0,0 +1,325 @@
+# Tests of the QwiicSerlcd driver, run against the emulator.
+import gc
+import os
+import subprocess
+import sys
+import threading
+import types
+import weakref
+import pytest
+import qwiic_serlcd
+import qwiic_serlcd_emulator
+from helpers import makeDisplay, makeBusDisplay, shadowScreen
+
+def test_create_char_sends_location_and_eight_rows():
+    lcd, emulator = makeDisplay()
+    assert lcd.createChar(2, [1, 2, 3, 4, 5, 6, 7, 8])
+    assert emulator.writes == [[0x7C, 27 + 2, 1, 2, 3, 4, 5, 6, 7, 8]]
+
+def test_print_with_automatic_glyph_leaves_no_stray_character():
+    lcd, emulator = makeDisplay()
+    assert lcd.print(u"é")
+    assert emulator.writes[0] == [0x7C, 27] + list(emulator.glyphs[0])
+    assert emulator.text()[0] == "0" + " " * 19
+
+def test_restore_snapshot_uploads_glyphs_without_stray_characters():
+    lcd, emulator = makeDisplay()
+    lcd.createChar(0, [31] * 8)
+    lcd.writeChar(0)
+    target = lcd.snapshot()
+    lcd.createChar(0, [1] * 8)
+    lcd.printAt(0, 0, "x")
+    assert lcd.restoreSnapshot(target)
+    assert emulator.glyphs[0] == [31] * 8
+    assert emulator.text() == shadowScreen(lcd)
+
+def test_failed_restore_snapshot_is_sent_again():
+    lcd, emulator = makeDisplay()
+    target = lcd.snapshot()
+    target.shadow[1] = b"Hello" + b" " * 15
+    emulator.failures = 1
+    with pytest.raises(OSError):
+        lcd.restoreSnapshot(target)
+    assert lcd.restoreSnapshot(target)
+    assert emulator.text()[1] == "Hello" + " " * 15
+    assert emulator.text() == shadowScreen(lcd)
+
+def test_failed_print_at_is_sent_again():
+    lcd, emulator = makeDisplay()
+    emulator.failures = 1
+    with pytest.raises(OSError):
+        lcd.printAt(3, 2, "abc")
+    assert lcd.printAt(3, 2, "abc")
+    assert emulator.text()[2] == "   abc" + " " * 14
+
+def test_failed_create_char_is_uploaded_again():
+    lcd, emulator = makeDisplay()
+    target = lcd.snapshot()
+    target.glyphs[4] = [7] * 8
+    emulator.failures = 1
+    with pytest.raises(OSError):
+        lcd.restoreSnapshot(target)
+    assert lcd.restoreSnapshot(target)
+    assert emulator.glyphs[4] == [7] * 8
+
+def test_failed_print_at_is_not_hidden_by_the_old_text():
+    lcd, emulator = makeDisplay()
+    lcd.printAt(0, 0, "old")
+    emulator.failures = 1
+    with pytest.raises(OSError):
+        lcd.printAt(0, 0, "new")
+    assert lcd.printAt(0, 0, "old")
+    assert emulator.text()[0].startswith("old")
+
+def test_resilient_recovery_keeps_the_text_being_written():
+    lcd, emulator = makeDisplay()
+    lcd.enableResilientMode(retries = 1, retry_delay = 0.0)
+    emulator.failures = 2
+    assert not lcd.printAt(0, 1, "first")
+    assert lcd.printAt(0, 2, "second")
+    assert emulator.text()[1].startswith("first")
+    assert emulator.text()[2].startswith("second")
+    assert emulator.text() == shadowScreen(lcd)
+
+def test_batch_does_not_skip_characters_past_the_end_of_a_row():
+    lcd, emulator = makeDisplay()
+    with lcd.batch():
+        lcd.clearScreen()
+        lcd.print("B" * 20 + "A")
+        lcd.setCursor(0, 2)
+        lcd.print("A")
+    sent = [byte for data in emulator.writes for byte in data]
+    assert sent.count(ord("A")) == 2
+
+def test_print_at_keeps_the_entry_mode():
+    lcd, emulator = makeDisplay()
+    lcd.rightToLeft()
+    lcd.autoscroll()
+    mode = lcd._state.displayMode
+    assert lcd.printAt(2, 1, "abc")
+    assert emulator.text()[1] == "  abc" + " " * 15
+    assert lcd._state.displayMode == mode
+    assert not emulator.leftToRight
+    assert emulator.autoscroll
+
+def test_settings_cache_is_kept_per_bus(tmp_path):
+    path = str(tmp_path / "settings.json")
+    displays = [makeBusDisplay(bus) for bus in (1, 3)]
+    for lcd, emulator in displays:
+        lcd.enableSettingsCache(path, interval = 0.0)
+    for lcd, emulator in displays:
+        assert lcd.setContrast(60)
+        assert emulator.contrast == 60
+
+def test_checkpoint_is_kept_per_bus(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    for bus in (1, 3):
+        lcd, emulator = makeBusDisplay(bus)
+        lcd.printAt(0, 0, "bus %d" % bus)
+        assert lcd.saveCheckpoint(path)
+    for bus in (1, 3):
+        lcd, emulator = makeBusDisplay(bus)
+        assert lcd.attach(path)
+        assert bytes(lcd._state.shadow[0]).startswith(b"bus %d" % bus)
+
+def test_diff_rewrites_a_gap_of_two_characters():
+    lcd, emulator = makeDisplay()
+    lcd.printAt(0, 0, "abcdefgh")
+    rows = [bytearray(line) for line in lcd._state.shadow]
+    rows[0][0:8] = b"XbcXefgX"
+    assert lcd._diffText(rows, []) == [(0, 0, 4), (0, 7, 8)]
+
+def test_bus_lock_is_released_while_pausing(tmp_path, monkeypatch):
+    lcd, emulator = makeDisplay()
+    assert lcd.enableBusLock(str(tmp_path / "bus.lock"))
+    lock = lcd._state.busLock
+    held = []
+    monkeypatch.setattr(qwiic_serlcd.time, "sleep", lambda seconds: held.append(lock._depth))
+    lcd.setTiming(0.01, 0.05, 32, 0.01)
+    assert lcd.setBacklight(10, 20, 30)
+    assert lcd.printAt(0, 0, "locked")
+    assert held and not any(held)
+    assert emulator.text()[0].startswith("locked")
+
+def test_failed_flock_releases_the_bus_lock(tmp_path):
+    lock = qwiic_serlcd.BusLock(str(tmp_path / "bus.lock"))
+    fcntl = lock._fcntl
+
+    class FailingFcntl(object):
+        LOCK_EX = fcntl.LOCK_EX
+        LOCK_UN = fcntl.LOCK_UN
+        def flock(self, fd, operation):
+            raise OSError("injected failure")
+    lock._fcntl = FailingFcntl()
+    with pytest.raises(OSError):
+        lock.__enter__()
+
+    lock._fcntl = fcntl
+    acquired = []
+    thread = threading.Thread(target=lambda: acquired.append(lock._lock.acquire(timeout = 1.0)))
+    thread.start()
+    thread.join()
+    assert acquired == [True]
+
+def _rightToLeftScreen(batched):
+    lcd, emulator = makeDisplay()
+    lcd.rightToLeft()
+    lcd.home()
+    with lcd.batch() if batched else lcd.atomic():
+        lcd.clearScreen()
+        lcd.setCursor(8, 2)
+        lcd.print("B Bb a aBB aB BAbBA Bbb ")
+        lcd.moveCursorLeft()
+        lcd.print("ab")
+    return emulator.text()
+
+def test_batch_in_right_to_left_mode_matches_unbatched():
+    assert _rightToLeftScreen(True) == _rightToLeftScreen(False)
+
+def test_setting_in_a_failed_batch_is_not_cached(tmp_path):
+    lcd, emulator = makeDisplay()
+    lcd.enableSettingsCache(str(tmp_path / "settings.json"), interval = 0.0)
+    emulator.failures = 1
+    with pytest.raises(OSError):
+        with lcd.batch():
+            lcd.setContrast(60)
+    assert emulator.contrast != 60
+    assert lcd.setContrast(60)
+    assert emulator.contrast == 60
+
+def test_setting_in_a_batch_is_cached_once_sent(tmp_path):
+    lcd, emulator = makeDisplay()
+    lcd.enableSettingsCache(str(tmp_path / "settings.json"), interval = 0.0)
+    with lcd.batch():
+        lcd.setContrast(60)
+    sent = len(emulator.writes)
+    assert lcd.setContrast(60)
+    assert len(emulator.writes) == sent
+
+def test_failed_glyph_upload_prints_replacement_and_is_tried_again(monkeypatch):
+    lcd, emulator = makeDisplay()
+    monkeypatch.setattr(lcd, "createChar", lambda location, charmap: False)
+    assert lcd.print(u"é")
+    assert emulator.text()[0] == "?" + " " * 19
+    assert lcd._state.glyphChars == [None] * 8
+    monkeypatch.undo()
+    assert lcd.print(u"é")
+    assert emulator.text()[0] == "?0" + " " * 18
+
+def test_print_sends_control_characters_unchanged():
+    lcd, emulator = makeDisplay()
+    assert lcd.print("a\r\nb")
+    assert sum(emulator.writes, []) == [0x61, 0x0D, 0x0A, 0x62]
+
+def test_verification_failure_never_speeds_up_writes(monkeypatch):
+    lcd, emulator = makeDisplay()
+    lcd.setTiming(0.1, None, 4, 0.2)
+    lcd.enableVerification()
+    answers = [False, True]
+    monkeypatch.setattr(lcd, "_probe", lambda: answers.pop(0))
+    assert not lcd._verify()
+    timing = lcd.getTiming()
+    assert (timing["write_delay"], timing["block_size"], timing["block_delay"]) == (0.1, 4, 0.2)
+
+def test_resilient_write_is_retried():
+    lcd, emulator = makeDisplay()
+    lcd.enableResilientMode(retries = 2, retry_delay = 0.0)
+    emulator.failures = 1
+    assert lcd.print("ab")
+    assert emulator.text()[0] == "ab" + " " * 18
+    assert emulator.text() == shadowScreen(lcd)
+
+def test_resilient_mode_restores_the_display_after_a_brown_out():
+    lcd, emulator = makeDisplay()
+    lcd.enableResilientMode(retries = 2, retry_delay = 0.0)
+    lcd.createChar(3, [21] * 8)
+    lcd.setFastBacklight(10, 20, 30)
+    lcd.setCursor(2, 1)
+    lcd.print("Hello")
+    lcd.writeChar(3)
+    emulator.reset()     # the display loses power and starts blank
+    emulator.failures = 1 # and doesn't answer while it starts
+    assert lcd.print("!")
+    assert emulator.text()[1] == "  Hello3!" + " " * 11
+    assert emulator.text() == shadowScreen(lcd)
+    assert emulator.glyphs[3] == [21] * 8
+    assert emulator.backlight == (10, 20, 30)
+
+def test_failed_print_does_not_change_the_cached_screen():
+    lcd, emulator = makeDisplay()
+    lcd.enableResilientMode(retries = 1, retry_delay = 0.0)
+    assert lcd.print("ab")
+    emulator.failures = 2
+    assert not lcd.print("xyz")
+    assert shadowScreen(lcd)[0] == "ab" + " " * 18
+    assert (lcd._state.col, lcd._state.row) == (2, 0)
+    assert lcd.print("c") # the display answers again and is restored
+    assert emulator.text()[0] == "abc" + " " * 17
+    assert emulator.text() == shadowScreen(lcd)
+
+def test_thread_safe_mode_keeps_concurrent_writes_apart(monkeypatch):
+    lcd, emulator = makeDisplay()
+    lcd.setTiming(0.0005, 0.0, 32, 0.0005)
+    assert lcd.enableThreadSafeMode()
+    sleeping = []
+    sleep = qwiic_serlcd.time.sleep
+    def recordingSleep(seconds):
+        sleeping.append(threading.current_thread().name)
+        sleep(seconds)
+    monkeypatch.setattr(qwiic_serlcd.time, "sleep", recordingSleep)
+    writing = set()
+    receive = emulator._receive
+    def recordingReceive(address, data):
+        writing.add(threading.current_thread().name)
+        receive(address, data)
+    emulator._receive = recordingReceive
+
+    def worker(row):
+        other = qwiic_serlcd.QwiicSerlcd(0x72, emulator) # a second handle shares the state
+        other.setTiming(**lcd.getTiming())
+        for i in range(15):
+            other.printAt(0, row, "row %d pass %2d" % (row, i))
+            with other.atomic():
+                other.setCursor(16, row)
+                other.print("%4d" % i)
+    threads = [threading.Thread(target=worker, args=(row,)) for row in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert emulator.text() == ["row %d pass 14     14" % row for row in range(4)]
+    assert emulator.text() == shadowScreen(lcd)
+    assert writing == set(["qwiic_serlcd bus writer"])
+    assert sleeping and "qwiic_serlcd bus writer" not in sleeping
+
+def test_display_state_is_shared_and_dropped_with_the_driver():
+    lcd, emulator = makeDisplay()
+    other = qwiic_serlcd.QwiicSerlcd(0x72, emulator)
+    assert other._state is lcd._state
+    assert qwiic_serlcd.QwiicSerlcd(0x73, emulator)._state is not lcd._state
+    state = weakref.ref(lcd._state)
+    del lcd, other, emulator
+    gc.collect()
+    assert state() is None
+
+def test_import_and_construction_load_nothing_more():
+    code = ("import sys, qwiic_serlcd; qwiic_serlcd.QwiicSerlcd(); "
+            "print(sorted(set(['qwiic_i2c', 'threading', 'queue', 'struct', 'functools']) & set(sys.modules)))")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.check_output([sys.executable, "-c", code], cwd = root)
+    assert output.strip() == b"[]"
+
+def test_driver_is_loaded_by_the_first_write(monkeypatch):
+    emulator = qwiic_serlcd_emulator.Emulator()
+    loads = []
+    module = types.ModuleType("qwiic_i2c")
+    module.getI2CDriver = lambda: loads.append(1) or emulator
+    monkeypatch.setitem(sys.modules, "qwiic_i2c", module)
+    lcd = qwiic_serlcd.QwiicSerlcd(0x72)
+    lcd.setTiming(0.0, 0.0, 32, 0.0)
+    assert loads == []
+    assert lcd.print("hi")
+    assert lcd.print("!")
+    assert loads == [1]
+    assert emulator.text()[0].startswith("hi!")
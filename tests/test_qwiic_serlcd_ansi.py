@@ -0,0 +1,27 @@
+# Tests of AnsiTerminal, run against the emulator.
+import qwiic_serlcd_ansi
+from helpers import makeDisplay, shadowScreen
+
+def test_text_cursor_moves_and_colors():
+    lcd, emulator = makeDisplay()
+    terminal = qwiic_serlcd_ansi.AnsiTerminal(lcd)
+    terminal.write("hello\nworld\x1b[2;3HX\x1b[31m\x1b]0;title\x07")
+    assert terminal.flush()
+    assert emulator.text()[:2] == ["hello" + " " * 15, "woXld" + " " * 15]
+    assert emulator.backlight == (255, 0, 0)
+    terminal.write("\x1b[2J\x1b[H\x1b[38;2;1;2;3mok")
+    assert terminal.flush()
+    assert emulator.text() == ["ok" + " " * 18] + [" " * 20] * 3
+    assert emulator.backlight == (1, 2, 3)
+    assert emulator.text() == shadowScreen(lcd)
+
+def test_output_scrolls_up_and_utf8_can_be_split():
+    lcd, emulator = makeDisplay()
+    terminal = qwiic_serlcd_ansi.AnsiTerminal(lcd, color = None)
+    terminal.write("".join("line %d\n" % i for i in range(5)))
+    data = u"25°C".encode("utf-8")
+    terminal.write(data[:3]) # the degree sign is cut in two
+    terminal.write(data[3:])
+    assert terminal.flush()
+    assert emulator.text() == ["line 2" + " " * 14, "line 3" + " " * 14,
+                               "line 4" + " " * 14, u"25°C" + " " * 16]
@@ -0,0 +1,21 @@
+# Tests of BigFont, run against the emulator.
+import qwiic_serlcd_bigfont
+from helpers import makeDisplay, shadowScreen
+
+def test_print_shows_exactly_the_cached_screen():
+    lcd, emulator = makeDisplay()
+    font = qwiic_serlcd_bigfont.BigFont(lcd)
+    assert font.print(0, 0, "12:45")
+    assert lcd.printAt(0, 3, "status")
+    assert emulator.text() == shadowScreen(lcd)
+    assert emulator.text()[3] == "status" + " " * 14
+    assert emulator.glyphs == qwiic_serlcd_bigfont._GLYPHS
+
+def test_redraw_sends_only_changed_cells():
+    lcd, emulator = makeDisplay()
+    font = qwiic_serlcd_bigfont.BigFont(lcd)
+    font.print(0, 0, "12:45")
+    del emulator.writes[:]
+    assert font.print(0, 0, "12:46")
+    assert sum(len(data) for data in emulator.writes) <= 8
+    assert emulator.text() == shadowScreen(lcd)
@@ -0,0 +1,22 @@
+import qwiic_serlcd
+import qwiic_serlcd_calibrate
+from helpers import BusEmulator
+
+def test_timing_profile_is_kept_per_bus(tmp_path):
+    path = str(tmp_path / "timing.json")
+    drivers = [BusEmulator(bus) for bus in (1, 3)]
+    for driver, size in zip(drivers, (16, 24)):
+        timing = {"write_delay": 0.001, "setting_delay": 0.01, "block_size": size, "block_delay": 0.001}
+        assert qwiic_serlcd_calibrate.saveTimingProfile(0x72, timing, path, driver)
+
+    for driver, size in zip(drivers, (16, 24)):
+        lcd = qwiic_serlcd.QwiicSerlcd(0x72, driver)
+        assert lcd.loadTimingProfile(path)
+        assert lcd._blockSize == size
+
+def test_pauses_of_zero_still_get_a_margin(monkeypatch):
+    monkeypatch.setattr(qwiic_serlcd_calibrate, "_SETTLE", 0.0)
+    lcd = qwiic_serlcd.QwiicSerlcd(0x72, BusEmulator(1))
+    timing = qwiic_serlcd_calibrate.Calibration(lcd, lambda rows: True).run()
+    assert timing["write_delay"] == timing["block_delay"] == 0.0015
+    assert timing["setting_delay"] == lcd.getTiming()["setting_delay"]
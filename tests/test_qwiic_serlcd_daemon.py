@@ -0,0 +1,61 @@
+# Tests of DisplayDaemon, run against the emulator.
+import socket
+import time
+import pytest
+import qwiic_serlcd_daemon
+from helpers import makeDisplay, makeBusDisplay
+
+def _waitFor(condition, timeout = 2.0):
+    end = time.time() + timeout
+    while time.time() < end:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+def test_failed_draw_is_retried(tmp_path):
+    lcd, emulator = makeDisplay()
+    lcd.enableResilientMode(retries = 1, retry_delay = 0.0)
+    daemon = qwiic_serlcd_daemon.DisplayDaemon([lcd], str(tmp_path / "serlcd.sock"), max_rate = 100.0)
+    daemon.start()
+    try:
+        emulator.failures = 2 # the write and its retry fail, restoreSnapshot() returns False
+        assert daemon.submit({"frame": ["retried"]})
+        assert _waitFor(lambda: emulator.text()[0].startswith("retried"))
+        assert emulator.failures == 0
+    finally:
+        daemon.stop()
+
+def test_displays_at_the_same_address_on_two_buses(tmp_path):
+    first, firstEmulator = makeBusDisplay(1)
+    second, secondEmulator = makeBusDisplay(3)
+    daemon = qwiic_serlcd_daemon.DisplayDaemon([first, second], str(tmp_path / "serlcd.sock"), max_rate = 100.0)
+    daemon.start()
+    try:
+        assert daemon.submit({"frame": ["first"]})
+        assert daemon.submit({"display": "3:0x72", "frame": ["second"]})
+        assert _waitFor(lambda: secondEmulator.text()[0].startswith("second"))
+        assert _waitFor(lambda: firstEmulator.text()[0].startswith("first"))
+        assert not daemon.submit({"display": "2:0x72", "frame": ["nobody"]})
+    finally:
+        daemon.stop()
+
+def test_start_replaces_only_a_stale_socket(tmp_path):
+    path = str(tmp_path / "serlcd.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    stale.bind(path)
+    stale.close()
+    lcd, emulator = makeDisplay()
+    daemon = qwiic_serlcd_daemon.DisplayDaemon([lcd], path)
+    daemon.start()
+    try:
+        other = qwiic_serlcd_daemon.DisplayDaemon([makeDisplay()[0]], path)
+        with pytest.raises(OSError):
+            other.start()
+        other.stop() # never started
+        client = qwiic_serlcd_daemon.DisplayClient(path)
+        assert client.region(0, 0, "still served")
+        client.close()
+        assert _waitFor(lambda: emulator.text()[0].startswith("still served"))
+    finally:
+        daemon.stop()
@@ -0,0 +1,57 @@
+import json
+import types
+import qwiic_serlcd_discovery
+import qwiic_serlcd_emulator
+
+class BusDriver(qwiic_serlcd_emulator.Emulator):
+    """!
+    A platform driver class: each bus has one display, at 0x70 plus the bus number.
+    """
+    @staticmethod
+    def isPlatform():
+        return True
+
+    def __init__(self, iBus = 1):
+        qwiic_serlcd_emulator.Emulator.__init__(self, 0x70 + iBus)
+
+def fakeI2C(monkeypatch):
+    singleton = BusDriver()
+    module = types.ModuleType("qwiic_i2c")
+    module._drivers = [BusDriver]
+    module.getI2CDriver = lambda *args, **kwargs: singleton
+    monkeypatch.setitem(__import__("sys").modules, "qwiic_i2c", module)
+    monkeypatch.setattr(qwiic_serlcd_discovery, "_drivers", {})
+
+def test_each_bus_has_its_own_driver(monkeypatch, tmp_path):
+    fakeI2C(monkeypatch)
+    found = qwiic_serlcd_discovery.discover([2, 3], [range(0x70, 0x78)], strict = False, path = str(tmp_path / "cache.json"))
+    assert found == [(2, 0x72), (3, 0x73)]
+
+def test_failed_scan_is_not_cached(monkeypatch, tmp_path):
+    path = str(tmp_path / "cache.json")
+    monkeypatch.setitem(__import__("sys").modules, "qwiic_i2c", None) # import fails
+    monkeypatch.setattr(qwiic_serlcd_discovery, "_drivers", {})
+    assert qwiic_serlcd_discovery.discover([2], [range(0x70, 0x78)], strict = False, path = path) == []
+
+    fakeI2C(monkeypatch)
+    assert qwiic_serlcd_discovery.discover([2], [range(0x70, 0x78)], strict = False, path = path) == [(2, 0x72)]
+    with open(path) as f:
+        assert json.load(f)["2"]["found"] == [0x72]
+
+class BusNumberlessDriver(BusDriver):
+    """!
+    A platform driver class that can't be given a bus number.
+    """
+    def __init__(self):
+        BusDriver.__init__(self)
+
+def test_drivers_without_bus_or_read_find_nothing(monkeypatch):
+    fakeI2C(monkeypatch)
+    driver = qwiic_serlcd_discovery._getDriver(None)
+    assert qwiic_serlcd_discovery._identify(driver, 0x71, strict = False)
+    assert not qwiic_serlcd_discovery._identify(driver, 0x71, strict = True) # the emulator can't read
+
+    __import__("sys").modules["qwiic_i2c"]._drivers = [BusNumberlessDriver]
+    results = {}
+    qwiic_serlcd_discovery._scan(2, [0x71, 0x72], False, results)
+    assert results == {}
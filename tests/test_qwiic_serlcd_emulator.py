@@ -0,0 +1,18 @@
+from helpers import makeDisplay, shadowScreen
+
+def test_printing_past_the_end_of_a_row_goes_on_to_the_next_row():
+    lcd, emulator = makeDisplay()
+    lcd.clearScreen()
+    lcd.print("A" * 25)
+    assert emulator.text()[0] == "A" * 20
+    assert emulator.text()[1] == "A" * 5 + " " * 15
+    assert emulator.text()[2] == " " * 20
+    assert emulator.text() == shadowScreen(lcd)
+
+def test_printing_past_the_last_row_goes_back_to_the_first():
+    lcd, emulator = makeDisplay()
+    lcd.setCursor(15, 3)
+    lcd.print("0123456789")
+    assert emulator.text()[3] == " " * 15 + "01234"
+    assert emulator.text()[0] == "56789" + " " * 15
+    assert emulator.text() == shadowScreen(lcd)
@@ -0,0 +1,28 @@
+import pytest
+from helpers import makeDisplay
+
+qwiic_serlcd_fleet = pytest.importorskip("qwiic_serlcd_fleet")
+
+def test_failed_display_is_flushed_again():
+    displays = [makeDisplay(address) for address in (0x72, 0x73)]
+    fleet = qwiic_serlcd_fleet.FleetFramebuffer([lcd for lcd, emulator in displays])
+    fleet.write(0, 0, 0, "zero")
+    fleet.write(1, 0, 0, "one")
+    displays[1][1].failures = 1
+    assert not fleet.flush()
+    assert fleet.failed == [1]
+    assert displays[0][1].text()[0].startswith("zero")
+    assert fleet.plan() == {1: [(0, 0, 3)]}
+    assert fleet.flush()
+    assert fleet.failed == []
+    assert displays[1][1].text()[0].startswith("one")
+
+def test_find_runs_joins_like_the_diff():
+    lcd, emulator = makeDisplay()
+    lcd.printAt(0, 0, "abcdefgh")
+    rows = [bytearray(line) for line in lcd._state.shadow]
+    rows[0][0:8] = b"XbcXefgX"
+    changed = qwiic_serlcd_fleet.numpy.array([[[old != new for old, new in zip(lcd._state.shadow[r], rows[r])]
+                                                for r in range(4)]])
+    display, row, start, end = qwiic_serlcd_fleet.findRuns(changed)
+    assert list(zip(row.tolist(), start.tolist(), end.tolist())) == lcd._diffText(rows, [])
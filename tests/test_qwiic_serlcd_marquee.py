@@ -0,0 +1,27 @@
+# Tests of Marquee, run against the emulator.
+import qwiic_serlcd_marquee
+from helpers import makeDisplay, shadowScreen
+
+def test_short_text_is_scrolled_by_the_display():
+    lcd, emulator = makeDisplay()
+    marquee = qwiic_serlcd_marquee.Marquee(lcd, "Hello", row = 0)
+    assert marquee.hardware
+    assert marquee.start()
+    assert emulator.text()[0] == "Hello" + " " * 15
+    del emulator.writes[:]
+    assert marquee.step()
+    assert marquee.step()
+    assert emulator.writes == [[0xFE, 0x18], [0xFE, 0x18]] # one shift command per step
+    assert emulator.text()[0] == "llo" + " " * 17
+    assert emulator.text()[2] == " " * 18 + "He" # rows 0 and 2 are one display line
+
+def test_long_text_is_scrolled_by_rewriting_the_row():
+    lcd, emulator = makeDisplay()
+    text = "The quick brown fox jumps over the lazy dog"
+    marquee = qwiic_serlcd_marquee.Marquee(lcd, text, row = 1, gap = 2)
+    assert not marquee.hardware
+    assert marquee.start()
+    for i in range(len(text) - 5):
+        assert marquee.step()
+    assert emulator.text()[1] == (text + "  " + text)[len(text) - 5:][:20]
+    assert emulator.text() == shadowScreen(lcd)
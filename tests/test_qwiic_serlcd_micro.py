@@ -0,0 +1,22 @@
+import qwiic_serlcd_micro
+from helpers import RecordingEmulator
+
+class BlockRecorder(RecordingEmulator):
+    """!
+    RecordingEmulator that also keeps the payload objects given to writeBlock().
+    """
+    def __init__(self, *args, **kwargs):
+        RecordingEmulator.__init__(self, *args, **kwargs)
+        self.payloads = []
+
+    def writeBlock(self, address, commandCode, value):
+        self.payloads.append(value)
+        RecordingEmulator.writeBlock(self, address, commandCode, value)
+
+def test_block_writes_send_the_preallocated_buffer():
+    emulator = BlockRecorder()
+    lcd = qwiic_serlcd_micro.QwiicSerlcd(0x72, emulator)
+    assert lcd.createChar(3, [1, 2, 3, 4, 5, 6, 7, 8])
+    assert emulator.writes[-1] == [0x7C, 27 + 3, 1, 2, 3, 4, 5, 6, 7, 8]
+    assert emulator.glyphs[3] == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert emulator.payloads[-1].obj is lcd._b10
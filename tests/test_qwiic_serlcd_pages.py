@@ -0,0 +1,32 @@
+# Tests of PageManager, run against the emulator.
+import qwiic_serlcd_pages
+from helpers import makeDisplay, shadowScreen
+
+def test_switching_pages_with_custom_characters():
+    lcd, emulator = makeDisplay()
+    pages = qwiic_serlcd_pages.PageManager(lcd)
+    first = pages.addPage()
+    first.createChar(1, [31] * 8)
+    first.print("one")
+    first.writeChar(1)
+    second = pages.addPage()
+    second.createChar(1, [1] * 8)
+    second.print("two")
+    for page in (first, second, first):
+        pages.show(page)
+        assert emulator.text() == shadowScreen(lcd)
+    assert emulator.text()[0] == "one1" + " " * 16
+
+def test_page_glyphs_follow_the_translation_table():
+    lcd, emulator = makeDisplay()
+    pages = qwiic_serlcd_pages.PageManager(lcd)
+    page = pages.addPage()
+    page.print(u"é°x")
+    assert bytes(page.rows[0][:3]) == bytes([0, 0xDF, ord("x")])
+    page.createChar(0, [31] * 8)
+    page.setCursor(0, 1)
+    page.print(u"é")
+    assert page.rows[1][0] == 1
+    assert page.glyphChars[:2] == [None, u"é"]
+    pages.show(page)
+    assert emulator.text() == shadowScreen(lcd)
@@ -0,0 +1,26 @@
+import qwiic_serlcd_scheduler
+from helpers import makeDisplay
+
+def test_failed_draw_is_drawn_again():
+    lcd, emulator = makeDisplay()
+    lcd.enableResilientMode(retries = 1, retry_delay = 0.0)
+    scheduler = qwiic_serlcd_scheduler.RedrawScheduler(lcd)
+    region = scheduler.addRegion(0, 1, 5)
+    region.update("12345")
+    emulator.failures = 2
+    assert scheduler.service() == 0
+    assert region.isDirty()
+    assert scheduler.service() == 1
+    assert not region.isDirty()
+    assert emulator.text()[1].startswith("12345")
+
+def test_change_back_to_the_shown_text_is_not_dirty():
+    lcd, emulator = makeDisplay()
+    scheduler = qwiic_serlcd_scheduler.RedrawScheduler(lcd)
+    region = scheduler.addRegion(0, 0, 5)
+    region.update("abc")
+    scheduler.service()
+    region.update("xyz")
+    region.update("abc")
+    assert not region.isDirty()
+    assert region._dirtySince is None
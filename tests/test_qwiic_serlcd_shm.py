@@ -0,0 +1,20 @@
+import qwiic_serlcd_shm
+from helpers import makeDisplay
+
+def test_failed_generation_is_drawn_again(tmp_path):
+    lcd, emulator = makeDisplay()
+    lcd.enableResilientMode(retries = 1, retry_delay = 0.0)
+    framebuffer = qwiic_serlcd_shm.SharedFramebuffer(path = str(tmp_path / "serlcd"), create = True)
+    try:
+        flusher = qwiic_serlcd_shm.SharedFrameFlusher(lcd, framebuffer)
+        framebuffer.write(0, 1, "shared")
+        emulator.failures = 2
+        assert not flusher.poll()
+        assert flusher.poll()
+        assert emulator.text()[1].startswith("shared")
+        assert not flusher.poll()
+    finally:
+        framebuffer.close()
+
+def test_text_is_translated_to_the_rom():
+    assert qwiic_serlcd_shm._encode(u"25°C☃") == b"25\xdfC?"
@@ -0,0 +1,52 @@
+import qwiic_serlcd
+import qwiic_serlcd_template
+from helpers import makeDisplay, shadowScreen
+
+def test_render_keeps_the_entry_mode():
+    lcd, emulator = makeDisplay()
+    lcd.rightToLeft()
+    mode = lcd._state.displayMode
+    screen = qwiic_serlcd_template.ScreenTemplate(lcd, "T {t:4d} RH {rh:3d}")
+    assert screen.render(t = 21, rh = 40)
+    assert emulator.text()[0] == "T   21 RH  40" + " " * 7
+    assert lcd._state.displayMode == mode
+    assert not emulator.leftToRight
+    assert emulator.text() == shadowScreen(lcd)
+
+def test_failed_render_is_sent_again():
+    lcd, emulator = makeDisplay()
+    lcd.enableResilientMode(retries = 1, retry_delay = 0.0)
+    screen = qwiic_serlcd_template.ScreenTemplate(lcd, "T {t:4d}")
+    assert screen.render(t = 1)
+    emulator.failures = 2
+    assert not screen.render(t = 2)
+    assert screen.render(t = 2)
+    assert emulator.text()[0].startswith("T    2")
+    assert emulator.text() == shadowScreen(lcd)
+
+def test_failed_render_without_recovery_is_sent_again():
+    lcd, emulator = makeDisplay()
+    screen = qwiic_serlcd_template.ScreenTemplate(lcd, "T {t:4d}")
+    assert screen.render(t = 1)
+    emulator.failures = 1
+    try:
+        screen.render(t = 2)
+    except OSError:
+        pass
+    assert screen.render(t = 2)
+    assert emulator.text()[0].startswith("T    2")
+
+def test_render_keeps_the_custom_characters_of_each_slot():
+    lcd, emulator = makeDisplay()
+    lcd.print(u"àâçèêîôù") # every location holds an automatic glyph
+    lcd.clearScreen()
+    del emulator.writes[:]
+    screen = qwiic_serlcd_template.ScreenTemplate(lcd, u"é{a:1}{b:1}")
+    assert emulator.writes == [] # nothing is sent until the template is rendered
+    assert screen.render(a = u"û", b = u"ß")
+    shown = emulator.text()[0]
+    assert shown == shadowScreen(lcd)[0]
+    font = qwiic_serlcd._GLYPH_FONT
+    assert emulator.glyphs[int(shown[0])] == font[u"é"]
+    assert emulator.glyphs[int(shown[1])] == font[u"û"]
+    assert emulator.glyphs[int(shown[2])] == font[u"ß"]